@@ -0,0 +1,190 @@
+"""
+Deterministic stand-in for linkedin_api.Linkedin used by the benchmarks.
+
+Pass make_factory(...) as the client_factory of LinkedInMCP to exercise the
+whole server without network access or real credentials.
+"""
+
+import functools
+import random
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List
+
+WORDS = (
+    "python data platform cloud engineer senior staff lead backend frontend "
+    "machine learning analytics product growth security infrastructure remote "
+    "distributed systems api design research startup enterprise mobile"
+).split()
+COMPANIES = ["Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark", "Wayne", "Wonka"]
+LOCATIONS = ["San Francisco", "New York", "London", "Berlin", "Bangalore", "Remote"]
+
+# 2022-01-01 in milliseconds; base for generated activity timestamps
+EPOCH_MS = 1640995200000
+
+class FakeUpstreamError(Exception):
+    """Simulated failure of an upstream LinkedIn request"""
+
+class FakeLinkedin:
+    """Drop-in replacement for linkedin_api.Linkedin with synthetic, repeatable data"""
+
+    def __init__(self, username: str, password: str, *, latency: float = 0.05, jitter: float = 0.02,
+                 error_rate: float = 0.0, payload_kb: int = 20, connections_per_profile: int = 500,
+                 seed: int = 0, **kwargs):
+        self.username = username
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.payload_kb = payload_kb
+        self.connections_per_profile = connections_per_profile
+        self.seed = seed
+        self.calls = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        cookies = [
+            SimpleNamespace(name="li_at", value="fake", domain=".linkedin.com", path="/", expires=None, secure=True),
+            SimpleNamespace(name="JSESSIONID", value='"ajax:0"', domain=".linkedin.com", path="/", expires=None, secure=True)
+        ]
+        adapters = {}
+        self.client = SimpleNamespace(session=SimpleNamespace(
+            cookies=cookies,
+            hooks={"response": []},
+            headers={},
+            adapters=adapters,
+            mount=adapters.__setitem__
+        ))
+
+    def _simulate(self) -> None:
+        with self._lock:
+            self.calls += 1
+            delay = self.latency + self._rng.uniform(0, self.jitter)
+            failed = self._rng.random() < self.error_rate
+        time.sleep(delay)
+        if failed:
+            raise FakeUpstreamError("Simulated upstream error")
+
+    def _rng_for(self, *key: Any) -> random.Random:
+        return random.Random(":".join(str(part) for part in (self.seed,) + key))
+
+    def _text(self, rng: random.Random, words: int) -> str:
+        return " ".join(rng.choice(WORDS) for _ in range(words))
+
+    def _padding(self, rng: random.Random, share: float) -> str:
+        # Roughly payload_kb * share kilobytes of text
+        return self._text(rng, int(self.payload_kb * 1024 * share / 8))
+
+    def _person(self, rng: random.Random, urn_id: str) -> Dict[str, Any]:
+        return {
+            "urn_id": urn_id,
+            "distance": rng.choice(["DISTANCE_1", "DISTANCE_2", "DISTANCE_3"]),
+            "jobtitle": f"{self._text(rng, 2).title()} at {rng.choice(COMPANIES)}",
+            "location": rng.choice(LOCATIONS),
+            "name": f"{rng.choice(WORDS).title()} {rng.choice(WORDS).title()}"
+        }
+
+    def get_profile(self, public_id: str = None, urn_id: str = None) -> Dict[str, Any]:
+        self._simulate()
+        profile_id = public_id or urn_id or "me"
+        rng = self._rng_for("profile", profile_id)
+        return {
+            "firstName": rng.choice(WORDS).title(),
+            "lastName": rng.choice(WORDS).title(),
+            "headline": self._text(rng, 6),
+            "summary": self._padding(rng, 0.3),
+            "locationName": rng.choice(LOCATIONS),
+            "industryName": rng.choice(WORDS).title(),
+            "public_id": profile_id,
+            "profile_id": profile_id,
+            "entityUrn": f"urn:li:fs_profile:{profile_id}",
+            "experience": [
+                {
+                    "title": self._text(rng, 3).title(),
+                    "companyName": rng.choice(COMPANIES),
+                    "locationName": rng.choice(LOCATIONS),
+                    "timePeriod": {"startDate": {"year": 2010 + i, "month": rng.randint(1, 12)}},
+                    "description": self._padding(rng, 0.1)
+                }
+                for i in range(5)
+            ],
+            "education": [
+                {"schoolName": f"{rng.choice(WORDS).title()} University", "degreeName": "BSc"}
+            ],
+            "skills": [{"name": word.title()} for word in rng.sample(WORDS, 8)]
+        }
+
+    def get_profile_posts(self, public_id: str = None, urn_id: str = None, post_count: int = 10) -> List[Dict[str, Any]]:
+        self._simulate()
+        profile_id = public_id or urn_id or "me"
+        rng = self._rng_for("posts", profile_id)
+        # Newest first; a new post appears every hour of simulated time
+        newest = int((time.time() * 1000 - EPOCH_MS) // 3600000)
+        posts = []
+        for age in range(post_count):
+            timestamp = EPOCH_MS + (newest - age) * 3600000
+            activity_id = (timestamp << 22) + rng.randint(0, 4095)
+            posts.append({
+                "updateMetadata": {"urn": f"urn:li:activity:{activity_id}"},
+                "actor": {"name": {"text": profile_id}},
+                "commentary": {"text": {"text": self._padding(rng, 0.05)}},
+                "socialDetail": {"totalSocialActivityCounts": {
+                    "numLikes": rng.randint(0, 500),
+                    "numComments": rng.randint(0, 50)
+                }}
+            })
+        return posts
+
+    def search_jobs(self, keywords: str = None, location_name: str = None, limit: int = -1, offset: int = 0,
+                    **kwargs) -> List[Dict[str, Any]]:
+        self._simulate()
+        rng = self._rng_for("jobs", keywords, location_name)
+        count = 25 if limit is None or limit < 0 else limit
+        jobs = []
+        for i in range(offset, offset + count):
+            job_id = 3000000000 + rng.randint(0, 10 ** 6) * 100 + i
+            jobs.append({
+                "entityUrn": f"urn:li:fsd_jobPosting:{job_id}",
+                "title": f"{keywords or self._text(rng, 2)} {rng.choice(WORDS)}".title(),
+                "companyName": rng.choice(COMPANIES),
+                "formattedLocation": location_name or rng.choice(LOCATIONS),
+                "listedAt": EPOCH_MS + rng.randint(0, 10 ** 10)
+            })
+        return jobs
+
+    def get_job(self, job_id: str) -> Dict[str, Any]:
+        self._simulate()
+        rng = self._rng_for("job", job_id)
+        return {
+            "jobPostingId": int(job_id) if str(job_id).isdigit() else job_id,
+            "title": self._text(rng, 3).title(),
+            "description": {"text": self._padding(rng, 0.8)},
+            "formattedLocation": rng.choice(LOCATIONS),
+            "companyDetails": {
+                "com.linkedin.voyager.deco.jobs.web.shared.WebCompactJobPostingCompany": {
+                    "companyResolutionResult": {"name": rng.choice(COMPANIES)}
+                }
+            },
+            "listedAt": EPOCH_MS + rng.randint(0, 10 ** 10),
+            "workRemoteAllowed": rng.random() < 0.4,
+            "applies": rng.randint(0, 1000)
+        }
+
+    def search_people(self, keywords: str = None, limit: int = None, offset: int = 0, **kwargs) -> List[Dict[str, Any]]:
+        self._simulate()
+        rng = self._rng_for("people", keywords)
+        count = 10 if limit is None or limit < 0 else limit
+        return [self._person(rng, f"ACoAA{rng.randint(0, 10 ** 8):08d}") for _ in range(offset, offset + count)]
+
+    def get_profile_connections(self, urn_id: str, limit: int = None, offset: int = 0, **kwargs) -> List[Dict[str, Any]]:
+        self._simulate()
+        end = self.connections_per_profile if limit is None or limit < 0 else min(offset + limit, self.connections_per_profile)
+        connections = []
+        for index in range(offset, end):
+            rng = self._rng_for("connection", urn_id, index)
+            # Draw from a shared population so graphs have mutual connections
+            connections.append(self._person(rng, f"ACoAA{rng.randint(0, self.connections_per_profile * 20):08d}"))
+        return connections
+
+def make_factory(**options: Any) -> Callable[..., FakeLinkedin]:
+    """Build a LinkedInMCP client_factory producing FakeLinkedin clients"""
+    return functools.partial(FakeLinkedin, **options)
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Measure startup import time with `python -X importtime` and enforce a budget.
+
+Usage:
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --target server --budget-ms 2000 --json
+
+The test target runs `main.py test`, which must not import linkedin_api,
+requests or fastmcp at all. The server target builds the FastMCP server
+with every tool registered, without running it. Exits non-zero when the
+total import time exceeds the budget or a forbidden module was imported.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Any, Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TARGETS = {
+    "test": ["main.py", "test"],
+    "server": ["-c", "from services.app import app; app.server"]
+}
+
+# Modules the test target must never load
+FORBIDDEN = ("linkedin_api", "requests", "fastmcp", "mcp", "pydantic")
+
+def parse_importtime(stderr: str) -> List[Dict[str, Any]]:
+    """Parse `-X importtime` lines into self and cumulative microseconds per module"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        rows.append({
+            "module": name.strip(),
+            "depth": (len(name) - len(name.lstrip()) - 1) // 2,
+            "self_us": int(self_us),
+            "cumulative_us": int(cumulative_us)
+        })
+    return rows
+
+def measure(target: str) -> Dict[str, Any]:
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime"] + TARGETS[target],
+        cwd=ROOT, capture_output=True, text=True
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"{target} target failed:\n{completed.stderr[-2000:]}")
+    rows = parse_importtime(completed.stderr)
+    top_level = sorted((row for row in rows if row["depth"] == 0), key=lambda row: row["cumulative_us"], reverse=True)
+    loaded = {row["module"].split(".")[0] for row in rows}
+    return {
+        "target": target,
+        "modules": len(rows),
+        "total_ms": round(sum(row["self_us"] for row in rows) / 1000, 1),
+        "slowest": [
+            {"module": row["module"], "cumulative_ms": round(row["cumulative_us"] / 1000, 1)}
+            for row in top_level[:10]
+        ],
+        "forbidden": sorted(name for name in FORBIDDEN if name in loaded) if target == "test" else []
+    }
+
+def print_report(report: Dict[str, Any], budget_ms: float) -> None:
+    print("LinkedIn MCP Server - Import Time")
+    print(f"Target: {report['target']}  modules: {report['modules']}  total: {report['total_ms']} ms  budget: {budget_ms} ms")
+    print(f"{'top-level import':<44}{'cumulative ms':>14}")
+    for row in report["slowest"]:
+        print(f"{row['module']:<44}{row['cumulative_ms']:>14}")
+    if report["forbidden"]:
+        print(f"Forbidden modules imported: {', '.join(report['forbidden'])}")
+
+def parse_args(argv: List[str] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Check startup import time against a budget")
+    parser.add_argument("--target", choices=sorted(TARGETS), default="test")
+    parser.add_argument("--budget-ms", type=float, default=150.0, help="maximum total import time")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    return parser.parse_args(argv)
+
+def main(argv: List[str] = None) -> None:
+    args = parse_args(argv)
+    report = measure(args.target)
+    report["budget_ms"] = args.budget_ms
+    report["within_budget"] = report["total_ms"] <= args.budget_ms and not report["forbidden"]
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report, args.budget_ms)
+    if not report["within_budget"]:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
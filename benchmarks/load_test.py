@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Load-test every MCP tool against the FakeLinkedin stand-in.
+
+Usage:
+    python -m benchmarks.load_test --concurrency 16 --requests 200
+    python -m benchmarks.load_test --tools get_profile_info get_job_details --json
+
+Reports p50/p95/p99 latency, throughput and error counts per tool, plus the
+peak RSS of the process, so performance changes can be compared run to run.
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List
+
+from benchmarks.fake_linkedin import COMPANIES, make_factory
+from config.linkedin_config import LinkedInConfig, RateLimitConfig
+from services.cache import response_cache
+from services.app import app
+from services.client_pool import LinkedInClientPool
+from services.connection_graph import connection_graph
+from services.disk_cache import disk_cache
+from services.job_index import job_index
+from services.post_sync import post_sync_store
+from services.linkedin_client import LinkedInMCP
+from services.rate_limiter import RateLimiter
+from services.session_store import SessionStore
+import tools.auth_tools
+import tools.connections_tools
+import tools.jobs_tools
+import tools.people_tools
+import tools.posts_tools
+import tools.profile_tools
+import tools.status_tools
+import tools.watchlist_tools
+
+def tool_calls(keyspace: int) -> Dict[str, Callable[[random.Random], Any]]:
+    """Map each tool name to a function building one call's coroutine"""
+    def key(rng: random.Random) -> str:
+        return str(rng.randrange(keyspace))
+
+    unwatched = itertools.count()
+    logins = itertools.count()
+    # Accounts authenticate_linkedin added, left for remove_linkedin_account to take out again
+    logged_in: List[str] = []
+    # Profiles whose connections are in the local graph, so graph queries start from known nodes
+    graphed: List[str] = []
+
+    def graph_node(rng: random.Random) -> str:
+        return rng.choice(graphed) if graphed else f"ACoAA{key(rng)}"
+
+    async def get_connections(rng: random.Random) -> Any:
+        urn_id = f"ACoAA{key(rng)}"
+        result = await tools.connections_tools.get_linkedin_connections(urn_id, 50)
+        if result.get("success"):
+            graphed.append(urn_id)
+        return result
+
+    async def watch_then_unwatch(rng: random.Random) -> Any:
+        # Each call unwatches a search only it added, so concurrent calls never remove the same item
+        watched = await tools.watchlist_tools.watch_job_search(f"unwatch {next(unwatched)}", rng.choice(["London", None]))
+        if not watched.get("success"):
+            return watched
+        return tools.watchlist_tools.unwatch_item(watched["item"]["item_id"])
+
+    async def authenticate(rng: random.Random) -> Any:
+        email = f"login{next(logins)}@example.com"
+        result = await tools.auth_tools.authenticate_linkedin(email, "bench")
+        if result.get("success"):
+            logged_in.append(email)
+        return result
+
+    async def remove_account(rng: random.Random) -> Any:
+        # Without accounts left by an authenticate_linkedin run, each call removes one it logged in itself
+        if not logged_in:
+            result = await authenticate(rng)
+            if not result.get("success"):
+                return result
+        return await tools.auth_tools.remove_linkedin_account(logged_in.pop())
+
+    return {
+        "get_profile_info": lambda rng: tools.profile_tools.get_profile_info(f"user-{key(rng)}"),
+        "get_profiles_many": lambda rng: tools.profile_tools.get_profiles_many(
+            [f"user-{key(rng)}" for _ in range(10)]
+        ),
+        "get_profile_posts": lambda rng: tools.posts_tools.get_profile_posts(f"user-{key(rng)}", 10),
+        "sync_profile_posts": lambda rng: tools.posts_tools.sync_profile_posts(f"user-{key(rng)}", 20),
+        "search_linkedin_jobs": lambda rng: tools.jobs_tools.search_linkedin_jobs(
+            f"keyword {key(rng)}", rng.choice(["London", None]), 25
+        ),
+        "search_cached_jobs": lambda rng: tools.jobs_tools.search_cached_jobs(
+            rng.choice(["keyword", "python", "data"]), rng.choice(["London", None])
+        ),
+        "get_job_details": lambda rng: tools.jobs_tools.get_job_details(key(rng)),
+        "get_job_details_many": lambda rng: tools.jobs_tools.get_job_details_many(
+            [key(rng) for _ in range(25)]
+        ),
+        "search_linkedin_people": lambda rng: tools.people_tools.search_linkedin_people(
+            f"keyword {key(rng)}", 10
+        ),
+        "get_linkedin_connections": get_connections,
+        "get_mutual_connections": lambda rng: tools.connections_tools.get_mutual_connections(
+            graph_node(rng), graph_node(rng)
+        ),
+        "get_network_neighborhood": lambda rng: tools.connections_tools.get_network_neighborhood(
+            graph_node(rng), 2, 100
+        ),
+        "find_connection_path": lambda rng: tools.connections_tools.find_connection_path(
+            graph_node(rng), graph_node(rng), 4
+        ),
+        "find_connections_at_company": lambda rng: tools.connections_tools.find_connections_at_company(
+            rng.choice(COMPANIES), graph_node(rng), 2, 100
+        ),
+        "watch_profile_posts": lambda rng: tools.watchlist_tools.watch_profile_posts(f"user-{key(rng)}"),
+        "watch_job_search": lambda rng: tools.watchlist_tools.watch_job_search(
+            f"keyword {key(rng)}", rng.choice(["London", None])
+        ),
+        "unwatch_item": watch_then_unwatch,
+        "get_watchlist_updates": lambda rng: tools.watchlist_tools.get_watchlist_updates(
+            rng.choice([None, 5.0, 60.0])
+        ),
+        "authenticate_linkedin": authenticate,
+        "remove_linkedin_account": remove_account,
+        "get_authentication_status": lambda rng: tools.status_tools.get_authentication_status(),
+        "get_server_metrics": lambda rng: tools.status_tools.get_server_metrics()
+    }
+
+def setup_client(args: argparse.Namespace) -> LinkedInClientPool:
+    """Authenticate fake accounts into the shared app's pool"""
+    pool = app.pool
+    factory = make_factory(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        payload_kb=args.payload_kb,
+        seed=args.seed
+    )
+    state_dir = tempfile.mkdtemp(prefix="linkedin-mcp-bench-")
+    session_dir = os.path.join(state_dir, "sessions")
+    # Keep benchmark data out of the real local stores
+    job_index.close()
+    job_index.path = os.path.join(state_dir, "job_index.db")
+    connection_graph.close()
+    connection_graph.path = os.path.join(state_dir, "connection_graph.db")
+    post_sync_store.close()
+    post_sync_store.path = os.path.join(state_dir, "post_sync.db")
+    disk_cache.close()
+    disk_cache.path = os.path.join(state_dir, "response_cache.db")
+    unlimited = RateLimitConfig(global_rate=(1e9, 10 ** 9), default_rate=(1e9, 10 ** 9), endpoint_rates={})
+    # Accounts added through authenticate_linkedin get the same fake backend, session directory and limits
+    app.client_options = {
+        "client_factory": factory,
+        "session_store": SessionStore(session_dir),
+        "rate_limiter": RateLimiter(unlimited)
+    }
+    for index in range(args.accounts):
+        client = LinkedInMCP(
+            LinkedInConfig(email=f"bench{index}@example.com", password="bench", session_dir=session_dir),
+            rate_limiter=RateLimiter(unlimited),
+            client_factory=factory
+        )
+        if not client.authenticate():
+            raise RuntimeError("Fake authentication failed")
+        pool.add(client)
+
+    return pool
+
+def percentile(samples: List[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+async def run_tool(name: str, build_call: Callable, args: argparse.Namespace) -> Dict[str, Any]:
+    """Issue args.requests calls of one tool at args.concurrency and collect stats"""
+    rng = random.Random(f"{args.seed}:{name}")
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latencies = []
+    errors = 0
+
+    async def one() -> None:
+        nonlocal errors
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                result = build_call(rng)
+                if asyncio.iscoroutine(result):
+                    result = await result
+                if isinstance(result, dict) and not result.get("success", True):
+                    errors += 1
+            except Exception:
+                errors += 1
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(args.requests)))
+    elapsed = time.perf_counter() - started
+    return {
+        "tool": name,
+        "requests": args.requests,
+        "errors": errors,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        "throughput_rps": round(args.requests / elapsed, 1) if elapsed else 0.0
+    }
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    setup_client(args)
+    calls = tool_calls(args.keyspace)
+    selected = args.tools or list(calls)
+    unknown = [name for name in selected if name not in calls]
+    if unknown:
+        raise SystemExit(f"Unknown tools: {', '.join(unknown)}")
+
+    results = []
+    for name in selected:
+        if args.cold:
+            response_cache.invalidate()
+        results.append(await run_tool(name, calls[name], args))
+    return {
+        "config": {
+            "concurrency": args.concurrency,
+            "requests": args.requests,
+            "accounts": args.accounts,
+            "latency_ms": args.latency * 1000,
+            "error_rate": args.error_rate,
+            "payload_kb": args.payload_kb,
+            "keyspace": args.keyspace
+        },
+        "tools": results,
+        "cache": response_cache.stats(),
+        "peak_rss_mb": peak_rss_mb()
+    }
+
+def print_report(report: Dict[str, Any]) -> None:
+    print("LinkedIn MCP Server - Load Test")
+    print(f"Config: {report['config']}")
+    print(f"{'tool':<28}{'req':>6}{'err':>6}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'req/s':>10}")
+    for row in report["tools"]:
+        print(
+            f"{row['tool']:<28}{row['requests']:>6}{row['errors']:>6}"
+            f"{row['p50_ms']:>10}{row['p95_ms']:>10}{row['p99_ms']:>10}{row['throughput_rps']:>10}"
+        )
+    print(f"Cache: {report['cache']}")
+    print(f"Peak RSS: {report['peak_rss_mb']} MB")
+
+def parse_args(argv: List[str] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Load-test the LinkedIn MCP tools against a fake backend")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=200, help="calls per tool")
+    parser.add_argument("--accounts", type=int, default=1)
+    parser.add_argument("--latency", type=float, default=0.05, help="upstream latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.02, help="extra random latency in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--payload-kb", type=int, default=20)
+    parser.add_argument("--keyspace", type=int, default=100, help="distinct IDs per tool")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--cold", action="store_true", help="clear the response cache before each tool")
+    parser.add_argument("--tools", nargs="*", help="only run these tools")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    return parser.parse_args(argv)
+
+def main(argv: List[str] = None) -> None:
+    args = parse_args(argv)
+    report = asyncio.run(run(args))
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Compare the memory of raw linkedin_api dicts with compact records.
+
+Usage:
+    python -m benchmarks.record_memory --count 100000
+    python -m benchmarks.record_memory --entities job person --json
+
+Builds COUNT synthetic payloads per entity with FakeLinkedin, then reports the
+traced allocation size of the dict layout, of freshly parsed records and of
+compacted records (the layout the caches and the watchlist hold), bytes per
+object, and the time to parse into records and convert back to dicts.
+"""
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from benchmarks.fake_linkedin import FakeLinkedin
+from services.records import Connection, Job, Person, Post, compact_records, parse_records, to_payload
+
+def generators(count: int, payload_kb: int) -> Dict[str, Callable[[], List[Dict[str, Any]]]]:
+    fake = FakeLinkedin("bench", "bench", latency=0, jitter=0, payload_kb=payload_kb, connections_per_profile=count)
+    return {
+        "job": lambda: fake.search_jobs("python developer", limit=count),
+        "person": lambda: fake.search_people("engineer", limit=count),
+        "connection": lambda: fake.get_profile_connections("ACoAA00000001"),
+        "post": lambda: fake.get_profile_posts("bench", post_count=count)
+    }
+
+RECORD_TYPES = {"job": Job, "person": Person, "connection": Connection, "post": Post}
+
+def measure(entity: str, generate: Callable[[], List[Dict[str, Any]]]) -> Dict[str, Any]:
+    record_type = RECORD_TYPES[entity]
+    # Time conversions first: tracing allocations would slow them down
+    raw = generate()
+    count = len(raw)
+    started = time.perf_counter()
+    records = parse_records(record_type, raw)
+    parse_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    to_payload(records)
+    convert_seconds = time.perf_counter() - started
+    del raw, records
+
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    raw = generate()
+    dict_bytes = tracemalloc.get_traced_memory()[0] - baseline
+    records = parse_records(record_type, raw)
+    # Slots may share strings with the raw dicts, so only count records once those are gone
+    del raw
+    gc.collect()
+    record_bytes = tracemalloc.get_traced_memory()[0] - baseline
+    # ResponseCache.set compacts the records of every result it keeps
+    compact_records(records)
+    gc.collect()
+    compact_bytes = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    return {
+        "entity": entity,
+        "count": count,
+        "dict_mb": round(dict_bytes / 2 ** 20, 1),
+        "record_mb": round(record_bytes / 2 ** 20, 1),
+        "dict_bytes_each": dict_bytes // count,
+        "record_bytes_each": record_bytes // count,
+        "saved_pct": round(100 * (1 - record_bytes / dict_bytes), 1),
+        "compact_mb": round(compact_bytes / 2 ** 20, 1),
+        "compact_bytes_each": compact_bytes // count,
+        "compact_saved_pct": round(100 * (1 - compact_bytes / dict_bytes), 1),
+        "parse_us_each": round(parse_seconds / count * 1e6, 2),
+        "to_dict_us_each": round(convert_seconds / count * 1e6, 2)
+    }
+
+def print_report(rows: List[Dict[str, Any]]) -> None:
+    print("LinkedIn MCP Server - Record Memory")
+    print(
+        f"{'entity':<12}{'count':>8}{'dict MB':>10}{'rec MB':>10}{'cmp MB':>10}{'B/dict':>9}{'B/rec':>9}{'B/cmp':>9}"
+        f"{'saved':>8}{'cmp saved':>11}{'parse us':>10}{'dict us':>10}"
+    )
+    for row in rows:
+        print(
+            f"{row['entity']:<12}{row['count']:>8}{row['dict_mb']:>10}{row['record_mb']:>10}{row['compact_mb']:>10}"
+            f"{row['dict_bytes_each']:>9}{row['record_bytes_each']:>9}{row['compact_bytes_each']:>9}"
+            f"{row['saved_pct']:>7}%{row['compact_saved_pct']:>10}%{row['parse_us_each']:>10}{row['to_dict_us_each']:>10}"
+        )
+
+def parse_args(argv: List[str] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare dict and record memory for LinkedIn entities")
+    parser.add_argument("--count", type=int, default=100000, help="records per entity")
+    parser.add_argument("--payload-kb", type=int, default=4, help="FakeLinkedin payload size; posts carry 5%% of it as text")
+    parser.add_argument("--entities", nargs="*", choices=sorted(RECORD_TYPES), help="only measure these entities")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    return parser.parse_args(argv)
+
+def main(argv: List[str] = None) -> None:
+    args = parse_args(argv)
+    builders = generators(args.count, args.payload_kb)
+    rows = [measure(entity, builders[entity]) for entity in args.entities or builders]
+    if args.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        print_report(rows)
+
+if __name__ == "__main__":
+    main()
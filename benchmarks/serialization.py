@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark tool-result serialization against the stdlib json path.
+
+Usage:
+    python -m benchmarks.serialization
+    python -m benchmarks.serialization --jobs 50 --connections 500 --json
+
+Encodes a job search result, a connections page and a profile with the
+stdlib json module (as FastMCP and test_demo did), pydantic_core when
+installed, every installed backend of services.serialization and a cached
+EncodedResult, then reports microseconds per encode and output size.
+"""
+
+import argparse
+import json
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List
+
+from benchmarks.fake_linkedin import FakeLinkedin
+from services.records import Connection, Job, parse_records, to_payload
+from services.serialization import _BACKENDS, EncodedResult, dumps, select_backend
+
+try:
+    import pydantic_core
+except ImportError:
+    pydantic_core = None
+
+def build_results(jobs: int, connections: int, payload_kb: int) -> Dict[str, Dict[str, Any]]:
+    fake = FakeLinkedin("bench", "bench", latency=0, jitter=0, payload_kb=payload_kb, connections_per_profile=connections)
+    now = datetime.now()
+    return {
+        f"search_jobs[{jobs}]": {
+            "success": True,
+            "jobs": parse_records(Job, fake.search_jobs("python developer", limit=jobs)),
+            "count": jobs,
+            "retrieved_at": now
+        },
+        f"connections[{connections}]": {
+            "success": True,
+            "connections": parse_records(Connection, fake.get_profile_connections("ACoAA00000001")),
+            "count": connections,
+            "retrieved_at": now
+        },
+        "profile": {
+            "success": True,
+            "profile": fake.get_profile("bench"),
+            "retrieved_at": now
+        }
+    }
+
+def encoders(result: Dict[str, Any]) -> Dict[str, Callable[[], Any]]:
+    # Tool results reach the serializer as plain dicts (see instrument_tool)
+    plain = to_payload(result)
+    candidates = {
+        "stdlib json": lambda: json.dumps(plain, default=str),
+        "stdlib json indent=2": lambda: json.dumps(plain, indent=2, default=str)
+    }
+    if pydantic_core is not None:
+        candidates["pydantic_core"] = lambda: pydantic_core.to_json(plain, fallback=str)
+    for name, (available, _) in _BACKENDS.items():
+        if available():
+            backend = select_backend(name)
+            candidates[name] = lambda backend=backend: backend.dumps(plain)
+    encoded = EncodedResult.from_bytes(dumps(result))
+    candidates["cached EncodedResult"] = lambda: dumps(encoded)
+    return candidates
+
+def time_call(func: Callable[[], Any], min_seconds: float) -> float:
+    """Best mean microseconds per call over five rounds"""
+    iterations = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_seconds / 5:
+            break
+        iterations *= 2
+    best = elapsed
+    for _ in range(4):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        best = min(best, time.perf_counter() - started)
+    return best / iterations * 1e6
+
+def run(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    rows = []
+    for payload, result in build_results(args.jobs, args.connections, args.payload_kb).items():
+        baseline = None
+        for name, func in encoders(result).items():
+            micros = time_call(func, args.min_seconds)
+            baseline = baseline or micros
+            rows.append({
+                "payload": payload,
+                "encoder": name,
+                "us_per_op": round(micros, 1),
+                "speedup": round(baseline / micros, 1),
+                "bytes": len(func())
+            })
+    return rows
+
+def print_report(rows: List[Dict[str, Any]]) -> None:
+    print("LinkedIn MCP Server - Serialization")
+    print(f"{'payload':<20}{'encoder':<24}{'us/op':>10}{'speedup':>9}{'bytes':>10}")
+    for row in rows:
+        print(f"{row['payload']:<20}{row['encoder']:<24}{row['us_per_op']:>10}{row['speedup']:>8}x{row['bytes']:>10}")
+
+def parse_args(argv: List[str] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare tool-result serializers")
+    parser.add_argument("--jobs", type=int, default=50)
+    parser.add_argument("--connections", type=int, default=500)
+    parser.add_argument("--payload-kb", type=int, default=20, help="FakeLinkedin profile payload size")
+    parser.add_argument("--min-seconds", type=float, default=0.5, help="timing budget per encoder")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    return parser.parse_args(argv)
+
+def main(argv: List[str] = None) -> None:
+    args = parse_args(argv)
+    rows = run(args)
+    if args.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        print_report(rows)
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,154 @@
 import logging
-from dataclasses import dataclass
+import os
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Base directory for state kept between server runs (sessions, caches, indexes)
+STATE_DIR = os.environ.get(
+    "LINKEDIN_MCP_STATE_DIR",
+    os.path.join(os.path.expanduser("~"), ".linkedin_mcp")
+)
+
 @dataclass
 class LinkedInConfig:
     """Configuration for LinkedIn credentials"""
     email: str
-    password: str
\ No newline at end of file
+    password: str
+    session_dir: Optional[str] = field(default=None, repr=False)
+
+@dataclass
+class CacheConfig:
+    """Configuration for the shared response cache"""
+    max_entries: int = int(os.environ.get("LINKEDIN_MCP_CACHE_MAX_ENTRIES", "2048"))
+    default_ttl: float = 300.0
+    # Seconds a cached result stays fresh, per service endpoint
+    ttls: Dict[str, float] = field(default_factory=lambda: {
+        "get_profile": 3600.0,
+        "get_posts": 300.0,
+        "get_job_details": 1800.0,
+        "get_connections": 1800.0
+    })
+    # Past its TTL an entry is still returned at once, flagged stale, while a background refresh
+    # replaces it; only after these many seconds does a lookup wait for LinkedIn again
+    stale_while_revalidate: bool = os.environ.get("LINKEDIN_MCP_CACHE_SWR", "1") != "0"
+    stale_ttls: Dict[str, float] = field(default_factory=lambda: {
+        "get_profile": 86400.0,
+        "get_posts": 3600.0,
+        "get_job_details": 6 * 3600.0
+    })
+
+@dataclass
+class DiskCacheConfig:
+    """Configuration for the on-disk tier behind the response cache, shared by local server processes"""
+    path: str = os.environ.get("LINKEDIN_MCP_DISK_CACHE", os.path.join(STATE_DIR, "response_cache.db"))
+    enabled: bool = os.environ.get("LINKEDIN_MCP_DISK_CACHE_ENABLED", "1") != "0"
+    # Service methods whose results are persisted
+    methods: Tuple[str, ...] = ("get_profile", "get_posts", "get_job_details", "get_connections")
+    # Compressed bytes kept on disk before the least recently read entries are evicted
+    max_bytes: int = int(os.environ.get("LINKEDIN_MCP_DISK_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+    # Bytes of the file memory-mapped for reads
+    mmap_size: int = 256 * 1024 * 1024
+    compression_level: int = 6
+    # Seconds between passes dropping expired entries and enforcing max_bytes
+    compact_interval: float = 300.0
+    # Seconds a process waits for another one's write lock
+    busy_timeout: float = 5.0
+
+@dataclass
+class ExecutorConfig:
+    """Configuration for the thread pool running blocking linkedin_api calls"""
+    max_concurrency: int = int(os.environ.get("LINKEDIN_MCP_MAX_CONCURRENCY", "8"))
+
+@dataclass
+class HttpConfig:
+    """Configuration for the HTTP connection pool shared by every LinkedIn session"""
+    # Connections kept alive per host; sized to the executor so concurrent calls never queue for one
+    pool_maxsize: int = field(default_factory=lambda: ExecutorConfig().max_concurrency)
+    # Hosts with a pool of their own (API, media, login)
+    pool_connections: int = 4
+    # Seconds to connect and to wait for response data, for requests made without a timeout
+    connect_timeout: float = 10.0
+    read_timeout: float = 30.0
+    http2: bool = os.environ.get("LINKEDIN_MCP_HTTP2", "").lower() in ("1", "true", "yes")
+
+@dataclass
+class RateLimitConfig:
+    """Configuration for the token buckets guarding upstream LinkedIn calls"""
+    # (requests per second, burst size) shared by every call of one account
+    global_rate: Tuple[float, int] = (1.0, 10)
+    default_rate: Tuple[float, int] = (0.5, 5)
+    # (requests per second, burst size) per linkedin_api method
+    endpoint_rates: Dict[str, Tuple[float, int]] = field(default_factory=lambda: {
+        "get_profile": (0.5, 5),
+        "get_profile_posts": (0.5, 5),
+        "get_job": (0.5, 10),
+        "search_jobs": (0.2, 3),
+        "search_people": (0.1, 3),
+        "get_profile_connections": (0.2, 3)
+    })
+    # Seconds a call may wait in the queue before failing
+    queue_timeout: float = 60.0
+    max_retries: int = 3
+    backoff_base: float = 2.0
+    backoff_max: float = 120.0
+    # SQLite file through which worker processes share the buckets and backoff; per process when unset
+    shared_state: Optional[str] = os.environ.get("LINKEDIN_MCP_RATE_STATE")
+
+@dataclass
+class DeadlineConfig:
+    """Configuration for the deadlines of tool calls that reach LinkedIn"""
+    # Seconds a tool call may take unless the call passes timeout_seconds
+    default_timeout: float = float(os.environ.get("LINKEDIN_MCP_TOOL_TIMEOUT", "30"))
+    timeouts: Dict[str, float] = field(default_factory=lambda: {
+        "get_profiles_many": 120.0,
+        "get_job_details_many": 120.0,
+        "search_linkedin_people": 60.0,
+        "sync_profile_posts": 60.0
+    })
+    # Upper bound for timeout_seconds passed by clients
+    max_timeout: float = 300.0
+
+@dataclass
+class PoolConfig:
+    """Configuration for routing calls across several LinkedIn accounts"""
+    # Concurrent upstream calls allowed per account
+    max_in_flight_per_account: int = 4
+    # Seconds a challenged or throttled account is taken out of rotation
+    quarantine_seconds: float = 900.0
+    # Seconds a call may wait for a free account before failing
+    acquire_timeout: float = 60.0
+    # Seconds a process's in-flight slot in the shared rate state outlives the process if it never
+    # releases it; the worker supervisor frees an exited worker's slots at once
+    slot_lease: float = 600.0
+
+@dataclass
+class WatchlistConfig:
+    """Configuration for the background poller refreshing watched profiles and job searches"""
+    # (refreshes per second, burst size) the poller may spend, leaving the rest of the
+    # account's rate limits to interactive tool calls
+    budget: Tuple[float, int] = (0.1, 3)
+    max_concurrency: int = 2
+    # Bounds in seconds for the adaptive refresh interval of one watched item
+    min_interval: float = 300.0
+    max_interval: float = 6 * 3600.0
+    # Seconds between scheduling passes
+    tick: float = 1.0
+    # Updates kept per watched item for get_watchlist_updates
+    max_updates: int = 50
+
+@dataclass
+class WorkerConfig:
+    """Configuration for serving the tools from several worker processes behind one HTTP endpoint"""
+    workers: int = int(os.environ.get("LINKEDIN_MCP_WORKERS", str(os.cpu_count() or 2)))
+    # FastMCP transport of the shared endpoint: "sse" or "streamable-http"
+    transport: str = os.environ.get("LINKEDIN_MCP_TRANSPORT", "sse")
+    host: str = os.environ.get("LINKEDIN_MCP_HOST", "127.0.0.1")
+    port: int = int(os.environ.get("LINKEDIN_MCP_PORT", "8000"))
+    # Rate limits shared by the workers, so N processes keep one budget per account
+    rate_state: str = os.path.join(STATE_DIR, "rate_state.db")
+    # Seconds before a worker that exited is started again
+    restart_delay: float = 1.0
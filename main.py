@@ -1,32 +1,14 @@
-from fastmcp import FastMCP
-from tools.auth_tools import authenticate_linkedin
-from tools.profile_tools import get_profile_info
-from tools.posts_tools import get_profile_posts
-from tools.jobs_tools import search_linkedin_jobs, get_job_details
-from tools.people_tools import search_linkedin_people
-from tools.connections_tools import get_linkedin_connections
-from tools.status_tools import get_authentication_status
+import os
+import sys
+from tools.registry import TOOLS
 
 def main():
-    mcp = FastMCP("LinkedIn MCP Server")
-    
     if len(sys.argv) > 1 and sys.argv[1] == "test":
         print("LinkedIn MCP Server - Test Mode")
         print("Available tools:")
         
-        tools = [
-            "authenticate_linkedin",
-            "get_profile_info",
-            "get_profile_posts",
-            "search_linkedin_jobs",
-            "get_job_details",
-            "search_linkedin_people",
-            "get_linkedin_connections",
-            "get_authentication_status"
-        ]
-        
-        for i, tool in enumerate(tools, 1):
-            print(f"  {i}. {tool}")
+        for i, spec in enumerate(TOOLS, 1):
+            print(f"  {i}. {spec.name}")
         
         print("\nExample usage:")
         print("1. First authenticate:")
@@ -36,12 +18,33 @@ def main():
         print("   get_profile_info()")
         print("\nTo run as MCP server: python main.py")
         print("To run this test: python main.py test")
+        print("To serve over HTTP from several worker processes: python main.py workers")
+        
+    elif len(sys.argv) > 1 and sys.argv[1] == "workers":
+        from services.workers import WorkerPool
+        
+        pool = WorkerPool()
+        print(f"LinkedIn MCP Server starting {pool.size} workers...")
+        print(f"Connect your MCP client to http://{pool.config.host}:{pool.config.port} ({pool.config.transport})")
+        
+        metrics_port = os.environ.get("LINKEDIN_MCP_METRICS_PORT")
+        if metrics_port:
+            from services.metrics import start_metrics_server
+            start_metrics_server(int(metrics_port), render=pool.render_metrics)
+        pool.run()
         
     else:
         print("LinkedIn MCP Server starting...")
         print("Server is ready and listening for MCP client connections")
         print("Connect your MCP client to use the LinkedIn tools")
-        mcp.run()
+        
+        from services.app import app
+        
+        metrics_port = os.environ.get("LINKEDIN_MCP_METRICS_PORT")
+        if metrics_port:
+            from services.metrics import start_metrics_server
+            start_metrics_server(int(metrics_port))
+        app.run()
 
 if __name__ == "__main__":
     main()
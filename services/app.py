@@ -0,0 +1,78 @@
+from typing import Any, Callable, Dict
+from config.linkedin_config import PoolConfig, logger
+from services.cache import response_cache
+from services.client_pool import LinkedInClientPool
+from services.connection_graph import connection_graph
+from services.disk_cache import disk_cache
+from services.executor import blocking_executor
+from services.job_index import job_index
+from services.post_sync import post_sync_store
+from services.rate_state import shared_rate_state
+from services.watchlist import watchlist
+
+class LinkedInApp:
+    """Single owner of the MCP server, the account pool and the shared performance layers"""
+
+    def __init__(self, pool_config: PoolConfig = None):
+        # Processes sharing rate-limit state also share each account's in-flight limit
+        self.pool = LinkedInClientPool(pool_config, slots=shared_rate_state())
+        self.cache = response_cache
+        self.executor = blocking_executor
+        self.watchlist = watchlist
+        # Extra LinkedInMCP arguments for accounts added through authenticate_linkedin, such as a stand-in client_factory
+        self.client_options: Dict[str, Any] = {}
+        self._server = None
+
+    @property
+    def authenticated(self) -> bool:
+        return self.pool.authenticated
+
+    @property
+    def server(self) -> Any:
+        """The FastMCP server with every tool registered, built on first use"""
+        if self._server is None:
+            self._server = self.create_server()
+        return self._server
+
+    def create_server(self, name: str = "LinkedIn MCP Server", tool_factory: Callable = None) -> Any:
+        """Build a new FastMCP server registering tool_factory(spec) for every tool, the tools themselves by default;
+        front ends such as the worker pool pass a factory of their own"""
+        # fastmcp and the tool modules are only imported when a server is needed
+        from fastmcp import FastMCP
+        from services.serialization import encoded_tool, serialize_tool_result
+        from tools.registry import TOOLS, load_tool
+
+        tool_factory = tool_factory or (lambda spec: load_tool(spec.name))
+
+        try:
+            server = FastMCP(name, tool_serializer=serialize_tool_result)
+            wrap = None
+        except TypeError:
+            # FastMCP 3 dropped custom tool serializers; tools hand it their encoded text instead
+            server = FastMCP(name)
+            wrap = encoded_tool
+        for spec in TOOLS:
+            func = tool_factory(spec)
+            server.tool(wrap(func) if wrap else func)
+        return server
+
+    def run(self, **kwargs: Any) -> None:
+        try:
+            self.server.run(**kwargs)
+        finally:
+            self.shutdown()
+
+    def shutdown(self) -> None:
+        """Stop background work and close the local stores"""
+        closers = (
+            self.watchlist.stop, self.executor.shutdown,
+            job_index.close, connection_graph.close, post_sync_store.close, disk_cache.close
+        )
+        for close in closers:
+            try:
+                close()
+            except Exception as e:
+                logger.warning(f"Shutdown step {close.__qualname__} failed: {str(e)}")
+
+# The application every tool and entry point shares
+app = LinkedInApp()
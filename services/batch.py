@@ -0,0 +1,113 @@
+import asyncio
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+from services.deadline import remaining_time
+from services.projection import project
+
+# Upper bound on IDs accepted by a single batch tool call
+MAX_BATCH_SIZE = 100
+
+# Seconds before the call deadline at which a batch stops waiting, leaving time to build its result
+DEADLINE_MARGIN = 0.1
+
+def dedupe_ids(ids: Iterable[str]) -> List[str]:
+    """Strip and dedupe IDs while keeping their first-seen order"""
+    return list(dict.fromkeys(str(item).strip() for item in ids if item is not None and str(item).strip()))
+
+async def fan_out(
+    ids: List[str],
+    fetch: Callable[[str], Awaitable[Dict[str, Any]]],
+    max_concurrency: int
+) -> Dict[str, Dict[str, Any]]:
+    """Fetch every ID concurrently, turning per-ID exceptions into error entries"""
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def fetch_one(item_id: str) -> Dict[str, Any]:
+        async with semaphore:
+            try:
+                return await fetch(item_id)
+            except Exception as e:
+                return {
+                    "success": False,
+                    "error": str(e)
+                }
+
+    tasks = {item_id: asyncio.ensure_future(fetch_one(item_id)) for item_id in ids}
+    if not tasks:
+        return {}
+    # Return the IDs that finished by the call's deadline instead of timing out as a whole
+    remaining = remaining_time(None)
+    try:
+        await asyncio.wait(tasks.values(), timeout=None if remaining is None else max(0.0, remaining - DEADLINE_MARGIN))
+    finally:
+        for task in tasks.values():
+            task.cancel()
+
+    results = {}
+    for item_id, task in tasks.items():
+        if task.done() and not task.cancelled():
+            results[item_id] = task.result()
+        else:
+            results[item_id] = {
+                "success": False,
+                "error": "Did not finish before the call deadline",
+                "timed_out": True
+            }
+    return results
+
+async def fetch_many(
+    ids: List[str],
+    lookup_cached: Callable[[str], Optional[Dict[str, Any]]],
+    fetch: Callable[[str], Awaitable[Dict[str, Any]]],
+    max_concurrency: int
+) -> Dict[str, Dict[str, Any]]:
+    """Serve cached IDs from memory and fan out only the misses"""
+    results = {}
+    missing = []
+    for item_id in ids:
+        cached = lookup_cached(item_id)
+        if cached is not None:
+            results[item_id] = {**cached, "cached": True}
+        else:
+            missing.append(item_id)
+
+    results.update(await fan_out(missing, fetch, max_concurrency))
+    return results
+
+def batch_result(
+    ids: List[str],
+    results: Dict[str, Dict[str, Any]],
+    id_field: str,
+    payload_field: str,
+    fields: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """Build the per-ID success/error response shared by batch tools; payload_field doubles as the projection entity"""
+    entries = []
+    for item_id in ids:
+        result = results[item_id]
+        entry = {id_field: item_id, "success": result.get("success", False)}
+        if entry["success"]:
+            entry[payload_field] = project(payload_field, result.get(payload_field), fields)
+            entry["cached"] = result.get("cached", False)
+        else:
+            entry["error"] = result.get("error") or result.get("message")
+        entries.append(entry)
+
+    succeeded = sum(1 for entry in entries if entry["success"])
+    return {
+        "success": succeeded > 0 or not entries,
+        "results": entries,
+        "count": len(entries),
+        "succeeded": succeeded,
+        "failed": len(entries) - succeeded,
+        "retrieved_at": datetime.now().isoformat()
+    }
+
+def batch_too_large(ids: List[str], kind: str) -> Optional[Dict[str, Any]]:
+    """Return an error response if a batch exceeds MAX_BATCH_SIZE"""
+    if len(ids) <= MAX_BATCH_SIZE:
+        return None
+    return {
+        "success": False,
+        "error": f"At most {MAX_BATCH_SIZE} {kind} can be requested at once, got {len(ids)}"
+    }
@@ -0,0 +1,208 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Set, Tuple
+from config.linkedin_config import CacheConfig, logger
+from services.disk_cache import DiskCache, disk_cache
+from services.executor import blocking_executor
+from services.records import compact_records, to_payload
+from services.serialization import EncodedResult, dumps, loads
+from services.single_flight import upstream_flight
+
+def _normalize(value: Any) -> Hashable:
+    """Turn call arguments into a hashable, order-independent form"""
+    if isinstance(value, str):
+        return value.strip()
+    if isinstance(value, dict):
+        return tuple(sorted((key, _normalize(item)) for key, item in value.items() if item is not None))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_normalize(item) for item in value)
+    return value
+
+class ResponseCache:
+    """Thread-safe TTL cache with LRU eviction for service results, serving stale entries while they are refreshed"""
+
+    def __init__(self, config: CacheConfig = None, disk: Optional[DiskCache] = None):
+        self.config = config or CacheConfig()
+        # Slower tier consulted on memory misses and written through on every set
+        self.disk = disk
+        # key -> [stored_at, fresh_until, stale_until, value, (JSON, payload) of the value as a cache hit, once served]
+        self._entries: "OrderedDict[Tuple, list]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._refreshing: Set[Tuple] = set()
+        self.hits = 0
+        self.stale_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.revalidations = 0
+
+    @staticmethod
+    def make_key(account: str, method: str, *args, **kwargs) -> Tuple:
+        """Build a cache key from the account, service method and call arguments"""
+        return (account, method, _normalize(args), _normalize(kwargs))
+
+    def ttl_for(self, method: str) -> float:
+        return self.config.ttls.get(method, self.config.default_ttl)
+
+    def stale_ttl_for(self, method: str, ttl: float) -> float:
+        """Seconds an entry may be served stale while it is refreshed; no longer than ttl without that mode"""
+        if not self.config.stale_while_revalidate:
+            return ttl
+        return max(ttl, self.config.stale_ttls.get(method, ttl))
+
+    def persisted(self, key: Tuple) -> bool:
+        """Whether the key's method is kept in the disk tier too"""
+        return self.disk is not None and self.disk.enabled and key[1] in self.disk.config.methods
+
+    def _lookup(self, key: Tuple, allow_stale: bool, memory_only: bool = False) -> Optional[list]:
+        with self._lock:
+            entry = self._entries.get(key)
+            now = time.monotonic()
+            if entry is not None and entry[2] <= now:
+                del self._entries[key]
+                entry = None
+            if entry is not None:
+                if entry[1] <= now and not allow_stale:
+                    self.misses += 1
+                    return None
+                self._entries.move_to_end(key)
+                self.hits += 1
+                if entry[1] <= now:
+                    self.stale_hits += 1
+                return entry
+
+        if memory_only and self.persisted(key):
+            # The disk tier may wait on SQLite locks, so the caller reads it off the event loop
+            # in a second lookup, which counts the miss or hit
+            return None
+        entry = self._load(key) if self.persisted(key) else None
+        with self._lock:
+            if entry is None or (entry[1] <= time.monotonic() and not allow_stale):
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.disk_hits += 1
+            return entry
+
+    def _load(self, key: Tuple) -> Optional[list]:
+        """Promote an entry from the disk tier into memory, keeping its original age and expiry"""
+        found = self.disk.get(key)
+        if found is None:
+            return None
+        encoded, stored_at, fresh_until, stale_until = found
+        # The disk tier keeps wall-clock times; memory entries use the monotonic clock
+        offset = time.monotonic() - time.time()
+        entry = [stored_at + offset, fresh_until + offset, stale_until + offset, loads(encoded), None]
+        with self._lock:
+            current = self._entries.get(key)
+            if current is not None:
+                return current
+            self._entries[key] = entry
+            self._evict()
+        return entry
+
+    def _evict(self) -> None:
+        while len(self._entries) > self.config.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def get(self, key: Tuple, memory_only: bool = False) -> Optional[Any]:
+        """Return the cached value for a key, or None if missing or past its TTL"""
+        entry = self._lookup(key, allow_stale=False, memory_only=memory_only)
+        return None if entry is None else entry[3]
+
+    def get_result(self, key: Tuple, allow_stale: bool = False, memory_only: bool = False) -> Optional[EncodedResult]:
+        """Return a cached service result flagged as cached with its age, encoded to JSON only on its first hit"""
+        entry = self._lookup(key, allow_stale, memory_only)
+        if entry is None:
+            return None
+        stored_at, fresh_until, _, value, served = entry
+        if served is None:
+            payload = to_payload({**value, "cached": True})
+            served = (dumps(payload), payload)
+            with self._lock:
+                if self._entries.get(key) is entry:
+                    entry[4] = served
+        encoded, payload = served
+        now = time.monotonic()
+        hit = {"age_seconds": round(now - stored_at, 1)}
+        if fresh_until <= now:
+            hit["stale"] = True
+        # Each hit copies only the top level; nested values are shared, and callers copy before changing them
+        result = EncodedResult({**payload, **hit})
+        result.encoded = encoded[:-1] + b"," + dumps(hit)[1:]
+        return result
+
+    def get_or_revalidate(self, key: Tuple, refresh: Callable[[], Any], memory_only: bool = False) -> Optional[EncodedResult]:
+        """Cached result for a key; a stale one is returned at once and refreshed in the background"""
+        result = self.get_result(key, allow_stale=True, memory_only=memory_only)
+        if result is not None and result.get("stale"):
+            self.revalidate(key, refresh)
+        return result
+
+    def revalidate(self, key: Tuple, refresh: Callable[[], Any]) -> bool:
+        """Run refresh on the blocking executor unless a refresh of this key is already running"""
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            self.revalidations += 1
+
+        def run() -> None:
+            try:
+                # An identical fetch already in flight refreshes the entry itself; foreground
+                # fetches starting while this one runs wait for it instead of calling upstream
+                upstream_flight.do_background(key, refresh)
+            except Exception as e:
+                logger.warning(f"Background refresh of {key[1]} failed: {str(e)}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        blocking_executor.submit(run)
+        return True
+
+    def set(self, key: Tuple, value: Any, ttl: float = None) -> None:
+        """Store a value, evicting the least recently used entries when full"""
+        if ttl is None:
+            ttl = self.ttl_for(key[1])
+        stale_ttl = self.stale_ttl_for(key[1], ttl)
+        # Cached records outlive the call, so their nested fields are kept encoded
+        compact_records(value)
+        now = time.monotonic()
+        with self._lock:
+            self._entries[key] = [now, now + ttl, now + stale_ttl, value, None]
+            self._entries.move_to_end(key)
+            self._evict()
+        if self.persisted(key):
+            self.disk.set(key, dumps(to_payload(value)), ttl, stale_ttl)
+
+    def invalidate(self, account: str = None) -> None:
+        """Drop all entries, or only those of one account, from both tiers"""
+        with self._lock:
+            if account is None:
+                self._entries.clear()
+            else:
+                for key in [key for key in self._entries if key[0] == account]:
+                    del self._entries[key]
+        if self.disk is not None and self.disk.enabled:
+            self.disk.invalidate(account)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.config.max_entries,
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "revalidations": self.revalidations,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0
+            }
+
+# Cache shared by all services
+response_cache = ResponseCache(disk=disk_cache)
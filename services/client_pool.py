@@ -0,0 +1,203 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+from config.linkedin_config import PoolConfig, logger
+from services.deadline import check_deadline, current_deadline, remaining_time
+from services.rate_limiter import THROTTLE_STATUS_CODES, LinkedInThrottledError
+
+if TYPE_CHECKING:
+    from services.linkedin_client import LinkedInMCP
+    from services.rate_state import RateStateStore
+
+# Methods whose result depends on which account makes the call
+ACCOUNT_SCOPED_METHODS = ("get_profile_connections",)
+
+# Methods that read the caller's own data when called without an ID
+OWN_DATA_METHODS = ("get_profile", "get_profile_posts", "get_user_profile")
+
+# Seconds between checks for a slot freed by another process sharing the in-flight limit
+SHARED_SLOT_POLL = 0.05
+
+def _failover_errors() -> tuple:
+    """Errors that may take an account out of rotation, resolved only once a call has failed"""
+    from linkedin_api.client import ChallengeException
+    return (LinkedInThrottledError, ChallengeException)
+
+def _is_account_failure(error: Exception) -> bool:
+    """Whether LinkedIn challenged or throttled the account, rather than a local rate-limit queue timing out"""
+    return not isinstance(error, LinkedInThrottledError) or error.status_code in THROTTLE_STATUS_CODES
+
+def _is_account_scoped(method: str, args: tuple, kwargs: Dict[str, Any]) -> bool:
+    if method in ACCOUNT_SCOPED_METHODS:
+        return True
+    return method in OWN_DATA_METHODS and not args and not kwargs.get("public_id") and not kwargs.get("urn_id")
+
+class LinkedInClientPool:
+    """Routes read-only calls across several authenticated LinkedIn accounts"""
+
+    def __init__(self, config: PoolConfig = None, slots: Optional["RateStateStore"] = None):
+        self.config = config or PoolConfig()
+        # Store whose slots hold each account's in-flight limit across processes, when it is shared
+        self.slots = slots
+        self._clients: "OrderedDict[str, LinkedInMCP]" = OrderedDict()
+        self._in_flight: Dict[str, int] = {}
+        self._quarantined_until: Dict[str, float] = {}
+        self._condition = threading.Condition()
+
+    @property
+    def authenticated(self) -> bool:
+        with self._condition:
+            return any(client.authenticated for client in self._clients.values())
+
+    @property
+    def primary(self) -> Optional["LinkedInMCP"]:
+        """The first account added; used for calls on the caller's own data"""
+        with self._condition:
+            return next(iter(self._clients.values()), None)
+
+    @property
+    def account_id(self) -> Optional[str]:
+        primary = self.primary
+        return primary.account_id if primary else None
+
+    @property
+    def accounts(self) -> List[str]:
+        with self._condition:
+            return list(self._clients)
+
+    def add(self, client: "LinkedInMCP") -> None:
+        """Add an authenticated client, replacing any client of the same account"""
+        with self._condition:
+            self._clients[client.account_id] = client
+            self._in_flight.setdefault(client.account_id, 0)
+            self._quarantined_until.pop(client.account_id, None)
+            self._condition.notify_all()
+
+    def remove(self, account_id: str) -> bool:
+        with self._condition:
+            account_id = account_id.strip().lower()
+            self._quarantined_until.pop(account_id, None)
+            return self._clients.pop(account_id, None) is not None
+
+    def quarantine(self, account_id: str, seconds: float = None) -> None:
+        """Take an account out of rotation for a while"""
+        seconds = self.config.quarantine_seconds if seconds is None else seconds
+        with self._condition:
+            self._quarantined_until[account_id] = time.monotonic() + seconds
+        logger.warning(f"Quarantined LinkedIn account {account_id} for {seconds:.0f}s")
+
+    def _is_healthy(self, account_id: str, now: float) -> bool:
+        client = self._clients[account_id]
+        return client.authenticated and self._quarantined_until.get(account_id, 0) <= now
+
+    def _hold_shared(self, free: List[str]) -> Tuple[Optional[str], Optional[str]]:
+        """Take a shared slot of the least-loaded free account that has one left, as (account, holder)"""
+        for account_id in sorted(free, key=lambda item: (self._in_flight[item], self._clients[item].rate_limiter.waiting)):
+            if self.slots is None:
+                return account_id, None
+            holder = self.slots.hold_slot(account_id, self.config.max_in_flight_per_account, self.config.slot_lease)
+            if holder is not None:
+                return account_id, holder
+        return None, None
+
+    def _acquire(self, scoped: bool, exclude: tuple) -> Tuple["LinkedInMCP", Optional[str]]:
+        """Reserve the least-loaded healthy account, waiting while all are busy; returns it with its shared slot"""
+        deadline = time.monotonic() + self.config.acquire_timeout
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                candidates = list(self._clients)[:1] if scoped else [
+                    account_id for account_id in self._clients if account_id not in exclude
+                ]
+                healthy = [account_id for account_id in candidates if self._is_healthy(account_id, now)]
+                if not healthy:
+                    raise LinkedInThrottledError("No healthy LinkedIn account available")
+
+                free = [
+                    account_id for account_id in healthy
+                    if self._in_flight[account_id] < self.config.max_in_flight_per_account
+                ]
+                account_id, holder = self._hold_shared(free)
+                if account_id is not None:
+                    self._in_flight[account_id] += 1
+                    return self._clients[account_id], holder
+
+                remaining = deadline - now
+                if remaining <= 0:
+                    raise LinkedInThrottledError("Timed out waiting for a free LinkedIn account")
+                check_deadline("waiting for a free LinkedIn account")
+                # Wake up in time to give up when the call's own deadline passes; slots other
+                # processes free are not signalled here, so look for those every SHARED_SLOT_POLL
+                timeout = min(remaining, remaining_time(remaining) + 0.01)
+                if free:
+                    timeout = min(timeout, SHARED_SLOT_POLL)
+                self._condition.wait(timeout)
+
+    def _release(self, client: "LinkedInMCP", holder: Optional[str] = None) -> None:
+        if holder is not None:
+            self.slots.release_slot(holder)
+        with self._condition:
+            if client.account_id in self._in_flight:
+                self._in_flight[client.account_id] -= 1
+            self._condition.notify()
+
+    def _releaser(self, client: "LinkedInMCP", holder: Optional[str] = None) -> Callable[[], None]:
+        """Release of an account's slot that only takes effect the first time it runs"""
+        released = threading.Event()
+
+        def release() -> None:
+            with self._condition:
+                if released.is_set():
+                    return
+                released.set()
+            self._release(client, holder)
+
+        return release
+
+    def call(self, method: str, *args, **kwargs) -> Any:
+        """Call a linkedin_api method on the least-loaded healthy account, failing over once"""
+        scoped = _is_account_scoped(method, args, kwargs)
+        tried = ()
+        while True:
+            client, holder = self._acquire(scoped, tried)
+            release = self._releaser(client, holder)
+            deadline = current_deadline.get()
+            if deadline is not None:
+                # A cancelled call frees its slot at once; the request it leaves running finishes on its own
+                deadline.on_cancel(release)
+            try:
+                return client.call(method, *args, **kwargs)
+            except _failover_errors() as e:
+                # A busy local bucket says nothing about the account's health
+                if not _is_account_failure(e):
+                    raise
+                self.quarantine(client.account_id)
+                tried += (client.account_id,)
+                if scoped or len(tried) > 1:
+                    raise
+            finally:
+                if deadline is not None:
+                    deadline.discard_callback(release)
+                release()
+
+    def status(self) -> Dict[str, Any]:
+        """Per-account load, health and rate-limit state"""
+        now = time.monotonic()
+        with self._condition:
+            accounts = [
+                {
+                    **client.status(),
+                    "in_flight": self._in_flight[account_id],
+                    "quarantined_seconds": round(max(0.0, self._quarantined_until.get(account_id, 0) - now), 1)
+                }
+                for account_id, client in self._clients.items()
+            ]
+            account_ids = list(self._clients)
+        if self.slots is not None:
+            for account_id, account in zip(account_ids, accounts):
+                account["in_flight_all_processes"] = self.slots.slots_held(account_id)
+        return {
+            "accounts": accounts,
+            "healthy": sum(1 for account in accounts if account["authenticated"] and not account["quarantined_seconds"])
+        }
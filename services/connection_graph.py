@@ -0,0 +1,250 @@
+import bisect
+import os
+import sqlite3
+import threading
+from array import array
+from collections import deque
+from typing import Any, Dict, Iterable, List, Optional
+from config.linkedin_config import STATE_DIR, logger
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS nodes (
+    id INTEGER PRIMARY KEY,
+    urn TEXT NOT NULL UNIQUE,
+    name TEXT,
+    jobtitle TEXT,
+    location TEXT
+);
+CREATE TABLE IF NOT EXISTS edges (
+    src INTEGER NOT NULL,
+    dst INTEGER NOT NULL,
+    PRIMARY KEY (src, dst)
+) WITHOUT ROWID;
+"""
+
+# Search results and connections carry these person attributes
+NODE_FIELDS = ("name", "jobtitle", "location")
+
+class ConnectionGraph:
+    """Persistent connection graph with in-memory integer adjacency arrays"""
+
+    def __init__(self, path: str = None):
+        self.path = path or os.environ.get("LINKEDIN_MCP_CONNECTION_GRAPH", os.path.join(STATE_DIR, "connection_graph.db"))
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+        self._ids: Dict[str, int] = {}
+        self._urns: List[str] = []
+        self._attrs: List[tuple] = []
+        # Sorted, deduplicated neighbor IDs per node ID
+        self._adjacency: List[array] = []
+        self._loaded = False
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self.path != ":memory:":
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def _load(self) -> None:
+        """Read the stored graph into memory once"""
+        if self._loaded:
+            return
+        conn = self._connection()
+        for node_id, urn, name, jobtitle, location in conn.execute(
+            "SELECT id, urn, name, jobtitle, location FROM nodes ORDER BY id"
+        ):
+            self._add_node_slot(urn, (name, jobtitle, location), node_id)
+        neighbors: Dict[int, List[int]] = {}
+        for src, dst in conn.execute("SELECT src, dst FROM edges ORDER BY src, dst"):
+            neighbors.setdefault(src, []).append(dst)
+        for src, dsts in neighbors.items():
+            self._adjacency[src] = array("I", dsts)
+        self._loaded = True
+
+    def _add_node_slot(self, urn: str, attrs: tuple, node_id: int) -> None:
+        while len(self._urns) <= node_id:
+            self._urns.append("")
+            self._attrs.append((None, None, None))
+            self._adjacency.append(array("I"))
+        self._urns[node_id] = urn
+        self._attrs[node_id] = attrs
+        self._ids[urn] = node_id
+
+    def _node_id(self, conn: sqlite3.Connection, urn: str, person: Dict[str, Any] = None) -> int:
+        attrs = tuple((person or {}).get(field) for field in NODE_FIELDS)
+        node_id = self._ids.get(urn)
+        if node_id is None:
+            node_id = len(self._urns)
+            conn.execute(
+                "INSERT INTO nodes (id, urn, name, jobtitle, location) VALUES (?, ?, ?, ?, ?)",
+                (node_id, urn) + attrs
+            )
+            self._add_node_slot(urn, attrs, node_id)
+        elif person and any(attrs) and attrs != self._attrs[node_id]:
+            merged = tuple(new or old for new, old in zip(attrs, self._attrs[node_id]))
+            conn.execute(
+                "UPDATE nodes SET name = ?, jobtitle = ?, location = ? WHERE id = ?",
+                merged + (node_id,)
+            )
+            self._attrs[node_id] = merged
+        return node_id
+
+    def _link(self, node_id: int, new_neighbors: List[int]) -> None:
+        current = self._adjacency[node_id]
+        if len(new_neighbors) == 1:
+            # Single back-edge: insert in place to keep the array sorted
+            neighbor = new_neighbors[0]
+            index = bisect.bisect_left(current, neighbor)
+            if index == len(current) or current[index] != neighbor:
+                current.insert(index, neighbor)
+            return
+        merged = set(current)
+        merged.update(new_neighbors)
+        if len(merged) != len(current):
+            self._adjacency[node_id] = array("I", sorted(merged))
+
+    def record_connections(self, source_urn: str, connections: Iterable[Dict[str, Any]]) -> int:
+        """Store undirected edges from source_urn to every connection that has a urn_id"""
+        added = 0
+        with self._lock:
+            self._load()
+            conn = self._connection()
+            with conn:
+                source_id = self._node_id(conn, source_urn)
+                targets = []
+                for person in connections:
+                    urn = person.get("urn_id") if isinstance(person, dict) else None
+                    if not urn or urn == source_urn:
+                        continue
+                    targets.append(self._node_id(conn, urn, person))
+                conn.executemany(
+                    "INSERT OR IGNORE INTO edges (src, dst) VALUES (?, ?)",
+                    [(source_id, target) for target in targets] + [(target, source_id) for target in targets]
+                )
+                before = len(self._adjacency[source_id])
+                self._link(source_id, targets)
+                added = len(self._adjacency[source_id]) - before
+                for target in targets:
+                    self._link(target, [source_id])
+        return added
+
+    def _person(self, node_id: int, **extra: Any) -> Dict[str, Any]:
+        name, jobtitle, location = self._attrs[node_id]
+        return {"urn_id": self._urns[node_id], "name": name, "jobtitle": jobtitle, "location": location, **extra}
+
+    def _require(self, urn: str) -> int:
+        node_id = self._ids.get(urn)
+        if node_id is None:
+            raise KeyError(f"Profile {urn} is not in the local connection graph; fetch its connections first")
+        return node_id
+
+    def mutual_connections(self, urn_a: str, urn_b: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            self._load()
+            a, b = self._require(urn_a), self._require(urn_b)
+            smaller, larger = sorted((self._adjacency[a], self._adjacency[b]), key=len)
+            common = set(smaller).intersection(larger)
+            return [self._person(node_id) for node_id in sorted(common)]
+
+    def neighborhood(self, urn: str, depth: int = 2, limit: int = 100) -> List[Dict[str, Any]]:
+        """People within depth hops of urn, nearest first"""
+        with self._lock:
+            self._load()
+            start = self._require(urn)
+            seen = {start}
+            frontier = [start]
+            found = []
+            for distance in range(1, max(1, depth) + 1):
+                next_frontier = []
+                for node_id in frontier:
+                    for neighbor in self._adjacency[node_id]:
+                        if neighbor not in seen:
+                            seen.add(neighbor)
+                            next_frontier.append(neighbor)
+                            found.append(self._person(neighbor, degree=distance))
+                            if len(found) >= limit:
+                                return found
+                frontier = next_frontier
+            return found
+
+    def shortest_path(self, source_urn: str, target_urn: str, max_depth: int = 6) -> Optional[List[Dict[str, Any]]]:
+        """Bidirectional BFS; returns the people on a shortest path, or None"""
+        with self._lock:
+            self._load()
+            source, target = self._require(source_urn), self._require(target_urn)
+            if source == target:
+                return [self._person(source)]
+            parents = {source: None}
+            children = {target: None}
+            forward, backward = deque([source]), deque([target])
+            for _ in range(max_depth):
+                if not forward or not backward:
+                    break
+                # Expand the smaller frontier one full level
+                if len(forward) <= len(backward):
+                    meeting = self._expand(forward, parents, children)
+                else:
+                    meeting = self._expand(backward, children, parents)
+                if meeting is not None:
+                    path = []
+                    node = meeting
+                    while node is not None:
+                        path.append(node)
+                        node = parents[node]
+                    path.reverse()
+                    node = children[meeting]
+                    while node is not None:
+                        path.append(node)
+                        node = children[node]
+                    return [self._person(node_id) for node_id in path] if len(path) - 1 <= max_depth else None
+            return None
+
+    def _expand(self, frontier: deque, visited: Dict[int, Optional[int]], other: Dict[int, Optional[int]]) -> Optional[int]:
+        for _ in range(len(frontier)):
+            node_id = frontier.popleft()
+            for neighbor in self._adjacency[node_id]:
+                if neighbor in visited:
+                    continue
+                visited[neighbor] = node_id
+                if neighbor in other:
+                    return neighbor
+                frontier.append(neighbor)
+        return None
+
+    def at_company(self, urn: str, company: str, depth: int = 1, limit: int = 100) -> List[Dict[str, Any]]:
+        """People within depth hops of urn whose job title mentions company"""
+        needle = company.strip().lower()
+        return [
+            person for person in self.neighborhood(urn, depth, limit=len(self._urns))
+            if needle and needle in (person["jobtitle"] or "").lower()
+        ][:limit]
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            self._load()
+            return {
+                "nodes": len(self._ids),
+                "edges": sum(len(neighbors) for neighbors in self._adjacency) // 2
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            self._loaded = False
+            self._ids, self._urns, self._attrs, self._adjacency = {}, [], [], []
+
+# Graph fed by every connections fetch
+connection_graph = ConnectionGraph()
+
+def record_connections(source_urn: str, connections: Iterable[Dict[str, Any]]) -> None:
+    """Add fetched connections to the shared graph without letting errors fail the request"""
+    try:
+        connection_graph.record_connections(source_urn, connections)
+    except Exception as e:
+        logger.warning(f"Could not record connections: {str(e)}")
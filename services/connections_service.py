@@ -1,34 +1,151 @@
-from typing import Dict, Any
+import base64
+import json
+from itertools import chain
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from datetime import datetime
 from config.linkedin_config import logger
+from services.cache import response_cache
+from services.executor import run_blocking
+from services.profile_service import ProfileService
+from services.connection_graph import connection_graph, record_connections
+from services.records import Connection, parse_records
+
+def encode_cursor(urn_id: str, offset: int) -> str:
+    """Encode the position of the next connections page as an opaque token"""
+    payload = json.dumps({"u": urn_id, "o": offset}, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[str, int]:
+    """Decode a token produced by encode_cursor into (urn_id, offset)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        urn_id, offset = payload["u"], int(payload["o"])
+    except Exception:
+        raise ValueError("Invalid connections cursor")
+    if not urn_id or offset < 0:
+        raise ValueError("Invalid connections cursor")
+    return urn_id, offset
 
 class ConnectionsService:
     @staticmethod
-    def get_connections(linkedin_client: Any, urn_id: str = None, limit: int = 50) -> Dict[str, Any]:
-        """Get LinkedIn connections for a profile"""
+    def get_own_urn(linkedin_client: Any) -> str:
+        """Get the URN ID of the authenticated account"""
+        result = ProfileService.get_profile(linkedin_client)
+        if not result.get("success"):
+            raise Exception(f"Could not retrieve own profile: {result.get('error')}")
+        own_urn = (result["profile"] or {}).get('entityUrn', '').replace('urn:li:fs_profile:', '')
+        if not own_urn:
+            raise Exception("Could not retrieve own profile URN")
+        return own_urn
+    
+    @staticmethod
+    def iter_connection_pages(linkedin_client: Any, urn_id: str, page_size: int = 50, offset: int = 0) -> Iterator[List[Dict[str, Any]]]:
+        """Lazily pull connection pages from LinkedIn, one upstream request per page"""
+        while True:
+            page = linkedin_client.call("get_profile_connections", urn_id=urn_id, limit=page_size, offset=offset)
+            if not page:
+                return
+            yield page
+            if len(page) < page_size:
+                return
+            offset += len(page)
+    
+    @staticmethod
+    def iter_connections(linkedin_client: Any, urn_id: str, page_size: int = 50, offset: int = 0) -> Iterator[Dict[str, Any]]:
+        """Iterate over all connections of a profile in constant memory"""
+        return chain.from_iterable(
+            ConnectionsService.iter_connection_pages(linkedin_client, urn_id, page_size, offset)
+        )
+    
+    @staticmethod
+    def get_connections(linkedin_client: Any, urn_id: str = None, limit: int = 50, cursor: Optional[str] = None) -> Dict[str, Any]:
+        """Get one page of LinkedIn connections for a profile, with a cursor for the next page"""
         if not linkedin_client.authenticated:
             raise Exception("Not authenticated with LinkedIn")
         
         try:
-            if urn_id:
-                connections = linkedin_client.linkedin_client.get_profile_connections(urn_id=urn_id, limit=limit)
+            if cursor:
+                urn_id, offset = decode_cursor(cursor)
             else:
-                own_profile = linkedin_client.linkedin_client.get_profile()
-                own_urn = own_profile.get('entityUrn', '').replace('urn:li:fs_profile:', '')
-                if own_urn:
-                    connections = linkedin_client.linkedin_client.get_profile_connections(urn_id=own_urn, limit=limit)
-                else:
-                    raise Exception("Could not retrieve own profile URN")
+                urn_id, offset = urn_id or ConnectionsService.get_own_urn(linkedin_client), 0
             
-            return {
+            cache_key = response_cache.make_key(linkedin_client.account_id, "get_connections", urn_id, offset, limit)
+            cached = response_cache.get_result(cache_key)
+            if cached is not None:
+                return cached
+            
+            pages = ConnectionsService.iter_connection_pages(linkedin_client, urn_id, limit, offset)
+            connections = next(pages, [])
+            record_connections(urn_id, connections)
+            has_more = len(connections) == limit
+            
+            result = {
                 "success": True,
-                "connections": connections,
-                "count": len(connections) if connections else 0,
+                "connections": parse_records(Connection, connections),
+                "count": len(connections),
+                "offset": offset,
+                "has_more": has_more,
+                "next_cursor": encode_cursor(urn_id, offset + len(connections)) if has_more else None,
                 "retrieved_at": datetime.now().isoformat()
             }
+            response_cache.set(cache_key, result)
+            return result
         except Exception as e:
             logger.error(f"Error retrieving connections: {str(e)}")
             return {
                 "success": False,
                 "error": str(e)
             }
+    
+    @staticmethod
+    async def get_connections_async(linkedin_client: Any, urn_id: str = None, limit: int = 50, cursor: Optional[str] = None) -> Dict[str, Any]:
+        """Async variant of get_connections that runs on the blocking executor"""
+        return await run_blocking(ConnectionsService.get_connections, linkedin_client, urn_id, limit, cursor)
+    
+    @staticmethod
+    def query_graph(linkedin_client: Any, query: str, urn_id: str = None, **params: Any) -> Dict[str, Any]:
+        """Answer a connection graph query from the local graph store"""
+        try:
+            if not urn_id:
+                if not linkedin_client or not linkedin_client.authenticated:
+                    raise Exception("Not authenticated with LinkedIn; pass urn_id explicitly")
+                urn_id = ConnectionsService.get_own_urn(linkedin_client)
+            
+            if query == "mutual":
+                result = {"people": connection_graph.mutual_connections(urn_id, params["other_urn_id"])}
+            elif query == "neighborhood":
+                result = {"people": connection_graph.neighborhood(urn_id, params["depth"], params["limit"])}
+            elif query == "path":
+                path = connection_graph.shortest_path(urn_id, params["target_urn_id"], params["max_depth"])
+                result = {"path": path, "found": path is not None, "hops": len(path) - 1 if path else None}
+            elif query == "company":
+                result = {"people": connection_graph.at_company(urn_id, params["company"], params["depth"], params["limit"])}
+            else:
+                raise ValueError(f"Unknown graph query: {query}")
+            
+            if "people" in result:
+                result["count"] = len(result["people"])
+            return {
+                "success": True,
+                "urn_id": urn_id,
+                **result,
+                "graph": connection_graph.stats(),
+                "source": "local_graph"
+            }
+        except KeyError as e:
+            return {
+                "success": False,
+                "error": e.args[0]
+            }
+        except Exception as e:
+            logger.error(f"Error querying connection graph: {str(e)}")
+            return {
+                "success": False,
+                "error": str(e)
+            }
+    
+    @staticmethod
+    async def query_graph_async(linkedin_client: Any, query: str, urn_id: str = None, **params: Any) -> Dict[str, Any]:
+        """Async variant of query_graph that runs on the blocking executor"""
+        return await run_blocking(ConnectionsService.query_graph, linkedin_client, query, urn_id, **params)
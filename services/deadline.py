@@ -0,0 +1,143 @@
+import asyncio
+import contextvars
+import functools
+import inspect
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+from config.linkedin_config import DeadlineConfig, logger
+
+class DeadlineExceeded(Exception):
+    """Raised inside a service call whose tool call timed out or was cancelled"""
+
+class Deadline:
+    """Time budget of one tool call, shared by every thread and task working on it"""
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+        self.reason: Optional[str] = None
+        self._cancelled = threading.Event()
+        self._callbacks: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    @property
+    def expired(self) -> bool:
+        return self.cancelled or time.monotonic() >= self.expires_at
+
+    def extend(self, expires_at: float) -> None:
+        """Move the expiry out to a later monotonic time, for work that a later caller also waits on"""
+        with self._lock:
+            if expires_at > self.expires_at:
+                self.seconds += expires_at - self.expires_at
+                self.expires_at = expires_at
+
+    def cancel(self) -> None:
+        """Abandon the call; blocking work notices at its next check or sleep"""
+        with self._lock:
+            self._cancelled.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def on_cancel(self, callback: Callable[[], None]) -> None:
+        """Run callback once the call is cancelled, at once if it already is"""
+        with self._lock:
+            if not self.cancelled:
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def discard_callback(self, callback: Callable[[], None]) -> None:
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def fail(self, stage: str) -> DeadlineExceeded:
+        self.reason = self.reason or stage
+        state = "cancelled" if self.cancelled else f"exceeded its {self.seconds:.3g}s deadline"
+        return DeadlineExceeded(f"Call {state} while {stage}")
+
+    def check(self, stage: str, needed: float = 0.0) -> None:
+        """Raise unless the call is still live with at least needed seconds left"""
+        if self.expired or needed > self.remaining():
+            raise self.fail(stage)
+
+    def sleep(self, seconds: float, stage: str) -> None:
+        """Sleep unless the deadline would pass first; wakes up early when cancelled"""
+        self.check(stage, seconds)
+        if self._cancelled.wait(seconds):
+            raise self.fail(stage)
+
+# Deadline of the tool call running in this context; copied into executor threads with the context
+current_deadline: contextvars.ContextVar = contextvars.ContextVar("current_deadline", default=None)
+
+def check_deadline(stage: str, needed: float = 0.0) -> None:
+    """Raise DeadlineExceeded if the current call timed out, was cancelled or has less than needed seconds left"""
+    deadline = current_deadline.get()
+    if deadline is not None:
+        deadline.check(stage, needed)
+
+def remaining_time(default: Optional[float] = None) -> Optional[float]:
+    """Seconds left for the current call, or default outside a deadline"""
+    deadline = current_deadline.get()
+    return default if deadline is None else deadline.remaining()
+
+def sleep_within_deadline(seconds: float, stage: str) -> None:
+    """time.sleep that gives up when the current call cannot finish in time"""
+    deadline = current_deadline.get()
+    if deadline is None:
+        time.sleep(seconds)
+    else:
+        deadline.sleep(seconds, stage)
+
+def timeout_result(name: str, deadline: Deadline) -> Dict[str, Any]:
+    return {
+        "success": False,
+        "error": f"{name} did not finish within {deadline.seconds:g}s" + (f" (gave up while {deadline.reason})" if deadline.reason else ""),
+        "timed_out": True,
+        "timeout_seconds": deadline.seconds
+    }
+
+def with_deadline(func: Callable, config: DeadlineConfig = None) -> Callable:
+    """Run an async tool under a deadline, adding a timeout_seconds parameter that overrides the default"""
+    config = config or DeadlineConfig()
+    name = func.__name__
+
+    @functools.wraps(func)
+    async def wrapper(*args, timeout_seconds: float = None, **kwargs):
+        seconds = min(config.max_timeout, timeout_seconds or config.timeouts.get(name, config.default_timeout))
+        deadline = Deadline(seconds)
+        token = current_deadline.set(deadline)
+        try:
+            result = await asyncio.wait_for(func(*args, **kwargs), seconds)
+        except asyncio.TimeoutError:
+            deadline.cancel()
+            logger.warning(f"{name} timed out after {seconds:g}s")
+            return timeout_result(name, deadline)
+        except asyncio.CancelledError:
+            # The client gave up; stop the blocking work still running for this call
+            deadline.cancel()
+            raise
+        finally:
+            current_deadline.reset(token)
+        # A service that gave up early reports a plain failure; report it as the timeout it was
+        if deadline.reason and isinstance(result, dict) and result.get("success") is False:
+            return timeout_result(name, deadline)
+        return result
+
+    # Clients see timeout_seconds in the tool's schema, which FastMCP builds from these
+    wrapper.__annotations__ = {**func.__annotations__, "timeout_seconds": float}
+    signature = inspect.signature(func)
+    wrapper.__signature__ = signature.replace(parameters=[
+        *signature.parameters.values(),
+        inspect.Parameter("timeout_seconds", inspect.Parameter.KEYWORD_ONLY, default=None, annotation=float)
+    ])
+    return wrapper
@@ -0,0 +1,211 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Dict, Optional, Tuple
+from config.linkedin_config import DiskCacheConfig, logger
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    account TEXT NOT NULL,
+    method TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    fresh_until REAL NOT NULL,
+    stale_until REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    size INTEGER NOT NULL,
+    value BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_stale_until ON entries (stale_until);
+CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at);
+CREATE INDEX IF NOT EXISTS entries_account ON entries (account);
+"""
+
+# Reads refresh an entry's access time at most this often, so hits rarely need a write
+ACCESS_RESOLUTION = 300.0
+
+class DiskCache:
+    """Compressed SQLite tier under the response cache, surviving restarts and shared by local processes"""
+
+    def __init__(self, config: DiskCacheConfig = None):
+        self.config = config or DiskCacheConfig()
+        self.path = self.config.path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._last_compaction = time.time()
+        self._compacting = False
+        # Access times of read entries, written with the next write instead of on the read
+        self._touched: Dict[str, float] = {}
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.config.enabled
+
+    def _open(self) -> sqlite3.Connection:
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        # Several server processes may open the same file; writers wait for each other's locks
+        conn = sqlite3.connect(self.path, check_same_thread=False, timeout=self.config.busy_timeout)
+        conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA mmap_size={int(self.config.mmap_size)}")
+        conn.executescript(SCHEMA)
+        return conn
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = self._open()
+        return self._conn
+
+    @staticmethod
+    def _key(key: Tuple) -> str:
+        return json.dumps(key, separators=(",", ":"), ensure_ascii=False, default=str)
+
+    def get(self, key: Tuple) -> Optional[Tuple[bytes, float, float, float]]:
+        """Return (JSON value, stored_at, fresh_until, stale_until) in wall-clock time, or None"""
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connection()
+                row = conn.execute(
+                    "SELECT value, stored_at, fresh_until, stale_until, accessed_at FROM entries WHERE key = ? AND stale_until > ?",
+                    (self._key(key), now)
+                ).fetchone()
+                if row is None:
+                    self.misses += 1
+                    return None
+                self.hits += 1
+                if row[4] < now - ACCESS_RESOLUTION:
+                    # Saved with the next write, so a read never waits for the file's write lock
+                    self._touched[self._key(key)] = now
+        except sqlite3.Error as e:
+            logger.warning(f"Disk cache read failed: {str(e)}")
+            return None
+        return zlib.decompress(row[0]), row[1], row[2], row[3]
+
+    def _save_touched(self, conn: sqlite3.Connection) -> None:
+        touched, self._touched = self._touched, {}
+        if touched:
+            conn.executemany(
+                "UPDATE entries SET accessed_at = ? WHERE key = ?",
+                [(accessed_at, key) for key, accessed_at in touched.items()]
+            )
+
+    def set(self, key: Tuple, encoded: bytes, fresh_for: float, stale_for: float) -> None:
+        """Store the JSON of a value, starting a compaction of the file from time to time"""
+        now = time.time()
+        value = zlib.compress(encoded, self.config.compression_level)
+        try:
+            with self._lock:
+                conn = self._connection()
+                with conn:
+                    conn.execute(
+                        """
+                        INSERT OR REPLACE INTO entries
+                            (key, account, method, stored_at, fresh_until, stale_until, accessed_at, size, value)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        """,
+                        (self._key(key), str(key[0]), str(key[1]), now, now + fresh_for, now + stale_for, now, len(value), value)
+                    )
+                    self._save_touched(conn)
+                self.writes += 1
+                due = not self._compacting and now - self._last_compaction >= self.config.compact_interval
+                if due:
+                    self._compacting = True
+                    self._last_compaction = now
+        except sqlite3.Error as e:
+            logger.warning(f"Disk cache write failed: {str(e)}")
+            return
+        if due:
+            threading.Thread(target=self._compact_in_background, name="disk-cache-compaction", daemon=True).start()
+
+    def _compact_in_background(self) -> None:
+        try:
+            self.compact()
+        except sqlite3.Error as e:
+            logger.warning(f"Disk cache compaction failed: {str(e)}")
+        finally:
+            self._compacting = False
+
+    def _compact(self, conn: sqlite3.Connection, now: float) -> int:
+        """Drop expired entries, then the least recently read ones while over the size cap"""
+        self._last_compaction = now
+        with conn:
+            removed = conn.execute("DELETE FROM entries WHERE stale_until <= ?", (now,)).rowcount
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            # Evict down to 90% of the cap so compaction does not run on every write near it
+            excess = total - int(self.config.max_bytes * 0.9) if total > self.config.max_bytes else 0
+            while excess > 0:
+                rows = conn.execute("SELECT key, size FROM entries ORDER BY accessed_at LIMIT 256").fetchall()
+                if not rows:
+                    break
+                victims = []
+                for key, size in rows:
+                    victims.append((key,))
+                    excess -= size
+                    if excess <= 0:
+                        break
+                conn.executemany("DELETE FROM entries WHERE key = ?", victims)
+                removed += len(victims)
+                self.evictions += len(victims)
+        # Return freed pages to the filesystem; executescript steps the vacuum to completion
+        conn.executescript("PRAGMA incremental_vacuum; PRAGMA wal_checkpoint(PASSIVE);")
+        return removed
+
+    def compact(self) -> int:
+        """Compact the file on a connection of its own, so lookups and writes are not held up meanwhile"""
+        if self.path == ":memory:":
+            # Every connection to :memory: is a separate database
+            with self._lock:
+                return self._compact(self._connection(), time.time())
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                self._save_touched(conn)
+        conn = self._open()
+        try:
+            return self._compact(conn, time.time())
+        finally:
+            conn.close()
+
+    def invalidate(self, account: str = None) -> None:
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                if account is None:
+                    conn.execute("DELETE FROM entries")
+                else:
+                    conn.execute("DELETE FROM entries WHERE account = ?", (account,))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entries, size = self._connection().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+        return {
+            "path": self.path,
+            "entries": entries,
+            "bytes": size,
+            "max_bytes": self.config.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "evictions": self.evictions
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+# Disk tier shared by all services, behind response_cache
+disk_cache = DiskCache()
@@ -0,0 +1,47 @@
+import asyncio
+import contextvars
+import functools
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+from config.linkedin_config import ExecutorConfig
+
+class BlockingExecutor:
+    """Bounded thread pool bridging blocking linkedin_api calls into asyncio"""
+
+    def __init__(self, config: ExecutorConfig = None):
+        self.config = config or ExecutorConfig()
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.config.max_concurrency,
+            thread_name_prefix="linkedin-api"
+        )
+        self._semaphore = None
+
+    @property
+    def max_concurrency(self) -> int:
+        return self.config.max_concurrency
+
+    async def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a blocking callable on the pool without stalling the event loop"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.config.max_concurrency)
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            context = contextvars.copy_context()
+            return await loop.run_in_executor(
+                self._pool,
+                functools.partial(context.run, func, *args, **kwargs)
+            )
+
+    def submit(self, func: Callable[..., Any], *args, **kwargs) -> Future:
+        """Start background work on the pool, outside any caller's context and concurrency slot"""
+        return self._pool.submit(func, *args, **kwargs)
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False)
+
+# Executor shared by all async service methods
+blocking_executor = BlockingExecutor()
+
+async def run_blocking(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run a blocking callable on the shared executor"""
+    return await blocking_executor.run(func, *args, **kwargs)
@@ -0,0 +1,239 @@
+import logging
+import threading
+from http.client import HTTPMessage
+from types import SimpleNamespace
+from typing import Any, Dict, Optional, Set
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests import exceptions
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from urllib3 import HTTPConnectionPool, HTTPSConnectionPool
+from config.linkedin_config import HttpConfig, logger
+from services.deadline import check_deadline, remaining_time
+from services.metrics import Gauge, registry
+
+# urllib3 and httpx decode "br" responses when either brotli package is installed
+try:
+    import brotli
+    _BROTLI = True
+except ImportError:
+    try:
+        import brotlicffi
+        _BROTLI = True
+    except ImportError:
+        _BROTLI = False
+
+# HTTP/2 needs httpx with its h2 extra
+try:
+    import h2
+    import httpx
+except ImportError:
+    httpx = None
+
+ACCEPT_ENCODING = "gzip, deflate, br" if _BROTLI else "gzip, deflate"
+
+class _ConnectionCounter:
+    """Requests sent and connections opened by one transport"""
+
+    def __init__(self):
+        self.requests = 0
+        self.new_connections = 0
+        self._lock = threading.Lock()
+
+    def request(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def connection(self) -> None:
+        with self._lock:
+            self.new_connections += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            requests, new = self.requests, self.new_connections
+        reused = max(0, requests - new)
+        return {
+            "requests": requests,
+            "new_connections": new,
+            "reused_connections": reused,
+            "reuse_ratio": round(reused / requests, 3) if requests else 0.0
+        }
+
+def _default_timeout(config: HttpConfig) -> tuple:
+    """Configured (connect, read) timeouts, capped by what is left of the current call's deadline"""
+    check_deadline("sending a request to LinkedIn")
+    remaining = remaining_time(None)
+    if remaining is None:
+        return (config.connect_timeout, config.read_timeout)
+    return (min(config.connect_timeout, remaining), min(config.read_timeout, remaining))
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTP/1.1 keep-alive adapter with a default timeout that counts the connections it opens"""
+
+    def __init__(self, config: HttpConfig, counter: _ConnectionCounter):
+        # HTTPAdapter keeps its own dict in self.config
+        self.http_config = config
+        self.counter = counter
+        # Retries stay with the rate limiter, which knows about LinkedIn's throttling
+        super().__init__(
+            pool_connections=config.pool_connections,
+            pool_maxsize=config.pool_maxsize,
+            max_retries=0
+        )
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        counter = self.counter
+
+        class CountingHTTPConnectionPool(HTTPConnectionPool):
+            def _new_conn(self):
+                counter.connection()
+                return super()._new_conn()
+
+        class CountingHTTPSConnectionPool(HTTPSConnectionPool):
+            def _new_conn(self):
+                counter.connection()
+                return super()._new_conn()
+
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": CountingHTTPConnectionPool,
+            "https": CountingHTTPSConnectionPool
+        }
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        self.counter.request()
+        if timeout is None:
+            timeout = _default_timeout(self.http_config)
+        return super().send(request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+
+class Http2Adapter(BaseAdapter):
+    """requests adapter sending through an httpx client, multiplexing calls over HTTP/2"""
+
+    def __init__(self, config: HttpConfig, counter: _ConnectionCounter):
+        super().__init__()
+        self.http_config = config
+        self.counter = counter
+        self._client = httpx.Client(
+            http2=True,
+            limits=httpx.Limits(max_connections=config.pool_maxsize, max_keepalive_connections=config.pool_maxsize),
+            timeout=httpx.Timeout(config.read_timeout, connect=config.connect_timeout)
+        )
+        # httpx logs every request at INFO
+        logging.getLogger("httpx").setLevel(logging.WARNING)
+        self._seen: Set[int] = set()
+        self._seen_lock = threading.Lock()
+
+    def _count_connections(self) -> None:
+        pool = getattr(getattr(self._client, "_transport", None), "_pool", None)
+        with self._seen_lock:
+            for connection in getattr(pool, "connections", ()):
+                if id(connection) not in self._seen:
+                    self._seen.add(id(connection))
+                    self.counter.connection()
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        self.counter.request()
+        if timeout is None:
+            timeout = _default_timeout(self.http_config)
+        if isinstance(timeout, tuple):
+            timeout = httpx.Timeout(timeout[1], connect=timeout[0])
+        try:
+            response = self._client.request(
+                request.method,
+                request.url,
+                headers=dict(request.headers),
+                content=request.body,
+                timeout=timeout,
+                follow_redirects=False
+            )
+        except httpx.TimeoutException as e:
+            raise exceptions.Timeout(str(e), request=request)
+        except httpx.TransportError as e:
+            raise exceptions.ConnectionError(str(e), request=request)
+        self._count_connections()
+        return self._build_response(request, response)
+
+    def _build_response(self, request, response) -> Response:
+        result = Response()
+        result.status_code = response.status_code
+        result.reason = response.reason_phrase
+        result.url = str(response.url)
+        result.request = request
+        result.connection = self
+        # httpx already decoded the body; drop the encoding so nothing decodes it twice
+        headers = [(key, value) for key, value in response.headers.multi_items() if key.lower() != "content-encoding"]
+        result.headers = CaseInsensitiveDict(headers)
+        result.encoding = get_encoding_from_headers(result.headers)
+        result._content = response.content
+        result._content_consumed = True
+        # requests reads Set-Cookie headers through raw._original_response.msg
+        message = HTTPMessage()
+        for key, value in headers:
+            message[key] = value
+        result.raw = SimpleNamespace(_original_response=SimpleNamespace(msg=message))
+        return result
+
+    def close(self) -> None:
+        self._client.close()
+
+class HttpTransport:
+    """Connection pool shared by the requests sessions of every LinkedIn account"""
+
+    def __init__(self, config: HttpConfig = None):
+        self.config = config or HttpConfig()
+        self.counter = _ConnectionCounter()
+        self._adapter: Optional[BaseAdapter] = None
+        self._lock = threading.Lock()
+
+    @property
+    def http2(self) -> bool:
+        return isinstance(self._adapter, Http2Adapter)
+
+    def adapter(self) -> BaseAdapter:
+        """The shared adapter, created on first use"""
+        with self._lock:
+            if self._adapter is None:
+                if self.config.http2 and httpx is not None:
+                    self._adapter = Http2Adapter(self.config, self.counter)
+                else:
+                    if self.config.http2:
+                        logger.warning("HTTP/2 needs httpx with the http2 extra; using HTTP/1.1")
+                    self._adapter = PooledHTTPAdapter(self.config, self.counter)
+            return self._adapter
+
+    def install(self, session: Any) -> None:
+        """Route a requests session through the shared pool and negotiate compressed responses"""
+        adapter = self.adapter()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+        session.headers["Connection"] = "keep-alive"
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self.counter.stats(),
+            "http2": self.http2,
+            "pool_maxsize": self.config.pool_maxsize,
+            "accept_encoding": ACCEPT_ENCODING
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._adapter is not None:
+                self._adapter.close()
+                self._adapter = None
+
+# Transport shared by all LinkedIn sessions
+http_transport = HttpTransport()
+
+http_connections = registry.register(Gauge(
+    "linkedin_mcp_http_connections", "Upstream HTTP requests since start, by whether they opened or reused a connection", ("kind",)
+))
+
+def _collect_http_stats() -> None:
+    stats = http_transport.stats()
+    http_connections.set(stats["new_connections"], kind="new")
+    http_connections.set(stats["reused_connections"], kind="reused")
+
+registry.add_collector(_collect_http_stats)
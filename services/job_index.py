@@ -0,0 +1,206 @@
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+from config.linkedin_config import STATE_DIR, logger
+
+_JOB_URN = re.compile(r"(?:jobPosting|fsd_jobPosting|fs_normalized_jobPosting):(\d+)")
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    title TEXT,
+    company TEXT,
+    location TEXT,
+    listed_at INTEGER,
+    remote INTEGER,
+    description TEXT,
+    first_seen REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_listed_at ON jobs (listed_at);
+CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+    job_id UNINDEXED, title, company, location, description,
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+def _text(value: Any) -> Optional[str]:
+    if isinstance(value, dict):
+        value = value.get("text")
+    return value if isinstance(value, str) and value.strip() else None
+
+def extract_job_id(job: Dict[str, Any]) -> Optional[str]:
+    """Find the numeric job ID of a search result or job details payload"""
+    if job.get("jobPostingId"):
+        return str(job["jobPostingId"])
+    for key in ("entityUrn", "trackingUrn", "jobPostingUrn", "*jobPosting", "dashEntityUrn"):
+        match = _JOB_URN.search(str(job.get(key) or ""))
+        if match:
+            return match.group(1)
+    return None
+
+def _extract_company(job: Dict[str, Any]) -> Optional[str]:
+    name = _text(job.get("companyName"))
+    if name:
+        return name
+    for detail in (job.get("companyDetails") or {}).values():
+        if isinstance(detail, dict):
+            name = _text((detail.get("companyResolutionResult") or {}).get("name")) or _text(detail.get("companyName"))
+            if name:
+                return name
+    return _text(job.get("primaryDescription"))
+
+def _extract_fields(job: Dict[str, Any]) -> Dict[str, Any]:
+    listed_at = job.get("listedAt") or job.get("originalListedAt")
+    remote = job.get("workRemoteAllowed")
+    return {
+        "title": _text(job.get("title")) or _text(job.get("jobPostingTitle")),
+        "company": _extract_company(job),
+        "location": _text(job.get("formattedLocation")) or _text(job.get("secondaryDescription")),
+        "listed_at": int(listed_at) if isinstance(listed_at, (int, float)) else None,
+        "remote": None if remote is None else int(bool(remote)),
+        "description": _text(job.get("description"))
+    }
+
+def _match_query(keywords: str) -> Optional[str]:
+    """Turn free text into an FTS5 query matching every word as a prefix"""
+    tokens = _TOKEN.findall(keywords or "")
+    return " ".join(f'"{token}"*' for token in tokens) or None
+
+class JobIndex:
+    """Local SQLite FTS5 index of every job seen through JobsService"""
+
+    def __init__(self, path: str = None):
+        self.path = path or os.environ.get("LINKEDIN_MCP_JOB_INDEX", os.path.join(STATE_DIR, "job_index.db"))
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self.path != ":memory:":
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def ingest(self, jobs: Iterable[Dict[str, Any]], job_id: str = None) -> int:
+        """Upsert jobs by ID, keeping known fields that a sparser payload lacks"""
+        now = time.time()
+        count = 0
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                for job in jobs:
+                    if not isinstance(job, dict):
+                        continue
+                    current_id = job_id or extract_job_id(job)
+                    if not current_id:
+                        continue
+                    fields = _extract_fields(job)
+                    conn.execute(
+                        """
+                        INSERT INTO jobs (job_id, title, company, location, listed_at, remote, description, first_seen, updated_at)
+                        VALUES (:job_id, :title, :company, :location, :listed_at, :remote, :description, :now, :now)
+                        ON CONFLICT(job_id) DO UPDATE SET
+                            title = coalesce(excluded.title, title),
+                            company = coalesce(excluded.company, company),
+                            location = coalesce(excluded.location, location),
+                            listed_at = coalesce(excluded.listed_at, listed_at),
+                            remote = coalesce(excluded.remote, remote),
+                            description = coalesce(excluded.description, description),
+                            updated_at = excluded.updated_at
+                        """,
+                        {**fields, "job_id": current_id, "now": now}
+                    )
+                    row = conn.execute(
+                        "SELECT title, company, location, description FROM jobs WHERE job_id = ?", (current_id,)
+                    ).fetchone()
+                    conn.execute("DELETE FROM jobs_fts WHERE job_id = ?", (current_id,))
+                    conn.execute(
+                        "INSERT INTO jobs_fts (job_id, title, company, location, description) VALUES (?, ?, ?, ?, ?)",
+                        (current_id, row["title"], row["company"], row["location"], row["description"])
+                    )
+                    count += 1
+        return count
+
+    def search(self, keywords: str = None, location: str = None, company: str = None,
+               posted_after: float = None, remote: bool = None, limit: int = 25) -> List[Dict[str, Any]]:
+        """Rank indexed jobs by BM25 relevance, filtered by location, company, date and remote"""
+        conditions = []
+        params: Dict[str, Any] = {"limit": max(1, int(limit))}
+        if location:
+            conditions.append("j.location LIKE :location")
+            params["location"] = f"%{location.strip()}%"
+        if company:
+            conditions.append("j.company LIKE :company")
+            params["company"] = f"%{company.strip()}%"
+        if posted_after:
+            conditions.append("j.listed_at >= :posted_after")
+            params["posted_after"] = int(posted_after * 1000)
+        if remote is not None:
+            conditions.append("j.remote = :remote")
+            params["remote"] = int(remote)
+
+        query = _match_query(keywords)
+        if query:
+            conditions.append("jobs_fts MATCH :query")
+            params["query"] = query
+            sql = """
+                SELECT j.job_id, j.title, j.company, j.location, j.listed_at, j.remote,
+                       snippet(jobs_fts, 4, '[', ']', '...', 12) AS snippet, bm25(jobs_fts) AS score
+                FROM jobs_fts JOIN jobs j ON j.job_id = jobs_fts.job_id
+            """
+            order = "ORDER BY score"
+        else:
+            sql = """
+                SELECT j.job_id, j.title, j.company, j.location, j.listed_at, j.remote,
+                       NULL AS snippet, NULL AS score
+                FROM jobs j
+            """
+            order = "ORDER BY j.listed_at DESC"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += f" {order} LIMIT :limit"
+
+        with self._lock:
+            rows = self._connection().execute(sql, params).fetchall()
+        return [
+            {
+                "job_id": row["job_id"],
+                "title": row["title"],
+                "company": row["company"],
+                "location": row["location"],
+                "listed_at": row["listed_at"],
+                "remote": None if row["remote"] is None else bool(row["remote"]),
+                "snippet": row["snippet"],
+                "score": None if row["score"] is None else round(-row["score"], 4)
+            }
+            for row in rows
+        ]
+
+    def count(self) -> int:
+        with self._lock:
+            return self._connection().execute("SELECT count(*) FROM jobs").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+# Index fed by every job search and job details lookup
+job_index = JobIndex()
+
+def index_jobs(jobs: Iterable[Dict[str, Any]], job_id: str = None) -> None:
+    """Add jobs to the shared index without letting index errors fail the request"""
+    try:
+        job_index.ingest(jobs, job_id)
+    except Exception as e:
+        logger.warning(f"Could not index jobs: {str(e)}")
@@ -1,6 +1,14 @@
-from typing import Dict, Any
+import time
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 from config.linkedin_config import logger
+from services.cache import response_cache
+from services.executor import blocking_executor, run_blocking
+from services.batch import batch_result, batch_too_large, dedupe_ids, fetch_many
+from services.projection import project_result
+from services.single_flight import upstream_flight
+from services.job_index import index_jobs, job_index
+from services.records import Job, parse_records
 
 class JobsService:
     @staticmethod
@@ -18,11 +26,12 @@ class JobsService:
             if location:
                 search_params["location_name"] = location
             
-            jobs = linkedin_client.linkedin_client.search_jobs(**search_params)
+            jobs = linkedin_client.call("search_jobs", **search_params)
+            index_jobs(jobs or [])
             
             return {
                 "success": True,
-                "jobs": jobs,
+                "jobs": parse_records(Job, jobs),
                 "count": len(jobs) if jobs else 0,
                 "search_params": search_params,
                 "retrieved_at": datetime.now().isoformat()
@@ -35,22 +44,123 @@ class JobsService:
             }
     
     @staticmethod
-    def get_job_details(linkedin_client: Any, job_id: str) -> Dict[str, Any]:
-        """Get detailed information about a specific job posting"""
+    def get_job_details(linkedin_client: Any, job_id: str, bypass_cache: bool = False, fields: List[str] = None) -> Dict[str, Any]:
+        """Get detailed information about a specific job posting, optionally projected to the requested fields"""
         if not linkedin_client.authenticated:
             raise Exception("Not authenticated with LinkedIn")
         
+        cache_key = response_cache.make_key(linkedin_client.account_id, "get_job_details", job_id)
+        if not bypass_cache:
+            cached = JobsService._cached_job(linkedin_client, job_id, cache_key)
+            if cached is not None:
+                return project_result("job", cached, "job", fields)
+        
+        # Concurrent identical requests share a single upstream call
+        fetched = upstream_flight.do(cache_key, lambda: JobsService._fetch_job(linkedin_client, job_id, cache_key))
+        return project_result("job", fetched, "job", fields)
+    
+    @staticmethod
+    def _cached_job(linkedin_client: Any, job_id: str, cache_key: Tuple, memory_only: bool = False) -> Optional[Dict[str, Any]]:
+        """Cached job details, refreshed in the background when stale"""
+        return response_cache.get_or_revalidate(
+            cache_key,
+            lambda: JobsService._fetch_job(linkedin_client, job_id, cache_key),
+            memory_only
+        )
+    
+    @staticmethod
+    def _fetch_job(linkedin_client: Any, job_id: str, cache_key: Tuple) -> Dict[str, Any]:
         try:
-            job_details = linkedin_client.linkedin_client.get_job(job_id)
+            job_details = linkedin_client.call("get_job", job_id)
+            if job_details:
+                index_jobs([job_details], job_id)
             
-            return {
+            result = {
                 "success": True,
-                "job": job_details,
+                "job": Job.from_dict(job_details) if job_details else job_details,
                 "retrieved_at": datetime.now().isoformat()
             }
+            response_cache.set(cache_key, result)
+            return result
         except Exception as e:
             logger.error(f"Error retrieving job details: {str(e)}")
             return {
                 "success": False,
                 "error": str(e)
             }
+    
+    @staticmethod
+    def search_cached_jobs(keywords: str = None, location: str = None, company: str = None,
+                           posted_within_days: int = None, remote: bool = None, limit: int = 25) -> Dict[str, Any]:
+        """Search jobs already seen by search_jobs and get_job_details without calling LinkedIn"""
+        try:
+            posted_after = time.time() - posted_within_days * 86400 if posted_within_days else None
+            jobs = job_index.search(keywords, location, company, posted_after, remote, limit)
+            
+            return {
+                "success": True,
+                "jobs": jobs,
+                "count": len(jobs),
+                "indexed_jobs": job_index.count(),
+                "source": "local_index",
+                "retrieved_at": datetime.now().isoformat()
+            }
+        except Exception as e:
+            logger.error(f"Error searching cached jobs: {str(e)}")
+            return {
+                "success": False,
+                "error": str(e)
+            }
+    
+    @staticmethod
+    async def search_jobs_async(linkedin_client: Any, keywords: str, location: str = None, limit: int = 25) -> Dict[str, Any]:
+        """Async variant of search_jobs that runs on the blocking executor"""
+        return await run_blocking(JobsService.search_jobs, linkedin_client, keywords, location, limit)
+    
+    @staticmethod
+    async def get_job_details_async(linkedin_client: Any, job_id: str, bypass_cache: bool = False, fields: List[str] = None) -> Dict[str, Any]:
+        """Async variant of get_job_details that runs on the blocking executor"""
+        if not linkedin_client.authenticated:
+            raise Exception("Not authenticated with LinkedIn")
+        
+        cache_key = response_cache.make_key(linkedin_client.account_id, "get_job_details", job_id)
+        if not bypass_cache:
+            # Warm keys are answered on the event loop, without waiting for an executor slot;
+            # the disk tier may block, so it is read on the executor
+            cached = JobsService._cached_job(linkedin_client, job_id, cache_key, memory_only=True)
+            if cached is None and response_cache.persisted(cache_key):
+                cached = await run_blocking(JobsService._cached_job, linkedin_client, job_id, cache_key)
+            if cached is not None:
+                return project_result("job", cached, "job", fields)
+        # The cache was checked above, so the executor only fetches; the fetch goes
+        # straight to _fetch_job so the shared call is led (and counted) once
+        result = await upstream_flight.do_async(
+            cache_key,
+            lambda: run_blocking(JobsService._fetch_job, linkedin_client, job_id, cache_key)
+        )
+        return project_result("job", result, "job", fields)
+    
+    @staticmethod
+    async def get_job_details_many_async(linkedin_client: Any, job_ids: List[str], bypass_cache: bool = False, fields: List[str] = None, max_concurrency: int = None) -> Dict[str, Any]:
+        """Get details for several job postings concurrently, reporting success per job ID"""
+        if not linkedin_client.authenticated:
+            raise Exception("Not authenticated with LinkedIn")
+        
+        ids = dedupe_ids(job_ids)
+        too_large = batch_too_large(ids, "job IDs")
+        if too_large:
+            return too_large
+        
+        def lookup_cached(job_id: str):
+            if bypass_cache:
+                return None
+            # Memory only: misses are looked up on disk by the executor
+            return response_cache.get(response_cache.make_key(linkedin_client.account_id, "get_job_details", job_id), memory_only=True)
+        
+        results = await fetch_many(
+            ids,
+            lookup_cached,
+            lambda job_id: JobsService.get_job_details_async(linkedin_client, job_id, bypass_cache),
+            max_concurrency or blocking_executor.max_concurrency
+        )
+        return batch_result(ids, results, "job_id", "job", fields)
@@ -1,24 +1,119 @@
-from typing import Optional
+import threading
+from typing import Any, Callable, Dict, Optional
 from linkedin_api import Linkedin
+from requests.exceptions import TooManyRedirects
 from config.linkedin_config import LinkedInConfig, logger
+from services.http_transport import HttpTransport, http_transport
+from services.session_store import SessionStore
+from services.rate_limiter import THROTTLE_STATUS_CODES, LinkedInThrottledError, RateLimiter
+from services.rate_state import shared_rate_state
+from services.metrics import observe_upstream, record_response_bytes
+
+class LinkedInAuthError(Exception):
+    """Raised when LinkedIn rejects the session cookies of a request"""
+
+def _check_response(response, *args, **kwargs):
+    """requests response hook raising on rejected sessions and throttling"""
+    if response.status_code == 401:
+        raise LinkedInAuthError(f"LinkedIn rejected the session ({response.status_code})")
+    if response.status_code in THROTTLE_STATUS_CODES:
+        raise LinkedInThrottledError(
+            f"LinkedIn throttled the request ({response.status_code})",
+            response.status_code
+        )
 
 class LinkedInMCP:
-    def __init__(self, config: LinkedInConfig):
+    def __init__(self, config: LinkedInConfig, session_store: Optional[SessionStore] = None,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 client_factory: Callable[..., Any] = Linkedin,
+                 transport: Optional[HttpTransport] = None):
         self.config = config
+        self.client_factory = client_factory
         self.linkedin_client = None
         self.authenticated = False
-    
+        self.session_store = session_store or SessionStore(config.session_dir)
+        self.rate_limiter = rate_limiter or RateLimiter(namespace=self.account_id, state=shared_rate_state())
+        # All accounts share one connection pool unless given their own
+        self.transport = transport or http_transport
+        self._auth_lock = threading.Lock()
+        self._session_generation = 0
+
+    @property
+    def account_id(self) -> str:
+        """Stable identifier of the account this client is logged in as"""
+        return self.config.email.strip().lower()
+
     def authenticate(self) -> bool:
-        """Authenticate with LinkedIn using provided credentials"""
+        """Authenticate with LinkedIn, reusing a stored session when still valid"""
         try:
-            self.linkedin_client = Linkedin(
-                self.config.email, 
-                self.config.password
-            )
+            session = self.session_store.load(self.account_id)
+            if session is not None:
+                self._set_client(self.client_factory(
+                    self.config.email,
+                    self.config.password,
+                    cookies=session.cookie_jar()
+                ))
+                logger.info("Restored LinkedIn session from session store")
+            else:
+                self._login()
+                logger.info("Successfully authenticated with LinkedIn")
             self.authenticated = True
-            logger.info("Successfully authenticated with LinkedIn")
             return True
         except Exception as e:
             logger.error(f"LinkedIn authentication failed: {str(e)}")
             self.authenticated = False
             return False
+
+    def call(self, method: str, *args, **kwargs) -> Any:
+        """Call a linkedin_api method under the account's rate limits"""
+        if not self.authenticated:
+            raise Exception("Not authenticated with LinkedIn")
+
+        return self.rate_limiter.call(method, self._call_with_reauth, method, *args, **kwargs)
+
+    def _call_with_reauth(self, method: str, *args, **kwargs) -> Any:
+        """Call a linkedin_api method, logging in again once if the session was rejected"""
+        generation = self._session_generation
+        try:
+            return observe_upstream(method, getattr(self.linkedin_client, method), *args, **kwargs)
+        except (LinkedInAuthError, TooManyRedirects) as e:
+            logger.info(f"LinkedIn session expired during {method}: {str(e)}")
+            self._refresh_session(generation)
+            return observe_upstream(method, getattr(self.linkedin_client, method), *args, **kwargs)
+
+    def status(self) -> Dict[str, Any]:
+        """Authentication and rate-limit state of this account"""
+        return {
+            "account": self.account_id,
+            "authenticated": self.authenticated,
+            "rate_limits": self.rate_limiter.snapshot()
+        }
+
+    def _login(self, refresh: bool = False) -> None:
+        """Do a full credential login and persist the resulting session"""
+        client = self.client_factory(
+            self.config.email,
+            self.config.password,
+            refresh_cookies=refresh
+        )
+        self.session_store.save(self.account_id, client.client.session.cookies)
+        self._set_client(client)
+
+    def _refresh_session(self, generation: int) -> None:
+        """Replace a rejected session unless another thread already did"""
+        with self._auth_lock:
+            if generation != self._session_generation:
+                return
+            self.session_store.delete(self.account_id)
+            try:
+                self._login(refresh=True)
+            except Exception:
+                self.authenticated = False
+                raise
+            logger.info("Refreshed LinkedIn session")
+
+    def _set_client(self, client: Any) -> None:
+        self.transport.install(client.client.session)
+        client.client.session.hooks["response"].extend([record_response_bytes, _check_response])
+        self.linkedin_client = client
+        self._session_generation += 1
@@ -0,0 +1,324 @@
+import asyncio
+import contextvars
+import functools
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from config.linkedin_config import logger
+from services.cache import response_cache
+from services.records import to_payload
+from services.single_flight import upstream_flight
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# linkedin_api method currently running on this thread, for labelling response bytes
+current_upstream_method: contextvars.ContextVar = contextvars.ContextVar("current_upstream_method", default="unknown")
+
+def _format_labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labels: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+        self._values: Dict[Tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, "")) for name in self.labels)
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def set_total(self, value: float, **labels: Any) -> None:
+        """Mirror a running total kept elsewhere, for collectors"""
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = dict(self._values)
+        return self.header() + [
+            f"{self.name}{_format_labels(self.labels, key)} {_format_value(value)}"
+            for key, value in sorted(values.items())
+        ]
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, amount: float = 1, **labels: Any) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: Any) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labels: Tuple[str, ...] = (), buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(buckets) + (float("inf"),)
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    entry[0][index] += 1
+                    break
+            entry[1] += value
+            entry[2] += 1
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = {key: (list(counts), total, count) for key, (counts, total, count) in self._values.items()}
+        lines = self.header()
+        for key, (counts, total, count) in sorted(values.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labels, key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labels, key)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.labels, key)} {count}")
+        return lines
+
+class MetricsRegistry:
+    """Holds all server metrics and renders them in Prometheus text format"""
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+        self._collectors: List[Callable[[], None]] = []
+
+    def register(self, metric: _Metric) -> Any:
+        self._metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        """Register a callback that refreshes gauges right before rendering"""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        for collector in self._collectors:
+            try:
+                collector()
+            except Exception as e:
+                logger.warning(f"Metrics collector failed: {str(e)}")
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+registry = MetricsRegistry()
+
+tool_duration = registry.register(Histogram(
+    "linkedin_mcp_tool_duration_seconds", "Latency of MCP tool calls", ("tool",)
+))
+tool_in_flight = registry.register(Gauge(
+    "linkedin_mcp_tool_in_flight", "MCP tool calls currently running", ("tool",)
+))
+tool_errors = registry.register(Counter(
+    "linkedin_mcp_tool_errors_total", "MCP tool calls that raised or returned success=False", ("tool", "error_type")
+))
+upstream_duration = registry.register(Histogram(
+    "linkedin_mcp_upstream_duration_seconds", "Latency of linkedin_api calls", ("method",)
+))
+upstream_errors = registry.register(Counter(
+    "linkedin_mcp_upstream_errors_total", "Failed linkedin_api calls", ("method", "error_type")
+))
+upstream_bytes = registry.register(Counter(
+    "linkedin_mcp_upstream_bytes_total", "Response bytes received from LinkedIn", ("method",)
+))
+cache_lookups = registry.register(Counter(
+    "linkedin_mcp_cache_lookups_total", "Response cache lookups", ("result",)
+))
+cache_hit_ratio = registry.register(Gauge(
+    "linkedin_mcp_cache_hit_ratio", "Response cache hit ratio since start"
+))
+cache_entries = registry.register(Gauge(
+    "linkedin_mcp_cache_entries", "Entries held in the response cache"
+))
+
+def _collect_cache_stats() -> None:
+    stats = response_cache.stats()
+    cache_lookups.set_total(stats["hits"] - stats["stale_hits"] - stats["disk_hits"], result="hit")
+    cache_lookups.set_total(stats["stale_hits"], result="stale")
+    cache_lookups.set_total(stats["disk_hits"], result="disk")
+    cache_lookups.set_total(stats["misses"], result="miss")
+    cache_hit_ratio.set(stats["hit_ratio"])
+    cache_entries.set(stats["entries"])
+
+disk_cache_bytes = registry.register(Gauge(
+    "linkedin_mcp_disk_cache_bytes", "Compressed bytes held in the on-disk cache tier"
+))
+disk_cache_entries = registry.register(Gauge(
+    "linkedin_mcp_disk_cache_entries", "Entries held in the on-disk cache tier"
+))
+
+def _collect_disk_cache_stats() -> None:
+    if response_cache.disk is None or not response_cache.disk.enabled:
+        return
+    stats = response_cache.disk.stats()
+    disk_cache_bytes.set(stats["bytes"])
+    disk_cache_entries.set(stats["entries"])
+
+coalesced_calls = registry.register(Counter(
+    "linkedin_mcp_coalesced_calls_total", "Service calls, by whether they led or shared an upstream call", ("role",)
+))
+
+def _collect_single_flight_stats() -> None:
+    stats = upstream_flight.stats()
+    coalesced_calls.set_total(stats["leaders"], role="leader")
+    coalesced_calls.set_total(stats["shared"], role="shared")
+
+registry.add_collector(_collect_cache_stats)
+registry.add_collector(_collect_disk_cache_stats)
+registry.add_collector(_collect_single_flight_stats)
+
+def _record_result(name: str, result: Any, started: float) -> Any:
+    tool_duration.observe(time.perf_counter() - started, tool=name)
+    if isinstance(result, dict) and result.get("success") is False:
+        tool_errors.inc(tool=name, error_type="failed_result")
+    # Services hand back compact records; tool results leave the server as plain dicts
+    return to_payload(result)
+
+def instrument_tool(func: Callable) -> Callable:
+    """Record latency, in-flight count and errors of an MCP tool function, converting records in its result to dicts"""
+    name = func.__name__
+
+    if asyncio.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            tool_in_flight.inc(tool=name)
+            started = time.perf_counter()
+            try:
+                result = await func(*args, **kwargs)
+            except BaseException as e:
+                tool_duration.observe(time.perf_counter() - started, tool=name)
+                tool_errors.inc(tool=name, error_type=type(e).__name__)
+                raise
+            finally:
+                tool_in_flight.dec(tool=name)
+            return _record_result(name, result, started)
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        tool_in_flight.inc(tool=name)
+        started = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            tool_duration.observe(time.perf_counter() - started, tool=name)
+            tool_errors.inc(tool=name, error_type=type(e).__name__)
+            raise
+        finally:
+            tool_in_flight.dec(tool=name)
+        return _record_result(name, result, started)
+    return wrapper
+
+def observe_upstream(method: str, func: Callable, *args, **kwargs) -> Any:
+    """Run a linkedin_api call, recording its latency and errors"""
+    token = current_upstream_method.set(method)
+    started = time.perf_counter()
+    try:
+        return func(*args, **kwargs)
+    except Exception as e:
+        upstream_errors.inc(method=method, error_type=type(e).__name__)
+        raise
+    finally:
+        upstream_duration.observe(time.perf_counter() - started, method=method)
+        current_upstream_method.reset(token)
+
+def record_response_bytes(response: Any, *args, **kwargs) -> None:
+    """requests response hook counting received bytes per linkedin_api method"""
+    try:
+        size = int(response.headers.get("Content-Length") or len(response.content))
+    except Exception:
+        return
+    upstream_bytes.inc(size, method=current_upstream_method.get())
+
+def render_prometheus() -> str:
+    return registry.render()
+
+def _label_sample(line: str, label: str) -> str:
+    name, brace, rest = line.partition("{")
+    if brace:
+        return f"{name}{{{label},{rest}"
+    name, _, value = line.partition(" ")
+    return f"{name}{{{label}}} {value}"
+
+def merge_prometheus(texts: Dict[str, str], label: str) -> str:
+    """Merge the metrics of several processes into one exposition, telling their samples apart by label"""
+    # Each family's samples stay together, after its HELP and TYPE lines written once
+    families: Dict[str, List[str]] = {}
+    headers = set()
+    for source, text in texts.items():
+        extra = f'{label}="{_escape(source)}"'
+        family = None
+        for line in text.splitlines():
+            if line.startswith("# "):
+                family = line.split(" ", 3)[2]
+                family_lines = families.setdefault(family, [])
+                if line not in headers:
+                    headers.add(line)
+                    family_lines.append(line)
+            elif line and family is not None:
+                families[family].append(_label_sample(line, extra))
+    lines = [line for family_lines in families.values() for line in family_lines]
+    return "\n".join(lines) + "\n" if lines else ""
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] not in ("/metrics", "/"):
+            self.send_error(404)
+            return
+        body = self.server.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+def start_metrics_server(port: int, host: str = "127.0.0.1", render: Callable[[], str] = render_prometheus) -> Optional[ThreadingHTTPServer]:
+    """Serve /metrics over HTTP on a daemon thread, rendered by render"""
+    try:
+        server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    except OSError as e:
+        logger.error(f"Could not start metrics server on {host}:{port}: {str(e)}")
+        return None
+    server.render = render
+    thread = threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True)
+    thread.start()
+    logger.info(f"Serving Prometheus metrics on http://{host}:{port}/metrics")
+    return server
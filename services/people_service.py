@@ -1,6 +1,9 @@
-from typing import Dict, Any
+from typing import Dict, Any, List
 from datetime import datetime
 from config.linkedin_config import logger
+from services.executor import run_blocking
+from services.profile_service import ProfileService
+from services.records import Person, parse_records, to_payload
 
 class PeopleService:
     @staticmethod
@@ -10,14 +13,15 @@ class PeopleService:
             raise Exception("Not authenticated with LinkedIn")
         
         try:
-            people = linkedin_client.linkedin_client.search_people(
+            people = linkedin_client.call(
+                "search_people",
                 keywords=keywords,
                 limit=limit
             )
             
             return {
                 "success": True,
-                "people": people,
+                "people": parse_records(Person, people),
                 "count": len(people) if people else 0,
                 "retrieved_at": datetime.now().isoformat()
             }
@@ -27,3 +31,43 @@ class PeopleService:
                 "success": False,
                 "error": str(e)
             }
+    
+    @staticmethod
+    async def search_people_async(linkedin_client: Any, keywords: str, limit: int = 10) -> Dict[str, Any]:
+        """Async variant of search_people that runs on the blocking executor"""
+        return await run_blocking(PeopleService.search_people, linkedin_client, keywords, limit)
+    
+    @staticmethod
+    async def search_people_hydrated_async(linkedin_client: Any, keywords: str, limit: int = 10, fields: List[str] = None) -> Dict[str, Any]:
+        """Search for people and attach each hit's full profile, fetched concurrently"""
+        result = await PeopleService.search_people_async(linkedin_client, keywords, limit)
+        if not result.get("success") or not result.get("people"):
+            return result
+        
+        people = result["people"]
+        profiles = await ProfileService.get_profiles_many_async(
+            linkedin_client,
+            [person.get("urn_id") for person in people],
+            fields
+        )
+        if not profiles.get("success") and "results" not in profiles:
+            return {**result, "hydration_error": profiles.get("error")}
+        
+        by_id = {entry["profile_id"]: entry for entry in profiles["results"]}
+        hydrated = []
+        for person in people:
+            entry = by_id.get(str(person.get("urn_id") or "").strip())
+            person = dict(to_payload(person))
+            if entry is None:
+                person["profile_error"] = "Search result has no urn_id"
+            elif entry["success"]:
+                person["profile"] = entry["profile"]
+            else:
+                person["profile_error"] = entry["error"]
+            hydrated.append(person)
+        
+        return {
+            **result,
+            "people": hydrated,
+            "hydrated": profiles["succeeded"]
+        }
@@ -0,0 +1,79 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+from config.linkedin_config import STATE_DIR
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS high_water_marks (
+    account TEXT NOT NULL,
+    profile_id TEXT NOT NULL,
+    newest_urn TEXT NOT NULL,
+    newest_timestamp INTEGER,
+    synced_at REAL NOT NULL,
+    PRIMARY KEY (account, profile_id)
+);
+"""
+
+class PostSyncStore:
+    """Per-account, per-profile high-water marks of the newest post seen"""
+
+    def __init__(self, path: str = None):
+        self.path = path or os.environ.get("LINKEDIN_MCP_POST_SYNC", os.path.join(STATE_DIR, "post_sync.db"))
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self.path != ":memory:":
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def get(self, account: str, profile_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT newest_urn, newest_timestamp, synced_at FROM high_water_marks WHERE account = ? AND profile_id = ?",
+                (account, profile_id)
+            ).fetchone()
+        return dict(row) if row else None
+
+    def set(self, account: str, profile_id: str, newest_urn: str, newest_timestamp: Optional[int]) -> None:
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    """
+                    INSERT INTO high_water_marks (account, profile_id, newest_urn, newest_timestamp, synced_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT(account, profile_id) DO UPDATE SET
+                        newest_urn = excluded.newest_urn,
+                        newest_timestamp = excluded.newest_timestamp,
+                        synced_at = excluded.synced_at
+                    """,
+                    (account, profile_id, newest_urn, newest_timestamp, time.time())
+                )
+
+    def touch(self, account: str, profile_id: str) -> None:
+        """Record a sync that found nothing new"""
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "UPDATE high_water_marks SET synced_at = ? WHERE account = ? AND profile_id = ?",
+                    (time.time(), account, profile_id)
+                )
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+# High-water marks shared by all post syncs
+post_sync_store = PostSyncStore()
@@ -1,29 +1,143 @@
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 from config.linkedin_config import logger
+from services.cache import response_cache
+from services.executor import run_blocking
+from services.projection import project, project_result
+from services.post_sync import post_sync_store
+from services.records import Post, parse_records
 
 class PostsService:
     @staticmethod
-    def get_posts(linkedin_client: Any, profile_id: str = None, limit: int = 10) -> Dict[str, Any]:
-        """Get posts from a LinkedIn profile"""
+    def get_posts(linkedin_client: Any, profile_id: str = None, limit: int = 10, bypass_cache: bool = False, fields: List[str] = None) -> Dict[str, Any]:
+        """Get posts from a LinkedIn profile, optionally projected to the requested fields"""
         if not linkedin_client.authenticated:
             raise Exception("Not authenticated with LinkedIn")
         
+        cache_key = response_cache.make_key(linkedin_client.account_id, "get_posts", profile_id, limit)
+        if not bypass_cache:
+            cached = PostsService._cached_posts(linkedin_client, profile_id, limit, cache_key)
+            if cached is not None:
+                return project_result("post", cached, "posts", fields)
+        
+        result = PostsService._fetch_posts_result(linkedin_client, profile_id, limit, cache_key)
+        return project_result("post", result, "posts", fields)
+    
+    @staticmethod
+    async def get_posts_async(linkedin_client: Any, profile_id: str = None, limit: int = 10, bypass_cache: bool = False, fields: List[str] = None) -> Dict[str, Any]:
+        """Async variant of get_posts that runs on the blocking executor"""
+        if not bypass_cache and linkedin_client.authenticated:
+            # Warm keys are answered on the event loop, without waiting for an executor slot
+            cache_key = response_cache.make_key(linkedin_client.account_id, "get_posts", profile_id, limit)
+            cached = PostsService._cached_posts(linkedin_client, profile_id, limit, cache_key, memory_only=True)
+            if cached is not None:
+                return project_result("post", cached, "posts", fields)
+            # Memory was checked above, so the executor only reads the disk tier before fetching
+            bypass_cache = not response_cache.persisted(cache_key)
+        return await run_blocking(PostsService.get_posts, linkedin_client, profile_id, limit, bypass_cache, fields)
+    
+    @staticmethod
+    def _cached_posts(linkedin_client: Any, profile_id: str, limit: int, cache_key: Tuple, memory_only: bool = False) -> Optional[Dict[str, Any]]:
+        """Cached posts result, refreshed in the background when stale"""
+        return response_cache.get_or_revalidate(
+            cache_key,
+            lambda: PostsService._fetch_posts_result(linkedin_client, profile_id, limit, cache_key),
+            memory_only
+        )
+    
+    @staticmethod
+    def _fetch_posts_result(linkedin_client: Any, profile_id: str, limit: int, cache_key: Tuple) -> Dict[str, Any]:
         try:
-            if profile_id:
-                posts = linkedin_client.linkedin_client.get_profile_posts(profile_id, post_count=limit)
-            else:
-                posts = linkedin_client.linkedin_client.get_profile_posts(post_count=limit)
+            posts = PostsService._fetch_posts(linkedin_client, profile_id, limit)
             
-            return {
+            result = {
                 "success": True,
                 "posts": posts,
                 "count": len(posts) if posts else 0,
                 "retrieved_at": datetime.now().isoformat()
             }
+            response_cache.set(cache_key, result)
+            return result
         except Exception as e:
             logger.error(f"Error retrieving posts: {str(e)}")
             return {
                 "success": False,
                 "error": str(e)
             }
+    
+    @staticmethod
+    def _fetch_posts(linkedin_client: Any, profile_id: str, count: int) -> List[Post]:
+        if profile_id:
+            return parse_records(Post, linkedin_client.call("get_profile_posts", profile_id, post_count=count))
+        return parse_records(Post, linkedin_client.call("get_profile_posts", post_count=count))
+    
+    @staticmethod
+    def sync_posts(linkedin_client: Any, profile_id: str = None, max_posts: int = 50, initial_window: int = 5,
+                   fields: List[str] = None, mark_key: str = None) -> Dict[str, Any]:
+        """Fetch only posts newer than the profile's stored high-water mark, kept under mark_key if given"""
+        if not linkedin_client.authenticated:
+            raise Exception("Not authenticated with LinkedIn")
+        
+        account = linkedin_client.account_id
+        sync_id = mark_key or profile_id or "me"
+        try:
+            mark = post_sync_store.get(account, sync_id)
+            
+            # linkedin_api pages internally and only takes a post count, so grow the
+            # window until it reaches a known post instead of fetching max_posts up front
+            window = min(max_posts, max(1, initial_window)) if mark else max_posts
+            upstream_requests = 0
+            while True:
+                posts = PostsService._fetch_posts(linkedin_client, profile_id, window)
+                upstream_requests += 1
+                if not mark:
+                    new_posts = posts
+                    break
+                new_posts, reached_mark = PostsService._posts_after_mark(posts, mark)
+                if reached_mark or len(posts) < window or window >= max_posts:
+                    break
+                window = min(max_posts, window * 2)
+            
+            newest = max(new_posts, key=lambda post: post.timestamp or 0, default=None)
+            if newest is not None and newest.urn:
+                post_sync_store.set(account, sync_id, newest.urn, newest.timestamp)
+            elif mark:
+                post_sync_store.touch(account, sync_id)
+            
+            return {
+                "success": True,
+                "new_posts": project("post", new_posts, fields),
+                "new_count": len(new_posts),
+                "unchanged_count": len(posts) - len(new_posts),
+                "first_sync": mark is None,
+                "upstream_requests": upstream_requests,
+                "high_water_mark": post_sync_store.get(account, sync_id),
+                "retrieved_at": datetime.now().isoformat()
+            }
+        except Exception as e:
+            logger.error(f"Error syncing posts: {str(e)}")
+            return {
+                "success": False,
+                "error": str(e)
+            }
+    
+    @staticmethod
+    def _posts_after_mark(posts: List[Post], mark: Dict[str, Any]) -> Tuple[List[Post], bool]:
+        """Posts newer than the mark, and whether the window reaches back to it"""
+        # The feed is newest first, so every post above the marked one is new, whatever its timestamp says
+        for index, post in enumerate(posts):
+            if post.urn == mark["newest_urn"]:
+                return posts[:index], True
+        # The marked post is not in this window (or was deleted); timestamps can only place
+        # the window when both sides have one, otherwise every post is new and the window grows
+        mark_timestamp = mark["newest_timestamp"]
+        if not mark_timestamp or not posts or not posts[-1].timestamp:
+            return posts, False
+        new_posts = [post for post in posts if post.timestamp is None or post.timestamp > mark_timestamp]
+        return new_posts, posts[-1].timestamp <= mark_timestamp
+    
+    @staticmethod
+    async def sync_posts_async(linkedin_client: Any, profile_id: str = None, max_posts: int = 50, initial_window: int = 5,
+                               fields: List[str] = None) -> Dict[str, Any]:
+        """Async variant of sync_posts that runs on the blocking executor"""
+        return await run_blocking(PostsService.sync_posts, linkedin_client, profile_id, max_posts, initial_window, fields)
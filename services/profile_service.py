@@ -1,28 +1,104 @@
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 from config.linkedin_config import logger
+from services.cache import response_cache
+from services.executor import blocking_executor, run_blocking
+from services.batch import batch_result, batch_too_large, dedupe_ids, fetch_many
+from services.projection import project_result
+from services.single_flight import upstream_flight
 
 class ProfileService:
     @staticmethod
-    def get_profile(linkedin_client: Any, profile_id: str = None) -> Dict[str, Any]:
-        """Get LinkedIn profile information"""
+    def get_profile(linkedin_client: Any, profile_id: str = None, bypass_cache: bool = False, fields: List[str] = None) -> Dict[str, Any]:
+        """Get LinkedIn profile information, optionally projected to the requested fields"""
         if not linkedin_client.authenticated:
             raise Exception("Not authenticated with LinkedIn")
         
+        cache_key = response_cache.make_key(linkedin_client.account_id, "get_profile", profile_id)
+        if not bypass_cache:
+            cached = ProfileService._cached_profile(linkedin_client, profile_id, cache_key)
+            if cached is not None:
+                return project_result("profile", cached, "profile", fields)
+        
+        # Concurrent identical requests share a single upstream call
+        fetched = upstream_flight.do(cache_key, lambda: ProfileService._fetch_profile(linkedin_client, profile_id, cache_key))
+        return project_result("profile", fetched, "profile", fields)
+    
+    @staticmethod
+    def _cached_profile(linkedin_client: Any, profile_id: str, cache_key: Tuple, memory_only: bool = False) -> Optional[Dict[str, Any]]:
+        """Cached profile result, refreshed in the background when stale"""
+        return response_cache.get_or_revalidate(
+            cache_key,
+            lambda: ProfileService._fetch_profile(linkedin_client, profile_id, cache_key),
+            memory_only
+        )
+    
+    @staticmethod
+    def _fetch_profile(linkedin_client: Any, profile_id: str, cache_key: Tuple) -> Dict[str, Any]:
         try:
             if profile_id:
-                profile = linkedin_client.linkedin_client.get_profile(profile_id)
+                profile = linkedin_client.call("get_profile", profile_id)
             else:
-                profile = linkedin_client.linkedin_client.get_profile()
+                profile = linkedin_client.call("get_profile")
             
-            return {
+            result = {
                 "success": True,
                 "profile": profile,
                 "retrieved_at": datetime.now().isoformat()
             }
+            response_cache.set(cache_key, result)
+            return result
         except Exception as e:
             logger.error(f"Error retrieving profile: {str(e)}")
             return {
                 "success": False,
                 "error": str(e)
             }
+    
+    @staticmethod
+    async def get_profile_async(linkedin_client: Any, profile_id: str = None, bypass_cache: bool = False, fields: List[str] = None) -> Dict[str, Any]:
+        """Async variant of get_profile that runs on the blocking executor"""
+        if not linkedin_client.authenticated:
+            raise Exception("Not authenticated with LinkedIn")
+        
+        cache_key = response_cache.make_key(linkedin_client.account_id, "get_profile", profile_id)
+        if not bypass_cache:
+            # Warm keys are answered on the event loop, without waiting for an executor slot;
+            # the disk tier may block, so it is read on the executor
+            cached = ProfileService._cached_profile(linkedin_client, profile_id, cache_key, memory_only=True)
+            if cached is None and response_cache.persisted(cache_key):
+                cached = await run_blocking(ProfileService._cached_profile, linkedin_client, profile_id, cache_key)
+            if cached is not None:
+                return project_result("profile", cached, "profile", fields)
+        # The cache was checked above, so the executor only fetches; the fetch goes
+        # straight to _fetch_profile so the shared call is led (and counted) once
+        result = await upstream_flight.do_async(
+            cache_key,
+            lambda: run_blocking(ProfileService._fetch_profile, linkedin_client, profile_id, cache_key)
+        )
+        return project_result("profile", result, "profile", fields)
+    
+    @staticmethod
+    async def get_profiles_many_async(linkedin_client: Any, profile_ids: List[str], fields: List[str] = None, bypass_cache: bool = False, max_concurrency: int = None) -> Dict[str, Any]:
+        """Get several profiles concurrently, optionally keeping only the requested fields"""
+        if not linkedin_client.authenticated:
+            raise Exception("Not authenticated with LinkedIn")
+        
+        ids = dedupe_ids(profile_ids)
+        too_large = batch_too_large(ids, "profile IDs")
+        if too_large:
+            return too_large
+        
+        def lookup_cached(profile_id: str):
+            if bypass_cache:
+                return None
+            # Memory only: misses are looked up on disk by the executor
+            return response_cache.get(response_cache.make_key(linkedin_client.account_id, "get_profile", profile_id), memory_only=True)
+        
+        results = await fetch_many(
+            ids,
+            lookup_cached,
+            lambda profile_id: ProfileService.get_profile_async(linkedin_client, profile_id, bypass_cache),
+            max_concurrency or blocking_executor.max_concurrency
+        )
+        return batch_result(ids, results, "profile_id", "profile", fields)
@@ -0,0 +1,138 @@
+import functools
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from services.records import to_payload
+
+# Path step mapping over list items, e.g. "experience[].companyName"
+LIST_STEP = "[]"
+# Path step matching every key of a dict, e.g. "companyDetails.*.companyResolutionResult.name"
+ANY_STEP = "*"
+
+_MISSING = object()
+
+# Curated field sets per entity type, selectable by name through fields=
+PRESETS: Dict[str, Dict[str, Tuple[str, ...]]] = {
+    "profile": {
+        "summary": (
+            "firstName", "lastName", "headline", "locationName", "industryName",
+            "public_id", "profile_id", "entityUrn",
+            "experience[].title", "experience[].companyName", "experience[].timePeriod",
+            "education[].schoolName", "education[].degreeName",
+            "skills[].name"
+        )
+    },
+    "job": {
+        "summary": (
+            "jobPostingId", "title", "formattedLocation", "listedAt", "workRemoteAllowed",
+            "companyDetails.*.companyResolutionResult.name",
+            "applyMethod.*.companyApplyUrl"
+        )
+    },
+    "post": {
+        "summary": (
+            "updateMetadata.urn", "actor.name.text", "commentary.text.text",
+            "socialDetail.totalSocialActivityCounts.numLikes",
+            "socialDetail.totalSocialActivityCounts.numComments"
+        )
+    }
+}
+
+def _parse_path(path: str) -> List[str]:
+    steps = []
+    for part in path.strip().split("."):
+        list_steps = 0
+        while part.endswith(LIST_STEP):
+            part = part[:-len(LIST_STEP)]
+            list_steps += 1
+        if part:
+            steps.append(part)
+        steps.extend([LIST_STEP] * list_steps)
+    return steps
+
+def _build_tree(paths: Iterable[str]) -> Any:
+    """Merge selector paths into a tree where True marks a fully kept subtree"""
+    tree: Dict[str, Any] = {}
+    for path in paths:
+        steps = _parse_path(path)
+        if not steps:
+            continue
+        node = tree
+        for step in steps[:-1]:
+            child = node.get(step)
+            if child is True:
+                break
+            node = node.setdefault(step, {})
+        else:
+            node[steps[-1]] = True
+    return tree
+
+def _compile(node: Any) -> Callable[[Any], Any]:
+    if node is True:
+        return lambda data: data
+
+    keyed = [(key, _compile(child)) for key, child in node.items() if key not in (LIST_STEP, ANY_STEP)]
+    any_child = _compile(node[ANY_STEP]) if ANY_STEP in node else None
+    list_child = _compile(node[LIST_STEP]) if LIST_STEP in node else None
+
+    def select_dict(data: Any) -> Any:
+        if not isinstance(data, dict):
+            return _MISSING
+        out = {}
+        for key, child in keyed:
+            if key in data:
+                value = child(data[key])
+                if value is not _MISSING:
+                    out[key] = value
+        if any_child is not None:
+            for key, item in data.items():
+                if key not in out:
+                    value = any_child(item)
+                    if value is not _MISSING:
+                        out[key] = value
+        return out if out else _MISSING
+
+    def select(data: Any) -> Any:
+        # Lists are mapped item by item, with or without an explicit [] step
+        if isinstance(data, list):
+            item_select = list_child or select_dict
+            items = [item_select(item) for item in data]
+            return [item for item in items if item is not _MISSING]
+        return select_dict(data)
+
+    return select
+
+class Projection:
+    """Precompiled set of path selectors applied to nested dicts and lists"""
+
+    def __init__(self, fields: Tuple[str, ...]):
+        self.fields = fields
+        self._select = _compile(_build_tree(fields))
+
+    def apply(self, data: Any) -> Any:
+        result = self._select(data)
+        if result is _MISSING:
+            return [] if isinstance(data, list) else {}
+        return result
+
+@functools.lru_cache(maxsize=256)
+def compile_projection(fields: Tuple[str, ...]) -> Projection:
+    return Projection(fields)
+
+def resolve_fields(entity: str, fields: Optional[Iterable[str]]) -> Tuple[str, ...]:
+    """Expand preset names such as "summary" into their selector paths"""
+    presets = PRESETS.get(entity, {})
+    resolved = []
+    for field in fields or ():
+        resolved.extend(presets.get(field, (field,)))
+    return tuple(dict.fromkeys(resolved))
+
+def project(entity: str, data: Any, fields: Optional[List[str]]) -> Any:
+    """Keep only the requested fields of an entity payload; no fields keeps everything"""
+    if not fields or data is None:
+        return data
+    return compile_projection(resolve_fields(entity, fields)).apply(to_payload(data))
+
+def project_result(entity: str, result: Dict[str, Any], key: str, fields: Optional[List[str]]) -> Dict[str, Any]:
+    """Copy a service result with its payload under key projected to the requested fields"""
+    if not fields or key not in result:
+        return result
+    return {**result, key: project(entity, result[key], fields)}
@@ -0,0 +1,162 @@
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+from config.linkedin_config import RateLimitConfig, logger
+from services.deadline import check_deadline, sleep_within_deadline
+
+# Status codes LinkedIn answers with when it throttles an account
+THROTTLE_STATUS_CODES = (429, 999)
+
+class LinkedInThrottledError(Exception):
+    """Raised when LinkedIn throttles a request or the rate-limit queue times out"""
+
+    def __init__(self, message: str, status_code: int = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously at a fixed rate"""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self) -> float:
+        """Take a token if available; otherwise return the seconds until one is"""
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            self._refill(time.monotonic())
+            return {
+                "tokens": round(self._tokens, 2),
+                "capacity": self.capacity,
+                "rate_per_second": self.rate
+            }
+
+class RateLimiter:
+    """Per-endpoint token buckets with jittered exponential backoff on throttling"""
+
+    def __init__(self, config: RateLimitConfig = None, namespace: str = "", state: Optional[Any] = None):
+        self.config = config or RateLimitConfig()
+        # With a shared RateStateStore, buckets and backoff are common to every process using namespace
+        self.namespace = namespace
+        self.state = state
+        self._global = self._new_bucket("global", self.config.global_rate)
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+        self._blocked_until = 0.0
+        self._consecutive_throttles = 0
+        self.throttled_total = 0
+        self.waiting = 0
+
+    def _bucket(self, endpoint: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(endpoint)
+            if bucket is None:
+                rate = self.config.endpoint_rates.get(endpoint, self.config.default_rate)
+                bucket = self._buckets[endpoint] = self._new_bucket(endpoint, rate)
+            return bucket
+
+    def _new_bucket(self, name: str, rate: Tuple[float, int]) -> TokenBucket:
+        if self.state is None:
+            return TokenBucket(*rate)
+        return self.state.bucket(f"{self.namespace}:{name}", *rate)
+
+    def _backoff_remaining(self) -> float:
+        remaining = self._blocked_until - time.monotonic()
+        if self.state is not None:
+            remaining = max(remaining, self.state.blocked_until(self.namespace) - time.time())
+        return remaining
+
+    def _wait_for(self, bucket: TokenBucket, deadline: float, endpoint: str) -> None:
+        while True:
+            # Nobody takes a token while a backoff period is running
+            blocked = self._backoff_remaining()
+            wait = blocked if blocked > 0 else bucket.try_acquire()
+            if wait <= 0:
+                return
+            # A call that cannot wait this long gives up on its own, without counting against the account
+            stage = f"waiting for the {endpoint} rate limit"
+            check_deadline(stage, wait)
+            if time.monotonic() + wait > deadline:
+                raise LinkedInThrottledError(f"Rate limit queue timeout for {endpoint}")
+            sleep_within_deadline(wait, stage)
+
+    def acquire(self, endpoint: str, timeout: float = None) -> None:
+        """Block until both the endpoint and the global bucket grant a token"""
+        deadline = time.monotonic() + (self.config.queue_timeout if timeout is None else timeout)
+        with self._lock:
+            self.waiting += 1
+        try:
+            self._wait_for(self._bucket(endpoint), deadline, endpoint)
+            self._wait_for(self._global, deadline, endpoint)
+        finally:
+            with self._lock:
+                self.waiting -= 1
+
+    def record_throttle(self) -> float:
+        """Push back every queued call after a throttled response; return the delay"""
+        with self._lock:
+            self._consecutive_throttles += 1
+            self.throttled_total += 1
+            backoff = min(
+                self.config.backoff_max,
+                self.config.backoff_base * (2 ** (self._consecutive_throttles - 1))
+            )
+            # Jitter spreads retries out, but never past backoff_max
+            delay = min(self.config.backoff_max, backoff * random.uniform(0.5, 1.5))
+            self._blocked_until = max(self._blocked_until, time.monotonic() + delay)
+        if self.state is not None:
+            self.state.block(self.namespace, time.time() + delay)
+        return delay
+
+    def record_success(self) -> None:
+        if self._consecutive_throttles:
+            with self._lock:
+                self._consecutive_throttles = 0
+
+    def call(self, endpoint: str, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run func under the endpoint's rate limit, retrying throttled calls with backoff"""
+        for attempt in range(self.config.max_retries + 1):
+            # Abandoned calls stop here instead of retrying
+            check_deadline(f"calling {endpoint}" if attempt == 0 else f"retrying {endpoint}")
+            self.acquire(endpoint)
+            try:
+                result = func(*args, **kwargs)
+            except LinkedInThrottledError as e:
+                delay = self.record_throttle()
+                if attempt == self.config.max_retries:
+                    raise
+                logger.warning(f"LinkedIn throttled {endpoint} ({e.status_code}), backing off {delay:.1f}s")
+                continue
+            self.record_success()
+            return result
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current bucket levels and backoff state"""
+        backoff_remaining = max(0.0, self._backoff_remaining())
+        with self._lock:
+            buckets = dict(self._buckets)
+            state = {
+                "waiting": self.waiting,
+                "throttled_total": self.throttled_total,
+                "consecutive_throttles": self._consecutive_throttles,
+                "backoff_remaining_seconds": round(backoff_remaining, 2)
+            }
+        state["global"] = self._global.snapshot()
+        state["endpoints"] = {name: bucket.snapshot() for name, bucket in buckets.items()}
+        return state
@@ -0,0 +1,179 @@
+import itertools
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+from config.linkedin_config import RateLimitConfig
+from services.rate_limiter import TokenBucket
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS buckets (
+    name TEXT PRIMARY KEY,
+    tokens REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS backoff (
+    namespace TEXT PRIMARY KEY,
+    blocked_until REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS slots (
+    holder TEXT PRIMARY KEY,
+    account TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS slots_account ON slots (account);
+"""
+
+class RateStateStore:
+    """SQLite file through which server processes on one host share token buckets, throttling backoff
+    and each account's in-flight calls"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._holders = itertools.count()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            # Autocommit, so every token is taken in its own short BEGIN IMMEDIATE transaction
+            conn = sqlite3.connect(self.path, check_same_thread=False, timeout=10.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def _tokens(self, conn: sqlite3.Connection, name: str, rate: float, capacity: int, now: float) -> float:
+        row = conn.execute("SELECT tokens, updated_at FROM buckets WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            return float(capacity)
+        return min(capacity, row[0] + max(0.0, now - row[1]) * rate)
+
+    def try_acquire(self, name: str, rate: float, capacity: int) -> float:
+        """Take a token from the named bucket; otherwise return the seconds until one is available"""
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                tokens = self._tokens(conn, name, rate, capacity, now)
+                wait = 0.0
+                if tokens >= 1:
+                    tokens -= 1
+                else:
+                    wait = (1 - tokens) / rate
+                conn.execute(
+                    "INSERT OR REPLACE INTO buckets (name, tokens, updated_at) VALUES (?, ?, ?)",
+                    (name, tokens, now)
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            return wait
+
+    def tokens(self, name: str, rate: float, capacity: int) -> float:
+        with self._lock:
+            return self._tokens(self._connection(), name, rate, capacity, time.time())
+
+    def blocked_until(self, namespace: str) -> float:
+        """Wall-clock time until which every process holds back the namespace's calls"""
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT blocked_until FROM backoff WHERE namespace = ?", (namespace,)
+            ).fetchone()
+        return row[0] if row else 0.0
+
+    def block(self, namespace: str, until: float) -> None:
+        with self._lock:
+            self._connection().execute(
+                """
+                INSERT INTO backoff (namespace, blocked_until) VALUES (?, ?)
+                ON CONFLICT(namespace) DO UPDATE SET blocked_until = MAX(blocked_until, excluded.blocked_until)
+                """,
+                (namespace, until)
+            )
+
+    def hold_slot(self, account: str, limit: int, lease: float) -> Optional[str]:
+        """Take one of the account's in-flight slots shared by all processes, returning its holder ID,
+        or None while every slot is taken; a slot that is never released lapses after lease seconds"""
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                conn.execute("DELETE FROM slots WHERE expires_at <= ?", (now,))
+                held = conn.execute("SELECT COUNT(*) FROM slots WHERE account = ?", (account,)).fetchone()[0]
+                holder = None
+                if held < limit:
+                    holder = f"{os.getpid()}:{next(self._holders)}"
+                    conn.execute(
+                        "INSERT INTO slots (holder, account, expires_at) VALUES (?, ?, ?)",
+                        (holder, account, now + lease)
+                    )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            return holder
+
+    def release_slot(self, holder: str) -> None:
+        with self._lock:
+            self._connection().execute("DELETE FROM slots WHERE holder = ?", (holder,))
+
+    def release_process(self, pid: int) -> int:
+        """Free the slots a process held, once it has exited"""
+        with self._lock:
+            return self._connection().execute("DELETE FROM slots WHERE holder LIKE ?", (f"{pid}:%",)).rowcount
+
+    def slots_held(self, account: str) -> int:
+        """In-flight calls of the account across all processes"""
+        with self._lock:
+            return self._connection().execute(
+                "SELECT COUNT(*) FROM slots WHERE account = ? AND expires_at > ?", (account, time.time())
+            ).fetchone()[0]
+
+    def bucket(self, name: str, rate: float, capacity: int) -> "SharedTokenBucket":
+        return SharedTokenBucket(self, name, rate, capacity)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+class SharedTokenBucket(TokenBucket):
+    """Token bucket whose level lives in a RateStateStore, so all processes draw from one budget"""
+
+    def __init__(self, store: RateStateStore, name: str, rate: float, capacity: int):
+        super().__init__(rate, capacity)
+        self.store = store
+        self.name = name
+
+    def try_acquire(self) -> float:
+        return self.store.try_acquire(self.name, self.rate, self.capacity)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "tokens": round(self.store.tokens(self.name, self.rate, self.capacity), 2),
+            "capacity": self.capacity,
+            "rate_per_second": self.rate,
+            "shared": True
+        }
+
+_store: Optional[RateStateStore] = None
+_store_lock = threading.Lock()
+
+def shared_rate_state(config: RateLimitConfig = None) -> Optional[RateStateStore]:
+    """The process-wide store named by RateLimitConfig.shared_state, or None when limits are per process"""
+    global _store
+    path = (config or RateLimitConfig()).shared_state
+    if not path:
+        return None
+    with _store_lock:
+        if _store is None or _store.path != path:
+            _store = RateStateStore(path)
+        return _store
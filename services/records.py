@@ -0,0 +1,200 @@
+import json
+import re
+import sys
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from services.job_index import extract_job_id
+
+_SCALARS = (str, int, float, bool)
+_ACTIVITY_URN = re.compile(r"urn:li:(?:activity|ugcPost|share):(\d+)")
+# 2003-01-01 in epoch milliseconds; LinkedIn activity IDs decode to later times
+_MIN_ACTIVITY_MS = 1041379200000
+_MISSING = object()
+
+def _take_leaf(data: Dict[str, Any], path: Tuple[str, ...]) -> Any:
+    """Remove a scalar at path from data, copying the objects on the way instead of changing them"""
+    key = path[0]
+    if len(path) == 1:
+        return data.pop(key) if isinstance(data.get(key), _SCALARS) else _MISSING
+    child = data.get(key)
+    if not isinstance(child, dict):
+        return _MISSING
+    child = dict(child)
+    value = _take_leaf(child, path[1:])
+    if value is not _MISSING:
+        # Objects left empty are rebuilt from the slots by to_dict
+        if child:
+            data[key] = child
+        else:
+            del data[key]
+    return value
+
+def _put_leaf(data: Dict[str, Any], path: Tuple[str, ...], value: Any) -> None:
+    """Set the value at path, copying the objects on the way so shared ones are left as they were"""
+    for key in path[:-1]:
+        child = data.get(key)
+        child = dict(child) if isinstance(child, dict) else {}
+        data[key] = child
+        data = child
+    data[path[-1]] = value
+
+class Record:
+    """Compact LinkedIn entity: scalar top-level fields in slots, everything else as compact JSON"""
+    __slots__ = ("_extra",)
+    # Top-level payload keys kept in slots of the same name when their value is a scalar
+    FIELDS: Tuple[str, ...] = ()
+    # Fields with few distinct values, interned so records share one string
+    INTERNED: Tuple[str, ...] = ()
+    # Slots holding scalars nested in the payload, by their path of keys
+    PATHS: Dict[str, Tuple[str, ...]] = {}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Record":
+        record = cls.__new__(cls)
+        extra = {}
+        for key, value in data.items():
+            if key in cls.FIELDS and isinstance(value, _SCALARS):
+                if key in cls.INTERNED and isinstance(value, str):
+                    value = sys.intern(value)
+                setattr(record, key, value)
+            else:
+                extra[key] = value
+        for slot, path in cls.PATHS.items():
+            value = _take_leaf(extra, path)
+            if value is not _MISSING:
+                if slot in cls.INTERNED and isinstance(value, str):
+                    value = sys.intern(value)
+                setattr(record, slot, value)
+        # Nested structures stay as parsed until the record is kept for longer (see compact)
+        record._extra = extra or None
+        return record
+
+    def compact(self) -> "Record":
+        """Encode the fields not kept in slots as compact JSON, for records held by a cache or store"""
+        extra = self._extra
+        if isinstance(extra, dict):
+            self._extra = json.dumps(extra, separators=(",", ":"), ensure_ascii=False).encode()
+        return self
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self.FIELDS:
+            return getattr(self, key, default)
+        if any(path[0] == key for path in self.PATHS.values()):
+            return self.to_dict().get(key, default)
+        return self.extra().get(key, default)
+
+    def extra(self) -> Dict[str, Any]:
+        """The payload fields not kept in slots, decoded when the record was compacted"""
+        extra = self._extra
+        if extra is None:
+            return {}
+        return extra if isinstance(extra, dict) else json.loads(extra)
+
+    def fields(self) -> Dict[str, Any]:
+        """Payload fields kept in slots"""
+        data = {}
+        for key in self.FIELDS:
+            try:
+                data[key] = getattr(self, key)
+            except AttributeError:
+                pass
+        return data
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = self.fields()
+        data.update(self.extra())
+        for slot, path in self.PATHS.items():
+            value = getattr(self, slot, _MISSING)
+            if value is not _MISSING:
+                _put_leaf(data, path, value)
+        return data
+
+    def __eq__(self, other: Any) -> bool:
+        return type(other) is type(self) and other.to_dict() == self.to_dict()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+class Job(Record):
+    """Job search result or job details"""
+    __slots__ = ("jobPostingId", "entityUrn", "title", "companyName", "formattedLocation", "listedAt", "workRemoteAllowed")
+    FIELDS = __slots__
+
+    @property
+    def job_id(self) -> Optional[str]:
+        return extract_job_id(self)
+
+class Person(Record):
+    """People search result"""
+    __slots__ = ("urn_id", "distance", "jobtitle", "location", "name")
+    FIELDS = __slots__
+    INTERNED = ("distance", "location")
+
+class Connection(Person):
+    """Entry of a profile's connections list"""
+    __slots__ = ()
+
+class Post(Record):
+    """Profile feed post, with its activity URN and creation time parsed up front"""
+    __slots__ = ("urn", "timestamp", "update_urn", "author", "text", "num_likes", "num_comments")
+    PATHS = {
+        "update_urn": ("updateMetadata", "urn"),
+        "author": ("actor", "name", "text"),
+        "text": ("commentary", "text", "text"),
+        "num_likes": ("socialDetail", "totalSocialActivityCounts", "numLikes"),
+        "num_comments": ("socialDetail", "totalSocialActivityCounts", "numComments")
+    }
+    # A profile's posts share one author
+    INTERNED = ("author",)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Post":
+        record = super().from_dict(data)
+        urn = _post_urn(data)
+        # The activity URN is usually the update URN itself; keep one string for both
+        record.urn = record.update_urn if urn is not None and urn == getattr(record, "update_urn", None) else urn
+        record.timestamp = _activity_timestamp(record.urn)
+        return record
+
+def _activity_timestamp(urn: Optional[str]) -> Optional[int]:
+    """Creation time in epoch milliseconds, carried in the leading 41 bits of real activity IDs"""
+    if not urn:
+        return None
+    timestamp = int(_ACTIVITY_URN.search(urn).group(1)) >> 22
+    # Small or synthetic IDs would decode to 1970
+    return timestamp if timestamp >= _MIN_ACTIVITY_MS else None
+
+def _post_urn(post: Dict[str, Any]) -> Optional[str]:
+    metadata = post.get("updateMetadata") or {}
+    for value in (metadata.get("urn"), post.get("urn"), post.get("entityUrn")):
+        match = _ACTIVITY_URN.search(str(value)) if value else None
+        if match:
+            return match.group(0)
+    return None
+
+def parse_records(record_type: type, items: Optional[Iterable[Any]]) -> List[Any]:
+    """Parse a linkedin_api result list, leaving anything that is not a dict as it is"""
+    return [record_type.from_dict(item) if isinstance(item, dict) else item for item in items or ()]
+
+def compact_records(value: Any) -> Any:
+    """Compact the records of a result, held directly or in a list under its top-level keys"""
+    items = value.values() if isinstance(value, dict) else (value,)
+    for item in items:
+        if isinstance(item, Record):
+            item.compact()
+        elif isinstance(item, list):
+            for record in item:
+                if isinstance(record, Record):
+                    record.compact()
+    return value
+
+def to_payload(value: Any) -> Any:
+    """Replace records nested in a result with plain dicts, copying only containers that hold one"""
+    if isinstance(value, Record):
+        return value.to_dict()
+    if isinstance(value, dict):
+        converted = {key: to_payload(item) for key, item in value.items()}
+        return value if all(converted[key] is value[key] for key in value) else converted
+    if isinstance(value, list):
+        converted = [to_payload(item) for item in value]
+        return value if all(new is old for new, old in zip(converted, value)) else converted
+    return value
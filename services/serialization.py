@@ -0,0 +1,126 @@
+import functools
+import inspect
+import json
+import os
+from datetime import date, datetime
+from typing import Any, Callable, Optional
+from services.records import Record
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+class EncodedResult(dict):
+    """Tool result that already carries its JSON encoding, so serializing it is a copy"""
+    __slots__ = ("encoded",)
+
+    @classmethod
+    def from_bytes(cls, encoded: bytes) -> "EncodedResult":
+        result = cls(loads(encoded))
+        result.encoded = encoded
+        return result
+
+def _default(value: Any) -> Any:
+    """Fallback for types the JSON backend does not handle itself"""
+    # instrument_tool hands tools' results over as plain dicts; records only get here from other callers
+    if isinstance(value, Record):
+        return value.to_dict()
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    if isinstance(value, bytes):
+        return value.decode("utf-8", "replace")
+    return str(value)
+
+class _OrjsonBackend:
+    name = "orjson"
+
+    def dumps(self, value: Any, indent: bool = False) -> bytes:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(value, default=_default, option=option)
+
+    def loads(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+class _MsgspecBackend:
+    name = "msgspec"
+
+    def __init__(self):
+        self._encoder = msgspec.json.Encoder(enc_hook=_default)
+
+    def dumps(self, value: Any, indent: bool = False) -> bytes:
+        encoded = self._encoder.encode(value)
+        return msgspec.json.format(encoded, indent=2) if indent else encoded
+
+    def loads(self, data: bytes) -> Any:
+        return msgspec.json.decode(data)
+
+class _JsonBackend:
+    name = "json"
+
+    def dumps(self, value: Any, indent: bool = False) -> bytes:
+        if indent:
+            return json.dumps(value, default=_default, indent=2).encode()
+        return json.dumps(value, default=_default, separators=(",", ":")).encode()
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+_BACKENDS = {
+    "orjson": (lambda: orjson is not None, _OrjsonBackend),
+    "msgspec": (lambda: msgspec is not None, _MsgspecBackend),
+    "json": (lambda: True, _JsonBackend)
+}
+
+def select_backend(name: Optional[str] = None) -> Any:
+    """Pick the named JSON backend if installed, else the fastest available one"""
+    if name in _BACKENDS and _BACKENDS[name][0]():
+        return _BACKENDS[name][1]()
+    for available, backend in _BACKENDS.values():
+        if available():
+            return backend()
+
+# Backend used for tool results; LINKEDIN_MCP_SERIALIZER forces orjson, msgspec or json
+backend = select_backend(os.environ.get("LINKEDIN_MCP_SERIALIZER"))
+
+def dumps(value: Any, indent: bool = False) -> bytes:
+    """Encode a tool result as UTF-8 JSON, reusing the encoding an EncodedResult carries"""
+    if isinstance(value, EncodedResult) and not indent:
+        return value.encoded
+    return backend.dumps(value, indent)
+
+def loads(data: bytes) -> Any:
+    return backend.loads(data)
+
+def serialize_tool_result(value: Any) -> str:
+    """FastMCP tool_serializer for every tool of this server"""
+    if isinstance(value, str):
+        return value
+    return dumps(value).decode()
+
+def encoded_tool(func: Callable) -> Callable:
+    """Wrap a tool for FastMCP 3+, which dropped tool_serializer: dict results are returned as a
+    ToolResult whose text is this module's encoding, so FastMCP does not encode them a second time"""
+    from fastmcp.tools import ToolResult
+    from mcp.types import TextContent
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        result = func(*args, **kwargs)
+        if inspect.isawaitable(result):
+            result = await result
+        if not isinstance(result, dict):
+            return result
+        return ToolResult(
+            content=[TextContent(type="text", text=dumps(result).decode())],
+            structured_content=result
+        )
+
+    return wrapper
@@ -0,0 +1,123 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+from requests.cookies import RequestsCookieJar, create_cookie
+from config.linkedin_config import STATE_DIR, logger
+
+# Cookies LinkedIn needs for an authenticated session
+AUTH_COOKIES = ("li_at", "JSESSIONID")
+
+# Used when the auth cookies carry no expiry of their own
+DEFAULT_SESSION_MAX_AGE = 7 * 24 * 3600
+
+# Treat sessions this close to expiry as already expired
+EXPIRY_SKEW = 300
+
+@dataclass
+class StoredSession:
+    """Cookies and CSRF token of a logged-in LinkedIn account"""
+    account: str
+    cookies: List[Dict[str, Any]]
+    csrf_token: Optional[str]
+    expires_at: float
+    saved_at: float
+
+    def is_valid(self, now: float = None) -> bool:
+        """Check that the session has its auth cookies and has not expired"""
+        now = time.time() if now is None else now
+        names = {cookie["name"] for cookie in self.cookies}
+        return all(name in names for name in AUTH_COOKIES) and now < self.expires_at - EXPIRY_SKEW
+
+    def cookie_jar(self) -> RequestsCookieJar:
+        """Rebuild a requests cookie jar from the stored cookies"""
+        jar = RequestsCookieJar()
+        for cookie in self.cookies:
+            jar.set_cookie(create_cookie(
+                name=cookie["name"],
+                value=cookie["value"],
+                domain=cookie.get("domain", ""),
+                path=cookie.get("path", "/"),
+                expires=cookie.get("expires"),
+                secure=cookie.get("secure", False)
+            ))
+        return jar
+
+class SessionStore:
+    """On-disk, per-account store of LinkedIn session cookies"""
+
+    def __init__(self, directory: str = None):
+        self.directory = directory or os.path.join(STATE_DIR, "sessions")
+
+    def _path(self, account: str) -> str:
+        digest = hashlib.sha256(account.encode("utf-8")).hexdigest()[:32]
+        return os.path.join(self.directory, f"{digest}.json")
+
+    def load(self, account: str) -> Optional[StoredSession]:
+        """Return the stored session for an account if it is still valid"""
+        try:
+            with open(self._path(account), "r", encoding="utf-8") as f:
+                data = json.load(f)
+            session = StoredSession(**data)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable session file: {str(e)}")
+            return None
+
+        if session.account != account or not session.is_valid():
+            return None
+        return session
+
+    def save(self, account: str, cookie_jar: RequestsCookieJar) -> StoredSession:
+        """Persist the cookies of a freshly authenticated client"""
+        now = time.time()
+        cookies = [
+            {
+                "name": cookie.name,
+                "value": cookie.value,
+                "domain": cookie.domain,
+                "path": cookie.path,
+                "expires": cookie.expires,
+                "secure": cookie.secure
+            }
+            for cookie in cookie_jar
+        ]
+        expiries = [
+            cookie["expires"] for cookie in cookies
+            if cookie["name"] in AUTH_COOKIES and cookie["expires"]
+        ]
+        csrf_token = next(
+            (cookie["value"].strip('"') for cookie in cookies if cookie["name"] == "JSESSIONID"),
+            None
+        )
+        session = StoredSession(
+            account=account,
+            cookies=cookies,
+            csrf_token=csrf_token,
+            expires_at=min(expiries) if expiries else now + DEFAULT_SESSION_MAX_AGE,
+            saved_at=now
+        )
+
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(session.__dict__, f)
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, self._path(account))
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return session
+
+    def delete(self, account: str) -> None:
+        """Forget the stored session for an account"""
+        try:
+            os.remove(self._path(account))
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,168 @@
+import asyncio
+import concurrent.futures
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Union
+from config.linkedin_config import DeadlineConfig
+from services.deadline import Deadline, check_deadline, current_deadline, remaining_time
+
+# Seconds shared work may run for a caller without a deadline of its own
+UNBOUNDED_SECONDS = DeadlineConfig().max_timeout
+
+class _Call:
+    """Call running on a thread; async callers await its future, other threads its event"""
+    __slots__ = ("event", "future", "result", "error", "abandoned")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.future = concurrent.futures.Future()
+        self.result = None
+        self.error = None
+        self.abandoned = False
+
+class _Flight:
+    """Shared task of an async call, with a deadline lasting as long as its latest waiter's"""
+    __slots__ = ("task", "deadline", "waiters", "event")
+
+    def __init__(self, task: asyncio.Future, deadline: Deadline):
+        self.task = task
+        self.deadline = deadline
+        self.waiters = 0
+        # Lets threads wait for the task too
+        self.event = threading.Event()
+        task.add_done_callback(lambda _: self.event.set())
+
+    @property
+    def abandoned(self) -> bool:
+        """Whether the task was cancelled or ran out of time, so its outcome is no answer for others"""
+        return self.task.cancelled() or self.deadline.reason is not None
+
+def _expires_at(deadline: Optional[Deadline]) -> float:
+    return time.monotonic() + UNBOUNDED_SECONDS if deadline is None else deadline.expires_at
+
+class SingleFlight:
+    """Coalesces identical concurrent calls so only one of them reaches upstream"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Calls in flight, from threads (do) and event loops (do_async) alike
+        self._flights: Dict[Hashable, Union[_Call, _Flight]] = {}
+        self.leaders = 0
+        self.shared = 0
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """Run func for key, or wait for and share the result of an identical call in flight"""
+        while True:
+            with self._lock:
+                call = self._flights.get(key)
+                if call is None:
+                    call = self._flights[key] = _Call()
+                    self.leaders += 1
+                    leader = True
+                else:
+                    self.shared += 1
+                    leader = False
+
+            if leader:
+                return self._lead(key, call, func)
+
+            # A follower stops waiting at its own deadline; the leader's call carries on for the others
+            while not call.event.wait(remaining_time(None)):
+                check_deadline("waiting for an identical call in flight")
+            if call.abandoned:
+                # The leader ran out of time; a follower with time left makes the call itself
+                continue
+            if isinstance(call, _Flight):
+                return call.task.result()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+    def do_background(self, key: Hashable, func: Callable[[], Any]) -> bool:
+        """Run func for key unless an identical call is already in flight; callers arriving meanwhile share it"""
+        with self._lock:
+            if key in self._flights:
+                return False
+            call = self._flights[key] = _Call()
+            self.leaders += 1
+        self._lead(key, call, func)
+        return True
+
+    def _lead(self, key: Hashable, call: _Call, func: Callable[[], Any]) -> Any:
+        deadline = current_deadline.get()
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            # What a call cut short by its own deadline got says nothing about what the others would get
+            call.abandoned = deadline is not None and (deadline.expired or deadline.reason is not None)
+            with self._lock:
+                del self._flights[key]
+            call.event.set()
+            call.future.set_result(None)
+
+    async def do_async(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Async counterpart of do; waiters await the shared task without holding an executor slot"""
+        waiter = current_deadline.get()
+        expires_at = _expires_at(waiter)
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is None:
+                deadline = Deadline(max(0.0, expires_at - time.monotonic()))
+                flight = self._flights[key] = _Flight(asyncio.ensure_future(self._run_shared(deadline, func)), deadline)
+                self.leaders += 1
+                flight.task.add_done_callback(lambda done: self._forget(key, flight))
+            else:
+                if isinstance(flight, _Flight):
+                    # The shared work keeps going for as long as any waiter still wants it
+                    flight.deadline.extend(expires_at)
+                self.shared += 1
+
+        if isinstance(flight, _Call):
+            # A thread, such as a background refresh, is making the call; wait without taking an executor slot
+            await asyncio.shield(asyncio.wrap_future(flight.future))
+            if flight.abandoned:
+                return await self.do_async(key, func)
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        flight.waiters += 1
+        try:
+            # Shield so one cancelled caller does not cancel the call the others share
+            result = await asyncio.shield(flight.task)
+            if waiter is not None and flight.deadline.reason:
+                # The shared work had at least this waiter's time, so it timed out for this waiter too
+                waiter.reason = waiter.reason or flight.deadline.reason
+            return result
+        finally:
+            flight.waiters -= 1
+            if not flight.waiters and not flight.task.done():
+                # Every waiter gave up; stop the shared work, and let a new caller start afresh
+                self._forget(key, flight)
+                flight.deadline.cancel()
+                flight.task.cancel()
+
+    def _forget(self, key: Hashable, flight: _Flight) -> None:
+        with self._lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+
+    @staticmethod
+    async def _run_shared(deadline: Deadline, func: Callable[[], Awaitable[Any]]) -> Any:
+        # The task runs in its own copy of the context, under the flight's deadline rather than its first caller's
+        current_deadline.set(deadline)
+        return await func()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "leaders": self.leaders,
+            "shared": self.shared,
+            "in_flight": len(self._flights)
+        }
+
+# Coalesces upstream fetches of all services
+upstream_flight = SingleFlight()
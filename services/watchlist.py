@@ -0,0 +1,230 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional, Set
+from config.linkedin_config import WatchlistConfig, logger
+from services.executor import run_blocking
+from services.jobs_service import JobsService
+from services.posts_service import PostsService
+from services.rate_limiter import TokenBucket
+from services.records import compact_records
+
+# High-water marks of watched profiles are kept apart from those of sync_profile_posts,
+# so the poller never swallows posts an agent has not synced yet
+MARK_PREFIX = "watchlist:"
+
+@dataclass
+class WatchedItem:
+    """A profile feed or job search refreshed in the background"""
+    item_id: str
+    kind: str
+    params: Dict[str, Any]
+    interval: float
+    next_due: float = 0.0
+    last_refreshed: Optional[float] = None
+    # Moving average of how often a refresh finds something new
+    change_rate: float = 0.5
+    refreshes: int = 0
+    changes: int = 0
+    errors: int = 0
+    last_error: Optional[str] = None
+    in_flight: bool = False
+    seen_ids: Set[str] = field(default_factory=set)
+    updates: Deque[Dict[str, Any]] = field(default_factory=deque)
+
+    def priority(self, now: float) -> float:
+        """Staleness relative to the refresh interval, weighted by change frequency"""
+        if self.last_refreshed is None:
+            return float("inf")
+        return (now - self.last_refreshed) / self.interval * (1 + self.change_rate)
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "item_id": self.item_id,
+            "kind": self.kind,
+            "params": self.params,
+            "interval_seconds": round(self.interval, 1),
+            "last_refreshed": datetime.fromtimestamp(self.last_refreshed).isoformat() if self.last_refreshed else None,
+            "next_refresh_in_seconds": round(max(0.0, self.next_due - time.time()), 1),
+            "change_rate": round(self.change_rate, 3),
+            "refreshes": self.refreshes,
+            "changes": self.changes,
+            "errors": self.errors,
+            "last_error": self.last_error
+        }
+
+class Watchlist:
+    """Scheduler refreshing watched items concurrently within a global refresh budget"""
+
+    def __init__(self, config: WatchlistConfig = None):
+        self.config = config or WatchlistConfig()
+        self.client = None
+        self._budget = TokenBucket(*self.config.budget)
+        self._items: Dict[str, WatchedItem] = {}
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._refreshes: Set[asyncio.Task] = set()
+
+    def _clamp(self, interval: Optional[float]) -> float:
+        return min(self.config.max_interval, max(self.config.min_interval, interval or self.config.min_interval))
+
+    def _watch(self, item_id: str, kind: str, params: Dict[str, Any], interval: Optional[float]) -> WatchedItem:
+        with self._lock:
+            item = self._items.get(item_id)
+            if item is None:
+                item = WatchedItem(item_id, kind, params, self._clamp(interval))
+                self._items[item_id] = item
+            elif interval:
+                item.interval = self._clamp(interval)
+                item.next_due = min(item.next_due, time.time() + item.interval)
+            return item
+
+    def watch_posts(self, profile_id: str = None, interval: float = None) -> WatchedItem:
+        """Watch a profile's posts; without a profile ID the authenticated user's own"""
+        return self._watch(f"posts:{profile_id or 'me'}", "posts", {"profile_id": profile_id}, interval)
+
+    def watch_jobs(self, keywords: str, location: str = None, limit: int = 25, interval: float = None) -> WatchedItem:
+        """Watch a job search for postings not seen in earlier refreshes"""
+        item_id = f"jobs:{keywords.strip().lower()}@{(location or '').strip().lower()}"
+        params = {"keywords": keywords, "location": location, "limit": limit}
+        return self._watch(item_id, "jobs", params, interval)
+
+    def unwatch(self, item_id: str) -> bool:
+        with self._lock:
+            return self._items.pop(item_id, None) is not None
+
+    def items(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [item.summary() for item in self._items.values()]
+
+    def updates(self, since: float = None, item_id: str = None) -> List[Dict[str, Any]]:
+        """Changes found by earlier refreshes, newest first"""
+        with self._lock:
+            items = [self._items[item_id]] if item_id in self._items else [] if item_id else list(self._items.values())
+            found = [
+                update for item in items for update in item.updates
+                if since is None or update["detected_at_ts"] >= since
+            ]
+        return sorted(found, key=lambda update: update["detected_at_ts"], reverse=True)
+
+    def due(self, now: float) -> List[WatchedItem]:
+        """Items due for a refresh, most urgent first"""
+        with self._lock:
+            due = [item for item in self._items.values() if not item.in_flight and item.next_due <= now]
+        return sorted(due, key=lambda item: item.priority(now), reverse=True)
+
+    def refresh(self, item: WatchedItem) -> bool:
+        """Refresh one item on the calling thread; returns whether it changed"""
+        if item.kind == "posts":
+            result = PostsService.sync_posts(
+                self.client,
+                item.params["profile_id"],
+                mark_key=MARK_PREFIX + item.item_id
+            )
+            first = result.get("first_sync", False)
+            found = {"posts": result.get("new_posts") or []}
+        else:
+            result = JobsService.search_jobs(
+                self.client,
+                item.params["keywords"],
+                item.params["location"],
+                item.params["limit"]
+            )
+            jobs = result.get("jobs") or []
+            first = item.last_refreshed is None
+            found = {"jobs": [job for job in jobs if job.job_id not in item.seen_ids]}
+
+        now = time.time()
+        with self._lock:
+            item.in_flight = False
+            item.refreshes += 1
+            if not result.get("success"):
+                # Back off failing items without touching their learned interval
+                item.errors += 1
+                item.last_error = result.get("error")
+                item.next_due = now + min(self.config.max_interval, item.interval * 2 ** min(item.errors, 6))
+                return False
+
+            if item.kind == "jobs":
+                item.seen_ids.update(filter(None, (job.job_id for job in jobs)))
+            # The first refresh only sets the baseline that later changes are measured against
+            changed = not first and any(found.values())
+            if changed:
+                item.changes += 1
+                item.updates.appendleft({
+                    "item_id": item.item_id,
+                    "kind": item.kind,
+                    "params": item.params,
+                    **compact_records(found),
+                    "detected_at": datetime.fromtimestamp(now).isoformat(),
+                    "detected_at_ts": now
+                })
+                while len(item.updates) > self.config.max_updates:
+                    item.updates.pop()
+
+            item.errors = 0
+            item.last_error = None
+            item.last_refreshed = now
+            item.change_rate = 0.7 * item.change_rate + 0.3 * (1.0 if changed else 0.0)
+            item.interval = self._clamp(item.interval / 2 if changed else item.interval * 1.5)
+            item.next_due = now + item.interval
+            return changed
+
+    async def _refresh_async(self, item: WatchedItem) -> None:
+        try:
+            await run_blocking(self.refresh, item)
+        except Exception as e:
+            logger.error(f"Error refreshing watchlist item {item.item_id}: {str(e)}")
+            with self._lock:
+                item.in_flight = False
+                item.errors += 1
+                item.last_error = str(e)
+                item.next_due = time.time() + item.interval
+
+    async def run_once(self) -> int:
+        """Start refreshes for due items while concurrency and budget allow"""
+        if not self.client or not self.client.authenticated:
+            return 0
+
+        started = 0
+        for item in self.due(time.time()):
+            if len(self._refreshes) >= self.config.max_concurrency or self._budget.try_acquire() > 0:
+                break
+            with self._lock:
+                item.in_flight = True
+            task = asyncio.create_task(self._refresh_async(item))
+            self._refreshes.add(task)
+            task.add_done_callback(self._refreshes.discard)
+            started += 1
+        return started
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error(f"Watchlist scheduling pass failed: {str(e)}")
+            await asyncio.sleep(self.config.tick)
+
+    def start(self, client: Any) -> None:
+        """Refresh watched items with this client, starting the poller on the running loop if needed"""
+        self.client = client
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        for task in list(self._refreshes):
+            task.cancel()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+# Watchlist shared by all tools
+watchlist = Watchlist()
@@ -0,0 +1,85 @@
+import time
+from typing import Dict, Any
+from datetime import datetime
+from config.linkedin_config import logger
+from services.watchlist import watchlist
+
+class WatchlistService:
+    @staticmethod
+    def watch_posts(linkedin_client: Any, profile_id: str = None, interval_minutes: float = None) -> Dict[str, Any]:
+        """Add a profile's posts to the watchlist and make sure the poller is running"""
+        if not linkedin_client.authenticated:
+            raise Exception("Not authenticated with LinkedIn")
+        
+        try:
+            item = watchlist.watch_posts(profile_id, interval_minutes * 60 if interval_minutes else None)
+            watchlist.start(linkedin_client)
+            return {
+                "success": True,
+                "item": item.summary(),
+                "watched_items": len(watchlist.items())
+            }
+        except Exception as e:
+            logger.error(f"Error watching posts: {str(e)}")
+            return {
+                "success": False,
+                "error": str(e)
+            }
+    
+    @staticmethod
+    def watch_jobs(linkedin_client: Any, keywords: str, location: str = None, limit: int = 25,
+                   interval_minutes: float = None) -> Dict[str, Any]:
+        """Add a job search to the watchlist and make sure the poller is running"""
+        if not linkedin_client.authenticated:
+            raise Exception("Not authenticated with LinkedIn")
+        
+        try:
+            item = watchlist.watch_jobs(keywords, location, limit, interval_minutes * 60 if interval_minutes else None)
+            watchlist.start(linkedin_client)
+            return {
+                "success": True,
+                "item": item.summary(),
+                "watched_items": len(watchlist.items())
+            }
+        except Exception as e:
+            logger.error(f"Error watching job search: {str(e)}")
+            return {
+                "success": False,
+                "error": str(e)
+            }
+    
+    @staticmethod
+    def unwatch(item_id: str) -> Dict[str, Any]:
+        """Remove an item from the watchlist"""
+        if not watchlist.unwatch(item_id):
+            return {
+                "success": False,
+                "error": f"Item {item_id} is not being watched"
+            }
+        
+        return {
+            "success": True,
+            "watched_items": len(watchlist.items())
+        }
+    
+    @staticmethod
+    def get_updates(since_minutes: float = None, item_id: str = None) -> Dict[str, Any]:
+        """Read changes the poller already found, without calling LinkedIn"""
+        try:
+            since = time.time() - since_minutes * 60 if since_minutes else None
+            updates = watchlist.updates(since, item_id)
+            return {
+                "success": True,
+                "updates": updates,
+                "count": len(updates),
+                "items": watchlist.items(),
+                "poller_running": watchlist.running,
+                "source": "watchlist",
+                "retrieved_at": datetime.now().isoformat()
+            }
+        except Exception as e:
+            logger.error(f"Error reading watchlist updates: {str(e)}")
+            return {
+                "success": False,
+                "error": str(e)
+            }
@@ -0,0 +1,306 @@
+import asyncio
+import functools
+import itertools
+import multiprocessing
+import os
+import signal
+import threading
+import time
+import zlib
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from config.linkedin_config import WorkerConfig, logger
+from services.rate_state import RateStateStore
+
+# Tools whose state lives in one process run on the first worker: the watchlist poller, and the
+# connection graph, whose node IDs and adjacency arrays are held in memory by the process writing them
+HOME_TOOLS = (
+    "watch_profile_posts", "watch_job_search", "unwatch_item", "get_watchlist_updates",
+    "get_linkedin_connections", "get_mutual_connections", "get_network_neighborhood",
+    "find_connection_path", "find_connections_at_company", "get_authentication_status"
+)
+# Tools that change the account pool run on every worker
+BROADCAST_TOOLS = ("authenticate_linkedin", "remove_linkedin_account")
+# Tools answered from the metrics of every worker
+METRICS_TOOL = "get_server_metrics"
+# Arguments that do not change which data a call reads, left out of its routing key
+UNROUTED_ARGS = ("timeout_seconds", "fields", "bypass_cache")
+
+def _worker_main(index: int, conn: Any) -> None:
+    """Entry point of a worker process: run tool calls received over conn until told to stop"""
+    # The supervisor handles Ctrl-C and stops its workers itself
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    asyncio.run(_serve(index, conn))
+
+async def _invoke(func: Callable, kwargs: Dict[str, Any]) -> Any:
+    result = func(**kwargs)
+    if asyncio.iscoroutine(result):
+        result = await result
+    return result
+
+async def _serve(index: int, conn: Any) -> None:
+    from services.app import app
+    from services.serialization import dumps
+    from tools.registry import load_tool
+
+    loop = asyncio.get_running_loop()
+    stopped = loop.create_future()
+    tasks: Dict[int, asyncio.Task] = {}
+
+    async def run_call(call_id: int, name: str, kwargs: Dict[str, Any]) -> None:
+        try:
+            reply = (call_id, "ok", dumps(await _invoke(load_tool(name), kwargs)))
+        except asyncio.CancelledError:
+            reply = (call_id, "cancelled", None)
+        except Exception as e:
+            logger.error(f"Worker {index} failed running {name}: {str(e)}")
+            reply = (call_id, "error", f"{type(e).__name__}: {str(e)}")
+        finally:
+            tasks.pop(call_id, None)
+        try:
+            conn.send(reply)
+        except OSError:
+            # The supervisor exited while the call ran
+            pass
+
+    def on_message() -> None:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            # The supervisor is gone
+            message = ("stop",)
+        if message[0] == "call":
+            _, call_id, name, kwargs = message
+            tasks[call_id] = loop.create_task(run_call(call_id, name, kwargs))
+        elif message[0] == "cancel":
+            task = tasks.get(message[1])
+            if task is not None:
+                task.cancel()
+        elif not stopped.done():
+            stopped.set_result(None)
+
+    loop.add_reader(conn.fileno(), on_message)
+    logger.info(f"Worker {index} ready (pid {os.getpid()})")
+    try:
+        await stopped
+    finally:
+        loop.remove_reader(conn.fileno())
+        for task in list(tasks.values()):
+            task.cancel()
+        app.shutdown()
+
+def _resolve(future: asyncio.Future, reply: Tuple[str, Any]) -> None:
+    if not future.done():
+        future.set_result(reply)
+
+class _Worker:
+    """Supervisor's handle on one worker process"""
+
+    def __init__(self, index: int, process: Any, conn: Any):
+        self.index = index
+        self.process = process
+        self.conn = conn
+        self.alive = True
+        self._send_lock = threading.Lock()
+
+    def send(self, message: Tuple) -> None:
+        with self._send_lock:
+            self.conn.send(message)
+
+class WorkerPool:
+    """Serves every tool from one MCP endpoint, running the calls in a pool of worker processes"""
+
+    def __init__(self, config: WorkerConfig = None):
+        self.config = config or WorkerConfig()
+        self._context = multiprocessing.get_context("spawn")
+        self._rate_state = None
+        self._workers: List[_Worker] = []
+        self._calls: Dict[int, Tuple[int, asyncio.Future]] = {}
+        self._ids = itertools.count()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Accounts added through authenticate_linkedin, replayed into restarted workers
+        self._credentials: Dict[str, Dict[str, Any]] = {}
+        self._stopping = False
+
+    @property
+    def size(self) -> int:
+        return max(1, self.config.workers)
+
+    def start(self) -> None:
+        # Workers inherit the environment, so every one of them joins the shared rate budget
+        os.environ.setdefault("LINKEDIN_MCP_RATE_STATE", self.config.rate_state)
+        self._rate_state = RateStateStore(os.environ["LINKEDIN_MCP_RATE_STATE"])
+        self._workers = [self._spawn(index) for index in range(self.size)]
+
+    def _spawn(self, index: int) -> _Worker:
+        conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main, args=(index, child_conn),
+            name=f"linkedin-mcp-worker-{index}", daemon=True
+        )
+        process.start()
+        child_conn.close()
+        worker = _Worker(index, process, conn)
+        threading.Thread(target=self._read, args=(worker,), name=f"{process.name}-reader", daemon=True).start()
+        return worker
+
+    def _read(self, worker: _Worker) -> None:
+        """Hand the worker's replies to the waiting calls until it exits"""
+        while True:
+            try:
+                call_id, status, payload = worker.conn.recv()
+            except (EOFError, OSError):
+                break
+            entry = self._calls.get(call_id)
+            if entry is not None:
+                self._deliver(entry[1], (status, payload))
+        worker.alive = False
+        worker.process.join(timeout=1.0)
+        # In-flight slots of calls the worker never finished would otherwise hold the account until their lease ends
+        freed = self._rate_state.release_process(worker.process.pid)
+        if freed:
+            logger.info(f"Freed {freed} in-flight slots of worker {worker.index}")
+        for call_id, (index, future) in list(self._calls.items()):
+            if index == worker.index:
+                self._deliver(future, ("error", f"Worker {worker.index} exited"))
+        if not self._stopping:
+            logger.warning(f"Worker {worker.index} exited with code {worker.process.exitcode}; restarting")
+            time.sleep(self.config.restart_delay)
+            self._restart(worker.index)
+
+    @staticmethod
+    def _deliver(future: asyncio.Future, reply: Tuple[str, Any]) -> None:
+        # Calls come from the MCP server's loop, and from the metrics endpoint's own loops
+        try:
+            future.get_loop().call_soon_threadsafe(_resolve, future, reply)
+        except RuntimeError:
+            # The caller's loop already closed
+            pass
+
+    def _restart(self, index: int) -> None:
+        worker = self._workers[index] = self._spawn(index)
+        if self._loop is not None:
+            for kwargs in list(self._credentials.values()):
+                asyncio.run_coroutine_threadsafe(self._call(worker, "authenticate_linkedin", kwargs), self._loop)
+
+    def _route(self, name: str, kwargs: Dict[str, Any]) -> _Worker:
+        """Home worker for stateful tools, otherwise the worker owning the call's key"""
+        if name in HOME_TOOLS:
+            start = 0
+        else:
+            # Routed by what the call reads rather than by account: every worker holds every account,
+            # whose token buckets, backoff and in-flight slots all workers share through the rate
+            # state, so one account's calls use every core. The same profile, job or search always
+            # lands on the same worker, whose memory cache and in-flight call deduplication then
+            # serve its repeats
+            key = repr(sorted((k, v) for k, v in kwargs.items() if k not in UNROUTED_ARGS))
+            start = zlib.crc32(key.encode()) % len(self._workers)
+        for offset in range(len(self._workers)):
+            worker = self._workers[(start + offset) % len(self._workers)]
+            if worker.alive:
+                return worker
+        return self._workers[start]
+
+    async def _call(self, worker: _Worker, name: str, kwargs: Dict[str, Any]) -> Any:
+        from services.serialization import EncodedResult
+
+        if not worker.alive:
+            return {"success": False, "error": f"Worker {worker.index} is restarting"}
+        call_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._calls[call_id] = (worker.index, future)
+        try:
+            worker.send(("call", call_id, name, kwargs))
+            status, payload = await future
+        except asyncio.CancelledError:
+            # The client gave up; cancelling the worker's task also cancels the call's deadline
+            try:
+                worker.send(("cancel", call_id))
+            except OSError:
+                pass
+            raise
+        except OSError:
+            return {"success": False, "error": f"Worker {worker.index} exited"}
+        finally:
+            self._calls.pop(call_id, None)
+        if status == "ok":
+            return EncodedResult.from_bytes(payload)
+        return {"success": False, "error": payload or f"{name} was cancelled"}
+
+    async def _broadcast(self, name: str, kwargs: Dict[str, Any]) -> Any:
+        """Run an account change on the home worker, then on the others"""
+        # The home worker logs in and stores the session; the others restore it instead of logging in again
+        result = await self._call(self._workers[0], name, kwargs)
+        if not result.get("success"):
+            return result
+        others = await asyncio.gather(*(self._call(worker, name, kwargs) for worker in self._workers[1:]))
+        email = kwargs["email"].strip().lower()
+        if name == "authenticate_linkedin":
+            self._credentials[email] = dict(kwargs)
+        else:
+            self._credentials.pop(email, None)
+        return {**result, "workers": 1 + sum(1 for other in others if other.get("success"))}
+
+    async def _metrics(self) -> Dict[str, Any]:
+        """Metrics of every live worker, each sample labelled with the worker it came from"""
+        from services.metrics import merge_prometheus
+
+        workers = [worker for worker in self._workers if worker.alive]
+        results = await asyncio.gather(*(self._call(worker, METRICS_TOOL, {}) for worker in workers))
+        texts = {
+            str(worker.index): result["metrics"]
+            for worker, result in zip(workers, results) if result.get("success")
+        }
+        return {
+            "success": True,
+            "format": "prometheus",
+            "metrics": merge_prometheus(texts, "worker"),
+            "workers": len(texts)
+        }
+
+    def render_metrics(self) -> str:
+        """Merged metrics of the workers, for the metrics endpoint's request threads"""
+        return asyncio.run(self._metrics())["metrics"]
+
+    async def call(self, name: str, kwargs: Dict[str, Any]) -> Any:
+        """Run a tool call on the worker it belongs to"""
+        self._loop = asyncio.get_running_loop()
+        if name in BROADCAST_TOOLS:
+            return await self._broadcast(name, kwargs)
+        if name == METRICS_TOOL:
+            return await self._metrics()
+        return await self._call(self._route(name, kwargs), name, kwargs)
+
+    def proxy(self, spec: Any) -> Callable:
+        """Stand-in for a tool with the tool's signature and docstring, forwarding calls to the workers"""
+        from tools.registry import load_tool
+
+        @functools.wraps(load_tool(spec.name))
+        async def forward(**kwargs: Any) -> Any:
+            return await self.call(spec.name, kwargs)
+
+        return forward
+
+    def stop(self) -> None:
+        self._stopping = True
+        for worker in self._workers:
+            try:
+                worker.send(("stop",))
+            except OSError:
+                pass
+        for worker in self._workers:
+            worker.process.join(timeout=5.0)
+            if worker.process.is_alive():
+                worker.process.terminate()
+            worker.conn.close()
+
+    def run(self) -> None:
+        """Start the workers and serve the tools over HTTP until interrupted"""
+        from services.app import app
+
+        self.start()
+        logger.info(f"Serving LinkedIn tools from {self.size} workers on {self.config.host}:{self.config.port}")
+        try:
+            server = app.create_server(tool_factory=self.proxy)
+            server.run(transport=self.config.transport, host=self.config.host, port=self.config.port)
+        finally:
+            self.stop()
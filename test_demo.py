@@ -3,7 +3,6 @@
 Interactive test interface for LinkedIn MCP Server
 """
 
-import json
 import sys
 import os
 import getpass
@@ -21,6 +20,7 @@ from linkedin_demo import (
     get_linkedin_connections,
     get_authentication_status,
 )
+from services.serialization import dumps
 
 def print_result(data, title="Result"):
     """Pretty print results with all data"""
@@ -43,29 +43,29 @@ def print_result(data, title="Result"):
             # Print all data based on type
             if 'profile' in data:
                 print("\nProfile Data:")
-                print(json.dumps(data['profile'], indent=2, default=str))
+                print(dumps(data['profile'], indent=True).decode())
             
             if 'posts' in data:
                 print("\nPosts Data:")
-                print(json.dumps(data['posts'], indent=2, default=str))
+                print(dumps(data['posts'], indent=True).decode())
             
             if 'jobs' in data:
                 print("\nJobs Data:")
-                print(json.dumps(data['jobs'], indent=2, default=str))
+                print(dumps(data['jobs'], indent=True).decode())
                 if 'search_params' in data:
                     print(f"\nSearch Parameters: {data['search_params']}")
             
             if 'job' in data:
                 print("\nJob Details:")
-                print(json.dumps(data['job'], indent=2, default=str))
+                print(dumps(data['job'], indent=True).decode())
             
             if 'people' in data:
                 print("\nPeople Data:")
-                print(json.dumps(data['people'], indent=2, default=str))
+                print(dumps(data['people'], indent=True).decode())
             
             if 'connections' in data:
                 print("\nConnections Data:")
-                print(json.dumps(data['connections'], indent=2, default=str))
+                print(dumps(data['connections'], indent=True).decode())
                 
         else:
             print("Status: FAILED")
@@ -75,7 +75,7 @@ def print_result(data, title="Result"):
                 print(f"Error: {data['error']}")
     else:
         print("Raw Data:")
-        print(json.dumps(data, indent=2, default=str))
+        print(dumps(data, indent=True).decode())
     
     print(f"{'='*60}\n")
 
@@ -0,0 +1,149 @@
+import os
+import threading
+import time
+
+import pytest
+
+from config.linkedin_config import PoolConfig
+from services.client_pool import LinkedInClientPool
+from services.deadline import Deadline, current_deadline
+from services.rate_limiter import LinkedInThrottledError
+from services.rate_state import RateStateStore
+
+class FakeRateLimiter:
+    waiting = 0
+
+class FakeClient:
+    """Account whose calls return its account ID, or raise the next queued error"""
+
+    def __init__(self, account_id, errors=()):
+        self.account_id = account_id
+        self.authenticated = True
+        self.rate_limiter = FakeRateLimiter()
+        self.errors = list(errors)
+        self.calls = 0
+
+    def call(self, method, *args, **kwargs):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return self.account_id
+
+    def status(self):
+        return {"account_id": self.account_id, "authenticated": self.authenticated}
+
+def make_pool(*clients, slots=None, **config):
+    pool = LinkedInClientPool(PoolConfig(**config), slots=slots)
+    for client in clients:
+        pool.add(client)
+    return pool
+
+def quarantined(pool):
+    return {account["account_id"] for account in pool.status()["accounts"] if account["quarantined_seconds"]}
+
+def test_local_queue_timeout_does_not_quarantine():
+    timeout = LinkedInThrottledError("Rate limit queue timeout for get_profile")
+    pool = make_pool(FakeClient("a", [timeout]), FakeClient("b"))
+
+    with pytest.raises(LinkedInThrottledError):
+        pool.call("get_profile", "someone")
+    assert quarantined(pool) == set()
+    assert pool.call("get_profile", "someone") in ("a", "b")
+
+@pytest.mark.parametrize("status_code", [429, 999])
+def test_throttled_account_is_quarantined_and_call_fails_over(status_code):
+    throttled = FakeClient("a", [LinkedInThrottledError("Too many requests", status_code)])
+    pool = make_pool(throttled, FakeClient("b"))
+
+    assert pool.call("get_profile", "someone") == "b"
+    assert quarantined(pool) == {"a"}
+    # Later calls skip the quarantined account
+    assert pool.call("get_profile", "someone else") == "b"
+    assert throttled.calls == 1
+
+def test_challenged_account_is_quarantined():
+    from linkedin_api.client import ChallengeException
+
+    pool = make_pool(FakeClient("a", [ChallengeException("CHALLENGE")]), FakeClient("b"))
+
+    assert pool.call("get_profile", "someone") == "b"
+    assert quarantined(pool) == {"a"}
+
+def test_account_scoped_call_does_not_fail_over():
+    pool = make_pool(FakeClient("a", [LinkedInThrottledError("Too many requests", 429)]), FakeClient("b"))
+
+    with pytest.raises(LinkedInThrottledError):
+        pool.call("get_profile_connections", "someone")
+    assert quarantined(pool) == {"a"}
+
+def test_cancelled_call_frees_its_slot():
+    started = threading.Event()
+    finish = threading.Event()
+
+    class BlockingClient(FakeClient):
+        def call(self, method, *args, **kwargs):
+            started.set()
+            finish.wait(2)
+            return self.account_id
+
+    pool = make_pool(BlockingClient("a"), max_in_flight_per_account=1, acquire_timeout=0.5)
+    deadline = Deadline(5)
+
+    def cancelled_call():
+        current_deadline.set(deadline)
+        pool.call("get_profile", "someone")
+
+    thread = threading.Thread(target=cancelled_call)
+    thread.start()
+    started.wait(1)
+    assert pool.status()["accounts"][0]["in_flight"] == 1
+
+    deadline.cancel()
+    # The abandoned request is still running, but no longer holds the account's only slot
+    assert pool.status()["accounts"][0]["in_flight"] == 0
+    finish.set()
+    thread.join(2)
+    assert pool.status()["accounts"][0]["in_flight"] == 0
+
+def test_processes_sharing_rate_state_share_the_in_flight_limit(tmp_path):
+    store = RateStateStore(str(tmp_path / "rate_state.db"))
+    started = threading.Event()
+    finish = threading.Event()
+
+    class BlockingClient(FakeClient):
+        def call(self, method, *args, **kwargs):
+            started.set()
+            finish.wait(2)
+            return self.account_id
+
+    # Two pools stand in for two worker processes holding the same account
+    busy = make_pool(BlockingClient("a"), slots=store, max_in_flight_per_account=1)
+    other = make_pool(FakeClient("a"), slots=store, max_in_flight_per_account=1, acquire_timeout=0.2)
+    thread = threading.Thread(target=busy.call, args=("get_profile", "someone"))
+    thread.start()
+    started.wait(1)
+
+    with pytest.raises(LinkedInThrottledError):
+        other.call("get_profile", "someone else")
+    assert other.status()["accounts"][0]["in_flight_all_processes"] == 1
+
+    finish.set()
+    thread.join(2)
+    assert other.call("get_profile", "someone else") == "a"
+    assert store.slots_held("a") == 0
+
+def test_slots_of_exited_process_are_freed(tmp_path):
+    store = RateStateStore(str(tmp_path / "rate_state.db"))
+
+    assert store.hold_slot("a", 1, 60) is not None
+    assert store.hold_slot("a", 1, 60) is None
+    assert store.release_process(os.getpid()) == 1
+    assert store.hold_slot("a", 1, 60) is not None
+
+def test_unreleased_slot_lapses_after_its_lease(tmp_path):
+    store = RateStateStore(str(tmp_path / "rate_state.db"))
+
+    assert store.hold_slot("a", 1, 0.05) is not None
+    assert store.hold_slot("a", 1, 0.05) is None
+    time.sleep(0.1)
+    assert store.hold_slot("a", 1, 0.05) is not None
@@ -0,0 +1,64 @@
+import pytest
+
+from services import posts_service
+from services.post_sync import PostSyncStore
+from services.posts_service import PostsService
+
+class FeedClient:
+    """Account whose feed is the given activity IDs, newest first"""
+
+    account_id = "test@example.com"
+    authenticated = True
+
+    def __init__(self, activity_ids):
+        self.activity_ids = list(activity_ids)
+        self.counts = []
+
+    def call(self, method, *args, post_count=10):
+        self.counts.append(post_count)
+        return [
+            {"updateMetadata": {"urn": f"urn:li:activity:{activity_id}"}}
+            for activity_id in self.activity_ids[:post_count]
+        ]
+
+@pytest.fixture(autouse=True)
+def store(tmp_path, monkeypatch):
+    store = PostSyncStore(str(tmp_path / "post_sync.db"))
+    monkeypatch.setattr(posts_service, "post_sync_store", store)
+    yield store
+    store.close()
+
+def new_urns(result):
+    assert result["success"], result
+    return [post.urn for post in result["new_posts"]]
+
+def test_posts_without_timestamps_are_new_until_the_mark():
+    # Small activity IDs carry no usable timestamp
+    client = FeedClient([3, 2, 1])
+    PostsService.sync_posts(client, "someone")
+    client.activity_ids = [9, 8, 7, 6, 5, 4, 3, 2, 1]
+    client.counts.clear()
+
+    result = PostsService.sync_posts(client, "someone", initial_window=2)
+    assert new_urns(result) == [f"urn:li:activity:{n}" for n in (9, 8, 7, 6, 5, 4)]
+    assert result["unchanged_count"] == 2
+    # The window kept growing until it reached the marked post
+    assert client.counts == [2, 4, 8]
+    assert result["high_water_mark"]["newest_urn"] == "urn:li:activity:9"
+
+def test_posts_above_the_mark_are_new_even_if_it_looks_newer():
+    older, newer = 1700000000000 << 22, 1710000000000 << 22
+    client = FeedClient([newer])
+    PostsService.sync_posts(client, "someone")
+    client.activity_ids = [older + 2, older + 1, newer]
+
+    result = PostsService.sync_posts(client, "someone")
+    assert new_urns(result) == [f"urn:li:activity:{older + 2}", f"urn:li:activity:{older + 1}"]
+
+def test_nothing_new_when_feed_starts_at_the_mark():
+    client = FeedClient([3, 2, 1])
+    PostsService.sync_posts(client, "someone")
+
+    result = PostsService.sync_posts(client, "someone")
+    assert new_urns(result) == []
+    assert result["upstream_requests"] == 1
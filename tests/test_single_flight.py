@@ -0,0 +1,249 @@
+import asyncio
+import threading
+import time
+
+from config.linkedin_config import CacheConfig
+from services.cache import ResponseCache
+from services.deadline import Deadline, DeadlineExceeded, current_deadline, sleep_within_deadline
+from services.executor import run_blocking
+from services.single_flight import SingleFlight, upstream_flight
+
+def run_with_deadline(seconds, func):
+    """Run coroutine function func as a caller whose deadline is seconds away"""
+    async def call():
+        current_deadline.set(Deadline(seconds))
+        return await func()
+    return asyncio.ensure_future(call())
+
+def test_cancelled_leader_does_not_fail_followers():
+    flight = SingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.1)
+        return "profile"
+
+    async def main():
+        leader = run_with_deadline(5, lambda: flight.do_async("key", fetch))
+        await asyncio.sleep(0.01)
+        follower = run_with_deadline(5, lambda: flight.do_async("key", fetch))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        assert await follower == "profile"
+        assert leader.cancelled()
+
+    asyncio.run(main())
+    assert len(calls) == 1
+    assert flight.stats() == {"leaders": 1, "shared": 1, "in_flight": 0}
+
+def test_shared_call_runs_until_the_latest_waiter_deadline():
+    flight = SingleFlight()
+
+    async def fetch():
+        # Blocking work checks the deadline it runs under, which is the flight's
+        await asyncio.sleep(0.15)
+        sleep_within_deadline(0, "fetching")
+        return "job"
+
+    async def main():
+        leader = run_with_deadline(0.05, lambda: flight.do_async("key", fetch))
+        follower = run_with_deadline(5, lambda: flight.do_async("key", fetch))
+        assert await follower == "job"
+        # The first caller's short deadline did not cut the call it shares short
+        assert await leader == "job"
+
+    asyncio.run(main())
+
+def test_shared_call_is_cancelled_once_every_waiter_gives_up():
+    flight = SingleFlight()
+    started = []
+    cancelled = []
+
+    async def fetch():
+        started.append(current_deadline.get())
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append(1)
+            raise
+        return "never"
+
+    async def main():
+        first = run_with_deadline(5, lambda: flight.do_async("key", fetch))
+        second = run_with_deadline(5, lambda: flight.do_async("key", fetch))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        second.cancel()
+        await asyncio.gather(first, second, return_exceptions=True)
+        await asyncio.sleep(0)
+        assert flight.stats()["in_flight"] == 0
+
+        async def fresh():
+            return "fresh"
+
+        # A new caller starts its own call rather than joining the abandoned one
+        assert await run_with_deadline(5, lambda: flight.do_async("key", fresh)) == "fresh"
+
+    asyncio.run(main())
+    assert cancelled == [1]
+    assert started[0].cancelled
+
+def test_follower_reruns_call_its_leader_ran_out_of_time_for():
+    flight = SingleFlight()
+    leader_started = threading.Event()
+    results = {}
+
+    def slow_fetch():
+        leader_started.set()
+        sleep_within_deadline(0.5, "fetching")
+        return "leader"
+
+    def lead():
+        current_deadline.set(Deadline(0.05))
+        try:
+            flight.do("key", slow_fetch)
+        except DeadlineExceeded as e:
+            results["leader"] = e
+
+    def follow():
+        current_deadline.set(Deadline(5))
+        results["follower"] = flight.do("key", lambda: "follower")
+
+    leader = threading.Thread(target=lead)
+    leader.start()
+    leader_started.wait(1)
+    follower = threading.Thread(target=follow)
+    follower.start()
+    leader.join(2)
+    follower.join(2)
+
+    assert isinstance(results["leader"], DeadlineExceeded)
+    # What the leader's timeout got says nothing about what the follower would get
+    assert results["follower"] == "follower"
+
+def test_follower_shares_error_of_leader_that_had_time():
+    flight = SingleFlight()
+    leader_started = threading.Event()
+    release = threading.Event()
+    results = {}
+
+    def failing_fetch():
+        leader_started.set()
+        release.wait(1)
+        raise ValueError("upstream failed")
+
+    def call(name, func):
+        current_deadline.set(Deadline(5))
+        try:
+            results[name] = flight.do("key", func)
+        except ValueError as e:
+            results[name] = e
+
+    leader = threading.Thread(target=call, args=("leader", failing_fetch))
+    leader.start()
+    leader_started.wait(1)
+    follower = threading.Thread(target=call, args=("follower", lambda: "follower"))
+    follower.start()
+    time.sleep(0.05)
+    release.set()
+    leader.join(2)
+    follower.join(2)
+
+    assert results["follower"] is results["leader"]
+    assert flight.stats() == {"leaders": 1, "shared": 1, "in_flight": 0}
+
+def test_foreground_call_joins_background_refresh():
+    flight = SingleFlight()
+    refresh_started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def refresh():
+        calls.append("refresh")
+        refresh_started.set()
+        release.wait(1)
+        return "refreshed"
+
+    async def fetch():
+        calls.append("fetch")
+        return "fetched"
+
+    background = threading.Thread(target=flight.do_background, args=("key", refresh))
+    background.start()
+    refresh_started.wait(1)
+
+    async def main():
+        foreground = run_with_deadline(5, lambda: flight.do_async("key", fetch))
+        await asyncio.sleep(0.05)
+        release.set()
+        return await foreground
+
+    assert asyncio.run(main()) == "refreshed"
+    background.join(1)
+    assert calls == ["refresh"]
+    assert flight.stats() == {"leaders": 1, "shared": 1, "in_flight": 0}
+
+def test_background_refresh_leaves_key_in_flight_to_foreground_call():
+    flight = SingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append("fetch")
+        await asyncio.sleep(0.05)
+        return "fetched"
+
+    async def main():
+        foreground = run_with_deadline(5, lambda: flight.do_async("key", fetch))
+        await asyncio.sleep(0.01)
+        ran = await asyncio.to_thread(flight.do_background, "key", lambda: calls.append("refresh"))
+        return ran, await foreground
+
+    assert asyncio.run(main()) == (False, "fetched")
+    assert calls == ["fetch"]
+
+def test_thread_waits_for_async_call_in_flight():
+    flight = SingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append("fetch")
+        await asyncio.sleep(0.05)
+        return "fetched"
+
+    async def main():
+        foreground = run_with_deadline(5, lambda: flight.do_async("key", fetch))
+        await asyncio.sleep(0.01)
+        shared = await asyncio.to_thread(flight.do, "key", lambda: calls.append("sync") or "sync")
+        return shared, await foreground
+
+    assert asyncio.run(main()) == ("fetched", "fetched")
+    assert calls == ["fetch"]
+
+def test_stale_hit_refresh_and_foreground_miss_make_one_upstream_call():
+    cache = ResponseCache(CacheConfig())
+    key = cache.make_key("test@example.com", "get_profile", "stale-and-missed")
+    cache.set(key, {"success": True, "profile": {"name": "old"}}, ttl=0)
+    upstream = []
+    release = threading.Event()
+
+    def fetch():
+        upstream.append(1)
+        release.wait(1)
+        result = {"success": True, "profile": {"name": "new"}}
+        cache.set(key, result)
+        return result
+
+    async def main():
+        stale = cache.get_or_revalidate(key, fetch)
+        assert stale["stale"]
+        # A caller bypassing the cache asks for the same key while the refresh runs
+        while not upstream:
+            await asyncio.sleep(0.005)
+        foreground = run_with_deadline(5, lambda: upstream_flight.do_async(key, lambda: run_blocking(fetch)))
+        await asyncio.sleep(0.05)
+        release.set()
+        return await foreground
+
+    assert asyncio.run(main())["profile"] == {"name": "new"}
+    assert len(upstream) == 1
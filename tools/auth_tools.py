@@ -1,27 +1,31 @@
 from typing import Dict, Any
 from datetime import datetime
-from fastmcp import FastMCP
+from services.metrics import instrument_tool
+from services.app import app
+from tools.registry import tool
 from config.linkedin_config import LinkedInConfig
-from services.linkedin_client import LinkedInMCP
+from services.executor import run_blocking
 
-mcp = FastMCP("LinkedIn MCP Server")
-linkedin_mcp: LinkedInMCP = None
-
-@mcp.tool()
-def authenticate_linkedin(email: str, password: str) -> Dict[str, Any]:
+@tool
+@instrument_tool
+async def authenticate_linkedin(email: str, password: str) -> Dict[str, Any]:
     """
-    Authenticate with LinkedIn using email and password
+    Authenticate with LinkedIn using email and password.
+    Authenticating several accounts adds each one to the pool that serves tool calls.
     """
-    global linkedin_mcp
-    
     try:
+        # linkedin_api and requests are only loaded once someone authenticates
+        from services.linkedin_client import LinkedInMCP
+        
         config = LinkedInConfig(email=email, password=password)
-        linkedin_mcp = LinkedInMCP(config)
+        client = LinkedInMCP(config, **app.client_options)
         
-        if linkedin_mcp.authenticate():
+        if await run_blocking(client.authenticate):
+            app.pool.add(client)
             return {
                 "success": True,
                 "message": "Successfully authenticated with LinkedIn",
+                "accounts": len(app.pool.accounts),
                 "authenticated_at": datetime.now().isoformat()
             }
         else:
@@ -34,3 +38,21 @@ def authenticate_linkedin(email: str, password: str) -> Dict[str, Any]:
             "success": False,
             "message": f"Authentication error: {str(e)}"
         }
+
+@tool
+@instrument_tool
+async def remove_linkedin_account(email: str) -> Dict[str, Any]:
+    """
+    Remove an authenticated LinkedIn account from the pool
+    """
+    if not app.pool.remove(email):
+        return {
+            "success": False,
+            "message": f"Account {email} is not in the pool"
+        }
+    
+    return {
+        "success": True,
+        "message": f"Removed account {email}",
+        "accounts": len(app.pool.accounts)
+    }
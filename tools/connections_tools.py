@@ -1,20 +1,58 @@
 from typing import Dict, Any
-from fastmcp import FastMCP
+from services.deadline import with_deadline
+from services.metrics import instrument_tool
+from services.app import app
+from tools.registry import tool
 from services.connections_service import ConnectionsService
 
-mcp = FastMCP("LinkedIn MCP Server")
-linkedin_mcp = None
-
-@mcp.tool()
-def get_linkedin_connections(urn_id: str = None, limit: int = 50) -> Dict[str, Any]:
+@tool
+@instrument_tool
+@with_deadline
+async def get_linkedin_connections(urn_id: str = None, limit: int = 50, cursor: str = None) -> Dict[str, Any]:
     """
-    Get LinkedIn connections for a profile
+    Get LinkedIn connections for a profile, one page of up to limit connections at a time.
+    Pass the returned next_cursor to fetch the following page; it is null on the last page.
     """
-    global linkedin_mcp
-    if not linkedin_mcp or not linkedin_mcp.authenticated:
+    if not app.authenticated:
         return {
             "success": False,
             "message": "Not authenticated. Please authenticate first."
         }
     
-    return ConnectionsService.get_connections(linkedin_mcp, urn_id, limit)
+    return await ConnectionsService.get_connections_async(app.pool, urn_id, limit, cursor)
+
+@tool
+@instrument_tool
+async def get_mutual_connections(other_urn_id: str, urn_id: str = None) -> Dict[str, Any]:
+    """
+    Get connections shared by two profiles (urn_id defaults to your own profile).
+    Answered from the local connection graph, built from earlier get_linkedin_connections calls.
+    """
+    return await ConnectionsService.query_graph_async(app.pool, "mutual", urn_id, other_urn_id=other_urn_id)
+
+@tool
+@instrument_tool
+async def get_network_neighborhood(urn_id: str = None, depth: int = 2, limit: int = 100) -> Dict[str, Any]:
+    """
+    Get people within depth hops of a profile (defaults to your own), nearest first.
+    Answered from the local connection graph, built from earlier get_linkedin_connections calls.
+    """
+    return await ConnectionsService.query_graph_async(app.pool, "neighborhood", urn_id, depth=depth, limit=limit)
+
+@tool
+@instrument_tool
+async def find_connection_path(target_urn_id: str, urn_id: str = None, max_depth: int = 6) -> Dict[str, Any]:
+    """
+    Find a shortest chain of connections from a profile (defaults to your own) to target_urn_id.
+    Answered from the local connection graph, built from earlier get_linkedin_connections calls.
+    """
+    return await ConnectionsService.query_graph_async(app.pool, "path", urn_id, target_urn_id=target_urn_id, max_depth=max_depth)
+
+@tool
+@instrument_tool
+async def find_connections_at_company(company: str, urn_id: str = None, depth: int = 1, limit: int = 100) -> Dict[str, Any]:
+    """
+    Find people within depth hops of a profile (defaults to your own) whose job title mentions company.
+    Answered from the local connection graph, built from earlier get_linkedin_connections calls.
+    """
+    return await ConnectionsService.query_graph_async(app.pool, "company", urn_id, company=company, depth=depth, limit=limit)
@@ -1,34 +1,66 @@
-from typing import Dict, Any
-from fastmcp import FastMCP
+from typing import Dict, Any, List
+from services.deadline import with_deadline
+from services.metrics import instrument_tool
+from services.app import app
+from tools.registry import tool
 from services.jobs_service import JobsService
 
-mcp = FastMCP("LinkedIn MCP Server")
-linkedin_mcp = None
-
-@mcp.tool()
-def search_linkedin_jobs(keywords: str, location: str = None, limit: int = 25) -> Dict[str, Any]:
+@tool
+@instrument_tool
+@with_deadline
+async def search_linkedin_jobs(keywords: str, location: str = None, limit: int = 25) -> Dict[str, Any]:
     """
     Search for job postings on LinkedIn
     """
-    global linkedin_mcp
-    if not linkedin_mcp or not linkedin_mcp.authenticated:
+    if not app.authenticated:
+        return {
+            "success": False,
+            "message": "Not authenticated. Please authenticate first."
+        }
+    
+    return await JobsService.search_jobs_async(app.pool, keywords, location, limit)
+
+@tool
+@instrument_tool
+def search_cached_jobs(keywords: str = None, location: str = None, company: str = None,
+                       posted_within_days: int = None, remote: bool = None, limit: int = 25) -> Dict[str, Any]:
+    """
+    Search jobs already returned by earlier job searches and job detail lookups.
+    Answers from a local full-text index without contacting LinkedIn, so results only cover jobs seen before.
+    """
+    return JobsService.search_cached_jobs(keywords, location, company, posted_within_days, remote, limit)
+
+@tool
+@instrument_tool
+@with_deadline
+async def get_job_details(job_id: str, bypass_cache: bool = False, fields: List[str] = None) -> Dict[str, Any]:
+    """
+    Get detailed information about a specific job posting.
+    Results are cached briefly and carry age_seconds; a stale one is returned at once and refreshed in the background.
+    Set bypass_cache to force a fresh fetch.
+    Pass fields (dotted paths such as "description.text", or the preset "summary") to slim the response.
+    """
+    if not app.authenticated:
         return {
             "success": False,
             "message": "Not authenticated. Please authenticate first."
         }
     
-    return JobsService.search_jobs(linkedin_mcp, keywords, location, limit)
+    return await JobsService.get_job_details_async(app.pool, job_id, bypass_cache, fields)
 
-@mcp.tool()
-def get_job_details(job_id: str) -> Dict[str, Any]:
+@tool
+@instrument_tool
+@with_deadline
+async def get_job_details_many(job_ids: List[str], bypass_cache: bool = False, fields: List[str] = None) -> Dict[str, Any]:
     """
-    Get detailed information about a specific job posting
+    Get detailed information about several job postings in one call.
+    Duplicate IDs are fetched once; each job ID gets its own success or error entry.
+    Pass fields (dotted paths such as "description.text", or the preset "summary") to slim the response.
     """
-    global linkedin_mcp
-    if not linkedin_mcp or not linkedin_mcp.authenticated:
+    if not app.authenticated:
         return {
             "success": False,
             "message": "Not authenticated. Please authenticate first."
         }
     
-    return JobsService.get_job_details(linkedin_mcp, job_id)
+    return await JobsService.get_job_details_many_async(app.pool, job_ids, bypass_cache, fields)
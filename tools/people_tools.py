@@ -1,20 +1,25 @@
-from typing import Dict, Any
-from fastmcp import FastMCP
+from typing import Dict, Any, List
+from services.deadline import with_deadline
+from services.metrics import instrument_tool
+from services.app import app
+from tools.registry import tool
 from services.people_service import PeopleService
 
-mcp = FastMCP("LinkedIn MCP Server")
-linkedin_mcp = None
-
-@mcp.tool()
-def search_linkedin_people(keywords: str, limit: int = 10) -> Dict[str, Any]:
+@tool
+@instrument_tool
+@with_deadline
+async def search_linkedin_people(keywords: str, limit: int = 10, hydrate: bool = False, fields: List[str] = None) -> Dict[str, Any]:
     """
-    Search for people on LinkedIn
+    Search for people on LinkedIn.
+    Set hydrate to attach each person's full profile, optionally projected to the given profile fields
+    (dotted paths such as "experience[].companyName", or the preset "summary").
     """
-    global linkedin_mcp
-    if not linkedin_mcp or not linkedin_mcp.authenticated:
+    if not app.authenticated:
         return {
             "success": False,
             "message": "Not authenticated. Please authenticate first."
         }
     
-    return PeopleService.search_people(linkedin_mcp, keywords, limit)
+    if hydrate:
+        return await PeopleService.search_people_hydrated_async(app.pool, keywords, limit, fields)
+    return await PeopleService.search_people_async(app.pool, keywords, limit)
@@ -1,21 +1,40 @@
-from typing import Dict, Any
-from fastmcp import FastMCP
+from typing import Dict, Any, List
+from services.deadline import with_deadline
+from services.metrics import instrument_tool
+from services.app import app
+from tools.registry import tool
 from services.posts_service import PostsService
 
-mcp = FastMCP("LinkedIn MCP Server")
-linkedin_mcp = None
-
-@mcp.tool()
-def get_profile_posts(profile_id: str = None, limit: int = 10) -> Dict[str, Any]:
+@tool
+@instrument_tool
+@with_deadline
+async def get_profile_posts(profile_id: str = None, limit: int = 10, bypass_cache: bool = False, fields: List[str] = None) -> Dict[str, Any]:
     """
-    Get posts from a LinkedIn profile
+    Get posts from a LinkedIn profile.
+    Results are cached briefly and carry age_seconds; a stale one is returned at once and refreshed in the background.
+    Set bypass_cache to force a fresh fetch.
+    Pass fields (dotted paths such as "commentary.text.text", or the preset "summary") to slim the response.
     """
-    global linkedin_mcp
-    if not linkedin_mcp or not linkedin_mcp.authenticated:
+    if not app.authenticated:
         return {
             "success": False,
             "message": "Not authenticated. Please authenticate first."
         }
     
-    return PostsService.get_posts(linkedin_mcp, profile_id, limit)
+    return await PostsService.get_posts_async(app.pool, profile_id, limit, bypass_cache, fields)
 
+@tool
+@instrument_tool
+@with_deadline
+async def sync_profile_posts(profile_id: str = None, max_posts: int = 50, fields: List[str] = None) -> Dict[str, Any]:
+    """
+    Get only the posts published since the last sync of this profile.
+    The first sync returns up to max_posts posts; later syncs return the new posts plus a count of unchanged ones.
+    """
+    if not app.authenticated:
+        return {
+            "success": False,
+            "message": "Not authenticated. Please authenticate first."
+        }
+    
+    return await PostsService.sync_posts_async(app.pool, profile_id, max_posts, fields=fields)
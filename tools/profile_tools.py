@@ -1,20 +1,41 @@
-from typing import Dict, Any
-from fastmcp import FastMCP
+from typing import Dict, Any, List
+from services.deadline import with_deadline
+from services.metrics import instrument_tool
+from services.app import app
+from tools.registry import tool
 from services.profile_service import ProfileService
 
-mcp = FastMCP("LinkedIn MCP Server")
-linkedin_mcp = None
+@tool
+@instrument_tool
+@with_deadline
+async def get_profile_info(profile_id: str = None, bypass_cache: bool = False, fields: List[str] = None) -> Dict[str, Any]:
+    """
+    Get LinkedIn profile information.
+    Results are cached briefly and carry age_seconds; a stale one is returned at once and refreshed in the background.
+    Set bypass_cache to force a fresh fetch.
+    Pass fields (dotted paths such as "experience[].companyName", or the preset "summary") to slim the response.
+    """
+    if not app.authenticated:
+        return {
+            "success": False,
+            "message": "Not authenticated. Please authenticate first."
+        }
+    
+    return await ProfileService.get_profile_async(app.pool, profile_id, bypass_cache, fields)
 
-@mcp.tool()
-def get_profile_info(profile_id: str = None) -> Dict[str, Any]:
+@tool
+@instrument_tool
+@with_deadline
+async def get_profiles_many(profile_ids: List[str], fields: List[str] = None, bypass_cache: bool = False) -> Dict[str, Any]:
     """
-    Get LinkedIn profile information
+    Get several LinkedIn profiles in one call.
+    Duplicate IDs are fetched once.
+    Pass fields (dotted paths such as "experience[].companyName", or the preset "summary") to slim the response.
     """
-    global linkedin_mcp
-    if not linkedin_mcp or not linkedin_mcp.authenticated:
+    if not app.authenticated:
         return {
             "success": False,
             "message": "Not authenticated. Please authenticate first."
         }
     
-    return ProfileService.get_profile(linkedin_mcp, profile_id)
+    return await ProfileService.get_profiles_many_async(app.pool, profile_ids, fields, bypass_cache)
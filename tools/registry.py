@@ -0,0 +1,51 @@
+import importlib
+from dataclasses import dataclass
+from typing import Callable, Dict, Tuple
+
+@dataclass(frozen=True)
+class ToolSpec:
+    """Name, module and summary of an MCP tool, known without importing the tool"""
+    name: str
+    module: str
+    summary: str
+
+# Every tool of the server, in the order clients list them
+TOOLS: Tuple[ToolSpec, ...] = (
+    ToolSpec("authenticate_linkedin", "tools.auth_tools", "Authenticate with LinkedIn (adds the account to the pool)"),
+    ToolSpec("remove_linkedin_account", "tools.auth_tools", "Remove an account from the pool"),
+    ToolSpec("get_profile_info", "tools.profile_tools", "Get profile information"),
+    ToolSpec("get_profiles_many", "tools.profile_tools", "Get many profiles concurrently"),
+    ToolSpec("get_profile_posts", "tools.posts_tools", "Retrieve posts from a profile"),
+    ToolSpec("sync_profile_posts", "tools.posts_tools", "Only posts newer than the last sync"),
+    ToolSpec("search_linkedin_jobs", "tools.jobs_tools", "Search for jobs"),
+    ToolSpec("search_cached_jobs", "tools.jobs_tools", "Search previously seen jobs locally"),
+    ToolSpec("get_job_details", "tools.jobs_tools", "Get job details"),
+    ToolSpec("get_job_details_many", "tools.jobs_tools", "Get details for many jobs concurrently"),
+    ToolSpec("search_linkedin_people", "tools.people_tools", "Search for people"),
+    ToolSpec("get_linkedin_connections", "tools.connections_tools", "Retrieve a page of connections"),
+    ToolSpec("get_mutual_connections", "tools.connections_tools", "Shared connections (local graph)"),
+    ToolSpec("get_network_neighborhood", "tools.connections_tools", "k-hop neighborhood (local graph)"),
+    ToolSpec("find_connection_path", "tools.connections_tools", "Shortest connection path (local graph)"),
+    ToolSpec("find_connections_at_company", "tools.connections_tools", "People at a company (local graph)"),
+    ToolSpec("watch_profile_posts", "tools.watchlist_tools", "Poll a profile's posts in the background"),
+    ToolSpec("watch_job_search", "tools.watchlist_tools", "Poll a job search in the background"),
+    ToolSpec("unwatch_item", "tools.watchlist_tools", "Stop polling an item"),
+    ToolSpec("get_watchlist_updates", "tools.watchlist_tools", "New posts and jobs found by the poller"),
+    ToolSpec("get_authentication_status", "tools.status_tools", "Check auth status"),
+    ToolSpec("get_server_metrics", "tools.status_tools", "Prometheus metrics for tools, upstream calls and cache")
+)
+
+_SPECS: Dict[str, ToolSpec] = {spec.name: spec for spec in TOOLS}
+_functions: Dict[str, Callable] = {}
+
+def tool(func: Callable) -> Callable:
+    """Mark a function of a tools module as an MCP tool; it must also be listed in TOOLS"""
+    if func.__name__ not in _SPECS:
+        raise RuntimeError(f"Tool {func.__name__} is missing from tools.registry.TOOLS")
+    _functions[func.__name__] = func
+    return func
+
+def load_tool(name: str) -> Callable:
+    """Import a tool's module on demand and return the tool function"""
+    importlib.import_module(_SPECS[name].module)
+    return _functions[name]
@@ -1,20 +1,20 @@
 from typing import Dict, Any
-from fastmcp import FastMCP
+from services.metrics import instrument_tool, render_prometheus
+from services.app import app
+from tools.registry import tool
 
-mcp = FastMCP("LinkedIn MCP Server")
-linkedin_mcp = None
-
-@mcp.tool()
+@tool
+@instrument_tool
 def get_authentication_status() -> Dict[str, Any]:
     """
     Check current authentication status
     """
-    global linkedin_mcp
-    if linkedin_mcp and linkedin_mcp.authenticated:
+    if app.authenticated:
         return {
             "success": True,
             "authenticated": True,
-            "message": "Successfully authenticated with LinkedIn"
+            "message": "Successfully authenticated with LinkedIn",
+            "accounts": app.pool.status()["accounts"]
         }
     else:
         return {
@@ -22,3 +22,15 @@ def get_authentication_status() -> Dict[str, Any]:
             "authenticated": False,
             "message": "Not authenticated with LinkedIn"
         }
+
+@tool
+@instrument_tool
+def get_server_metrics() -> Dict[str, Any]:
+    """
+    Get per-tool latency, error, upstream and cache metrics in Prometheus text format
+    """
+    return {
+        "success": True,
+        "format": "prometheus",
+        "metrics": render_prometheus()
+    }
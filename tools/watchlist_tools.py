@@ -0,0 +1,52 @@
+from typing import Dict, Any
+from services.metrics import instrument_tool
+from services.app import app
+from tools.registry import tool
+from services.watchlist_service import WatchlistService
+
+@tool
+@instrument_tool
+async def watch_profile_posts(profile_id: str = None, interval_minutes: float = None) -> Dict[str, Any]:
+    """
+    Watch a profile's posts in the background; without profile_id, your own.
+    Refreshes adapt to how often the profile posts; read results with get_watchlist_updates.
+    """
+    if not app.authenticated:
+        return {
+            "success": False,
+            "message": "Not authenticated. Please authenticate first."
+        }
+    
+    return WatchlistService.watch_posts(app.pool, profile_id, interval_minutes)
+
+@tool
+@instrument_tool
+async def watch_job_search(keywords: str, location: str = None, limit: int = 25, interval_minutes: float = None) -> Dict[str, Any]:
+    """
+    Watch a job search in the background for postings not seen before.
+    Read results with get_watchlist_updates.
+    """
+    if not app.authenticated:
+        return {
+            "success": False,
+            "message": "Not authenticated. Please authenticate first."
+        }
+    
+    return WatchlistService.watch_jobs(app.pool, keywords, location, limit, interval_minutes)
+
+@tool
+@instrument_tool
+def unwatch_item(item_id: str) -> Dict[str, Any]:
+    """
+    Stop watching a profile or job search, by the item_id returned when it was added
+    """
+    return WatchlistService.unwatch(item_id)
+
+@tool
+@instrument_tool
+def get_watchlist_updates(since_minutes: float = None, item_id: str = None) -> Dict[str, Any]:
+    """
+    Get new posts and jobs found by the background watchlist, newest first.
+    Answers locally from results the poller already fetched, without contacting LinkedIn.
+    """
+    return WatchlistService.get_updates(since_minutes, item_id)